@@ -239,6 +239,7 @@ TOOL_TASK_MAP = {
     "fetch_url": TaskType.RESEARCH,
     "fetch_multiple_urls": TaskType.RESEARCH,
     "verify_claim": TaskType.RESEARCH,
+    "batch_gemini": TaskType.RESEARCH,
 
     # File operations -> FLASH_LITE
     "read_file": TaskType.AUTOMATION,
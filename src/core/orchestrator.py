@@ -30,6 +30,7 @@ Flow:
     9. Displays final response, saves history
 """
 
+import json
 import os
 import subprocess
 import sys
@@ -49,12 +50,16 @@ from .memory import (
 
 # Import color utilities for friendly status messages
 try:
-    from utils.colors import green, yellow, red
+    from utils.colors import green, red, cwrite, YELLOW
 except ImportError:
     # Fallback if colors module not available
     def green(text): return text
-    def yellow(text): return text
     def red(text): return text
+    def cwrite(text, color=''): sys.stdout.write(text)
+    YELLOW = ''
+
+# Fixed status lines, colorized once rather than on every tool round
+_THINKING_MSG = green("I'm thinking about what I found...") + "\n"
 
 
 class Orchestrator:
@@ -273,7 +278,7 @@ class Orchestrator:
             from tools.web import (
                 web_search, fetch_url, fetch_multiple_urls, extract_links,
                 scrape_structured_data, search_and_summarize,
-                monitor_page_changes, verify_claim
+                monitor_page_changes, verify_claim, batch_gemini
             )
             registry.update({
                 "web_search": web_search,
@@ -284,6 +289,7 @@ class Orchestrator:
                 "search_and_summarize": search_and_summarize,
                 "monitor_page_changes": monitor_page_changes,
                 "verify_claim": verify_claim,
+                "batch_gemini": batch_gemini,
             })
         except ImportError:
             pass  # Optional tools
@@ -346,7 +352,7 @@ class Orchestrator:
         # Notebook tools (Phase 4)
         try:
             from tools.notebook import (
-                read_notebook, get_cell, edit_cell, insert_cell,
+                read_notebook, get_cell, edit_cell, edit_cells, insert_cell,
                 delete_notebook_cell, move_cell, execute_notebook,
                 create_notebook, convert_notebook, clear_outputs
             )
@@ -354,6 +360,7 @@ class Orchestrator:
                 "read_notebook": read_notebook,
                 "get_cell": get_cell,
                 "edit_cell": edit_cell,
+                "edit_cells": edit_cells,
                 "insert_cell": insert_cell,
                 "delete_notebook_cell": delete_notebook_cell,
                 "move_cell": move_cell,
@@ -616,6 +623,8 @@ class Orchestrator:
             return f"Researching '{topic}' across multiple sources..."
         elif tool_name == "monitor_page_changes":
             return "Checking that page for changes..."
+        elif tool_name == "batch_gemini":
+            return "Sending those prompts to Gemini in one go..."
 
         # File tools
         elif tool_name == "read_file":
@@ -690,7 +699,7 @@ class Orchestrator:
             return "Executing that code..."
 
         # Notebook tools
-        elif tool_name in ["create_notebook", "run_notebook", "add_cell", "edit_cell", "export_notebook"]:
+        elif tool_name in ["create_notebook", "run_notebook", "add_cell", "edit_cell", "edit_cells", "export_notebook"]:
             return "Working on that notebook..."
 
         # Claude collaboration tools
@@ -805,7 +814,6 @@ class Orchestrator:
                 # Parse queries - could be JSON array or comma-separated
                 queries_raw = args.get("queries", "")
                 if queries_raw.startswith("["):
-                    import json
                     queries = json.loads(queries_raw)
                 else:
                     queries = [q.strip() for q in queries_raw.split(",") if q.strip()]
@@ -951,7 +959,6 @@ class Orchestrator:
             elif tool_name == "fetch_multiple_urls":
                 urls_raw = args.get("urls", "")
                 if urls_raw.startswith("["):
-                    import json
                     urls = json.loads(urls_raw)
                 else:
                     urls = [u.strip() for u in urls_raw.split(",") if u.strip()]
@@ -968,6 +975,22 @@ class Orchestrator:
                 )
             elif tool_name == "verify_claim":
                 success, output = handler(args.get("claim", ""))
+            elif tool_name == "batch_gemini":
+                # A JSON array, or one prompt per line (prompts may contain commas)
+                prompts_raw = args.get("prompts", "")
+                if prompts_raw.startswith("["):
+                    prompts = json.loads(prompts_raw)
+                else:
+                    prompts = [p.strip() for p in prompts_raw.splitlines() if p.strip()]
+                if not prompts:
+                    success, output = False, "No prompts provided"
+                else:
+                    results = handler(prompts, int(args.get("account", 1)))
+                    success = all(ok for ok, _ in results)
+                    output = "\n\n".join(
+                        f"=== [{n}] ===\n{text if ok else 'Error: ' + text}"
+                        for n, (ok, text) in enumerate(results, 1)
+                    )
             # Phase 3: Code execution tools
             elif tool_name == "execute_python":
                 success, output = handler(
@@ -987,7 +1010,6 @@ class Orchestrator:
             elif tool_name == "validate_code":
                 test_inputs = None
                 if args.get("test_inputs"):
-                    import json
                     try:
                         test_inputs = json.loads(args["test_inputs"])
                     except:
@@ -1026,7 +1048,6 @@ class Orchestrator:
                 objects = None
                 if objects_raw:
                     if objects_raw.startswith("["):
-                        import json
                         objects = json.loads(objects_raw)
                     else:
                         objects = [o.strip() for o in objects_raw.split(",") if o.strip()]
@@ -1059,6 +1080,25 @@ class Orchestrator:
                     args.get("new_content", ""),
                     args.get("cell_type")
                 )
+            elif tool_name == "edit_cells":
+                # JSON list of {"cell_index", "new_content", "cell_type"} objects
+                # or [index, content, type] arrays
+                edits = []
+                missing = None
+                for i, edit in enumerate(json.loads(args.get("edits", "[]"))):
+                    if isinstance(edit, dict):
+                        if "cell_index" not in edit:
+                            missing = i
+                            break
+                        edit = (edit["cell_index"], edit.get("new_content", ""), edit.get("cell_type"))
+                    edits.append((int(edit[0]), *edit[1:]))
+                if missing is not None:
+                    success, output = False, f"Edit {missing} has no cell_index"
+                else:
+                    success, output = handler(
+                        args.get("notebook_path", args.get("path", "")),
+                        edits
+                    )
             elif tool_name == "insert_cell":
                 success, output = handler(
                     args.get("notebook_path", args.get("path", "")),
@@ -1225,7 +1265,7 @@ class Orchestrator:
             for tc in tool_calls:
                 # Show friendly message for what we're doing
                 action_msg = self._get_tool_action_message(tc.tool, tc.args)
-                print(yellow(action_msg))
+                cwrite(action_msg + "\n", YELLOW)
                 result = self._execute_tool(tc)
                 formatted = format_tool_result(result)
                 tool_results.append(formatted)
@@ -1236,7 +1276,7 @@ class Orchestrator:
             continuation = f"{results_text}\n\nPlease continue based on the tool results above."
 
             # Call Gemini again with results - show progress since we're processing work
-            print(green("I'm thinking about what I found..."))
+            cwrite(_THINKING_MSG)
             response = self._call_gemini(continuation)
 
             if response.startswith("Error:"):
@@ -1305,7 +1345,7 @@ class Orchestrator:
             # Process the input
             print()
             response = self.process_input(user_input)
-            print(f"\nGemini: {response}\n")
+            cwrite(f"\nGemini: {response}\n\n")
 
     def _get_session_info(self) -> dict:
         """Get session statistics."""
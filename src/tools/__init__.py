@@ -30,7 +30,7 @@ from .documents import (
 from .web import (
     web_search, fetch_url, fetch_multiple_urls, extract_links,
     scrape_structured_data, search_and_summarize,
-    monitor_page_changes, verify_claim, WEB_TOOLS
+    monitor_page_changes, verify_claim, batch_gemini, WEB_TOOLS
 )
 from .code_execution import (
     execute_python, calculate, analyze_data, validate_code,
@@ -42,7 +42,7 @@ from .custom_loader import (
     list_custom_tools, CUSTOM_LOADER_TOOLS
 )
 from .notebook import (
-    read_notebook, get_cell, edit_cell, insert_cell,
+    read_notebook, get_cell, edit_cell, edit_cells, insert_cell,
     delete_notebook_cell, move_cell, execute_notebook,
     create_notebook, convert_notebook, clear_outputs,
     NOTEBOOK_TOOLS
@@ -82,7 +82,7 @@ __all__ = [
     # Web
     'web_search', 'fetch_url', 'fetch_multiple_urls', 'extract_links',
     'scrape_structured_data', 'search_and_summarize',
-    'monitor_page_changes', 'verify_claim', 'WEB_TOOLS',
+    'monitor_page_changes', 'verify_claim', 'batch_gemini', 'WEB_TOOLS',
     # Code Execution
     'execute_python', 'calculate', 'analyze_data', 'validate_code',
     'solve_equation', 'run_simulation', 'generate_and_test', 'debug_code',
@@ -91,7 +91,7 @@ __all__ = [
     'load_custom_tools', 'get_custom_tools', 'create_default_config',
     'list_custom_tools', 'CUSTOM_LOADER_TOOLS',
     # Notebook (Phase 4)
-    'read_notebook', 'get_cell', 'edit_cell', 'insert_cell',
+    'read_notebook', 'get_cell', 'edit_cell', 'edit_cells', 'insert_cell',
     'delete_notebook_cell', 'move_cell', 'execute_notebook',
     'create_notebook', 'convert_notebook', 'clear_outputs',
     'NOTEBOOK_TOOLS',
@@ -0,0 +1,127 @@
+"""
+Gemini Process Helpers - Running gemini-account.sh
+
+Shared by the tools that shell out to the Gemini CLI script (spawn, video,
+web, image): where the script is, how to launch bash for it, and how to
+run it and collect its output.
+"""
+
+import os
+import select
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+
+# Gemini script location
+GEMINI_SCRIPT = Path.home() / ".claude" / "scripts" / "gemini-account.sh"
+GEMINI_SCRIPT_STR = str(GEMINI_SCRIPT)
+
+# Whether the script exists, checked once instead of stat()ing per query.
+# A missing script is re-checked on use, so installing it later still works.
+_SCRIPT_OK = GEMINI_SCRIPT.exists()
+
+# On POSIX, subprocess spawns children with posix_spawn instead of forking
+# this (large) process only when close_fds is False, cwd is None and the
+# program is given as an absolute path. Our fds are non-inheritable by
+# default (PEP 446), so close_fds=False leaks nothing.
+SPAWN_KWARGS = {} if sys.platform == 'win32' else {'close_fds': False}
+
+
+def refresh_gemini_script_cache() -> bool:
+    """Re-check GEMINI_SCRIPT (and Git Bash) after (un)installing them."""
+    global _SCRIPT_OK
+    _SCRIPT_OK = GEMINI_SCRIPT.exists()
+    get_git_bash.cache_clear()
+    return _SCRIPT_OK
+
+
+def gemini_script_available() -> bool:
+    """Whether GEMINI_SCRIPT exists (cached; a missing script is re-checked)."""
+    return _SCRIPT_OK or refresh_gemini_script_cache()
+
+
+@lru_cache(maxsize=1)
+def _bash() -> str:
+    """Absolute path to bash, so subprocess can use posix_spawn."""
+    return shutil.which("bash") or "bash"
+
+
+@lru_cache(maxsize=None)
+def get_git_bash() -> Optional[Path]:
+    """Find Git Bash on Windows."""
+    if sys.platform != 'win32':
+        return None
+    paths = [
+        Path("C:/Program Files/Git/usr/bin/bash.exe"),
+        Path("C:/Program Files/Git/bin/bash.exe"),
+    ]
+    for p in paths:
+        if p.exists():
+            return p
+    return None
+
+
+def gemini_command(account: int, query: str, *extra: str) -> Optional[List[str]]:
+    """
+    The argv that runs GEMINI_SCRIPT for account with query (and any extra
+    arguments), or None on Windows when Git Bash isn't installed.
+    """
+    if sys.platform == 'win32':
+        git_bash = get_git_bash()
+        if not git_bash:
+            return None
+        return [str(git_bash), GEMINI_SCRIPT_STR, str(account), query, *extra]
+    return [_bash(), GEMINI_SCRIPT_STR, str(account), query, *extra]
+
+
+def run_streamed(cmd: List[str], timeout: int) -> Tuple[int, str, str]:
+    """
+    Run cmd, reading stdout incrementally into one growing buffer.
+
+    The response is decoded once at the end, so a large reply is never held
+    as both a list of chunks and a joined copy. stderr goes to a scratch
+    file so it can't fill a pipe while stdout is being read.
+
+    Returns:
+        (returncode, stdout, stderr)
+
+    Raises:
+        subprocess.TimeoutExpired: If cmd runs longer than timeout
+    """
+    deadline = time.monotonic() + timeout
+    out = bytearray()
+
+    with tempfile.TemporaryFile() as err:
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=err, **SPAWN_KWARGS) as proc:
+            try:
+                if sys.platform == 'win32':
+                    # No select() on Windows pipes
+                    out += proc.communicate(timeout=timeout)[0]
+                else:
+                    fd = proc.stdout.fileno()
+                    while True:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            raise subprocess.TimeoutExpired(cmd, timeout)
+                        ready, _, _ = select.select([fd], [], [], remaining)
+                        if not ready:
+                            continue
+                        chunk = os.read(fd, 65536)
+                        if not chunk:
+                            break
+                        out += chunk
+                returncode = proc.wait(timeout=max(deadline - time.monotonic(), 0))
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                raise
+
+        err.seek(0)
+        stderr = err.read().decode('utf-8', errors='replace')
+
+    return returncode, out.decode('utf-8', errors='replace'), stderr
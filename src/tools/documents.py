@@ -15,12 +15,22 @@ Capabilities:
 - Summarization
 """
 
+import mmap
 import subprocess
 import sys
 import os
 from pathlib import Path
 from typing import Tuple, Optional, List, Dict
 
+from .filesystem import expand_path
+
+# Content hash for response cache keys only - not used for security.
+# BLAKE3 uses SIMD tree hashing; hashlib's BLAKE2b is the stdlib fallback.
+try:
+    from blake3 import blake3 as _content_hasher
+except ImportError:
+    from hashlib import blake2b as _content_hasher
+
 
 # Gemini script location
 GEMINI_SCRIPT = Path.home() / ".claude" / "scripts" / "gemini-account.sh"
@@ -37,6 +47,156 @@ DOCUMENT_FORMATS = {
     '.rtf': {'max_size_mb': 20},
 }
 
+# Per-option instruction text, shared across calls
+_FORMAT_INSTRUCTIONS = {
+    "markdown": "Format each table as a Markdown table with headers",
+    "csv": "Format each table as CSV with proper escaping",
+    "json": "Format each table as JSON array of objects (headers as keys)"
+}
+
+_SUMMARY_INSTRUCTIONS = {
+    "executive": "Create an executive summary suitable for busy stakeholders. Focus on key findings, decisions needed, and critical information.",
+    "detailed": "Create a comprehensive summary covering all major sections and topics. Include important details and supporting information.",
+    "bullet_points": "Create a bullet-point summary with key takeaways organized by topic.",
+    "abstract": "Create an academic-style abstract covering purpose, methods, results, and conclusions."
+}
+
+_FORM_HINTS = {
+    "invoice": "Extract: vendor info, invoice number, date, line items, subtotal, tax, total, payment terms",
+    "receipt": "Extract: merchant, date, items purchased, quantities, prices, total, payment method",
+    "application": "Extract: applicant info, contact details, qualifications, responses to questions",
+    "contract": "Extract: parties involved, effective date, terms, obligations, signatures",
+    "auto": "Detect the form type and extract all relevant structured fields"
+}
+
+_FOCUS_INSTRUCTIONS = {
+    "content": "Focus on textual content differences - changed, added, or removed text",
+    "structure": "Focus on structural differences - sections, headings, organization",
+    "data": "Focus on data/numerical differences - changed values, calculations",
+    "all": "Compare all aspects - content, structure, data, and formatting"
+}
+
+_ANALYSIS_PROMPTS = {
+    "overview": """Provide an overview of the spreadsheet:
+1. Number of rows and columns
+2. Column headers and data types
+3. Summary of what the data represents
+4. Data quality assessment (missing values, inconsistencies)""",
+
+    "statistics": """Perform statistical analysis:
+1. Descriptive statistics for numerical columns (mean, median, std, min, max)
+2. Frequency distributions for categorical columns
+3. Correlations between numerical variables
+4. Key statistical insights""",
+
+    "trends": """Identify trends and patterns:
+1. Time-based trends (if date column exists)
+2. Growth/decline patterns
+3. Seasonality or cyclical patterns
+4. Outliers and their context
+5. Predictive observations""",
+
+    "anomalies": """Detect anomalies and issues:
+1. Outliers in numerical data
+2. Inconsistent data formats
+3. Missing or null values
+4. Duplicate records
+5. Logical inconsistencies
+6. Data entry errors"""
+}
+
+# Prompt templates - only the variable fields are filled in per call
+_PROMPT_PROCESS_DOC = """Process this document: {path}
+
+Query: {query}
+
+Analyze the document and provide a detailed response to the query.
+Consider all content including:
+- Text content
+- Tables and structured data
+- Charts and diagrams (if PDF)
+- Headers, footers, and metadata
+
+Provide comprehensive results based on the document content."""
+
+_PROMPT_EXTRACT_TABLES = """Document: {path}
+
+{table_spec}
+
+{format_instruction}
+
+For each table:
+1. Table number/identifier
+2. Caption or context (if available)
+3. The table data in {output_format} format
+4. Number of rows and columns
+
+Preserve data types where apparent (numbers, dates, percentages)."""
+
+_PROMPT_SUMMARIZE = """Document: {path}
+
+{summary_instruction}
+{length_note}
+
+Structure the summary clearly and highlight the most important information."""
+
+_PROMPT_FORM_DATA = """Document: {path}
+
+This appears to be a {form_type} form.
+
+{form_hint}
+
+Extract all data into a structured format:
+```json
+{{
+  "form_type": "detected type",
+  "fields": {{
+    "field_name": "value",
+    ...
+  }},
+  "line_items": [...] (if applicable),
+  "totals": {{...}} (if applicable),
+  "metadata": {{
+    "confidence": "high/medium/low",
+    "notes": "any extraction notes"
+  }}
+}}
+```
+
+Be thorough and extract all visible information."""
+
+_PROMPT_COMPARE = """Compare these two documents:
+Document 1: {path1}
+Document 2: {path2}
+
+{focus_instruction}
+
+Provide:
+1. Summary of key differences
+2. Detailed change list (additions, deletions, modifications)
+3. Sections that remain unchanged
+4. Assessment of significance of changes
+5. Any version/revision information detected"""
+
+_PROMPT_SPREADSHEET = """Spreadsheet: {path}
+{sheet_note}
+
+{analysis_prompt}
+
+Provide detailed analysis with specific examples from the data."""
+
+_PROMPT_SECTION = """Document: {path}
+
+Navigate to section: {section_identifier}
+
+Query about this section: {query}
+
+Provide:
+1. Direct answer to the query
+2. Relevant quotes or data from the section
+3. Context from surrounding sections if helpful
+4. Page/section reference for verification"""
+
 
 def get_git_bash() -> Optional[Path]:
     """Find Git Bash on Windows."""
@@ -66,19 +226,20 @@ def call_gemini(query: str, account: int = 1, timeout: int = 180) -> Tuple[bool,
         else:
             cmd = ["bash", str(GEMINI_SCRIPT), str(account), query]
 
+        # Capture bytes and decode as UTF-8 ourselves: skips the locale-aware
+        # text wrapper, which can also mangle Unicode under Git Bash
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
-            timeout=timeout,
-            cwd=os.getcwd()
+            timeout=timeout
         )
 
         if result.returncode != 0:
-            error = result.stderr.strip() if result.stderr else "Unknown error"
+            stderr = result.stderr.decode('utf-8', errors='replace').strip()
+            error = stderr or "Unknown error"
             return False, f"Error: {error}"
 
-        response = result.stdout.strip()
+        response = result.stdout.decode('utf-8', errors='replace').strip()
         return bool(response), response or "Empty response"
 
     except subprocess.TimeoutExpired:
@@ -87,51 +248,121 @@ def call_gemini(query: str, account: int = 1, timeout: int = 180) -> Tuple[bool,
         return False, f"Error: {e}"
 
 
-def process_document(
-    document_path: str,
+# Successful responses keyed by document content + prompt. Keying on the
+# content hash means an edited document misses instead of serving stale output.
+_RESPONSE_CACHE: Dict[str, str] = {}
+_RESPONSE_CACHE_MAX = 128
+
+# Files at or below this size are hashed with a single read; above the mmap
+# threshold the hasher reads straight out of the page cache
+_HASH_ONESHOT_BYTES = 64 * 1024
+_HASH_MMAP_BYTES = 4 * 1024 * 1024
+_HASH_CHUNK_BYTES = 1 << 20
+
+
+def _file_cache_key(path: str) -> str:
+    """Hash a document's content for use as a cache key (non-cryptographic use)."""
+    h = _content_hasher()
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size <= _HASH_ONESHOT_BYTES:
+            h.update(f.read())
+        elif size >= _HASH_MMAP_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                h.update(mm)
+        else:
+            while chunk := f.read(_HASH_CHUNK_BYTES):
+                h.update(chunk)
+    return h.hexdigest()
+
+
+def call_gemini_cached(
     query: str,
-    account: int = 1
+    paths: Tuple[str, ...],
+    account: int = 1,
+    timeout: int = 180
 ) -> Tuple[bool, str]:
     """
-    Process and analyze a document using Gemini.
+    Call Gemini, reusing an earlier response for the same documents and prompt.
+
+    Only successful responses are cached, and the cache lives for the process.
+    """
+    try:
+        key = "\0".join([_file_cache_key(p) for p in paths] + [query])
+    except OSError:
+        return call_gemini(query, account, timeout=timeout)
+
+    cached = _RESPONSE_CACHE.get(key)
+    if cached is not None:
+        return True, cached
+
+    success, response = call_gemini(query, account, timeout=timeout)
+    if success:
+        if len(_RESPONSE_CACHE) >= _RESPONSE_CACHE_MAX:
+            _RESPONSE_CACHE.pop(next(iter(_RESPONSE_CACHE)))
+        _RESPONSE_CACHE[key] = response
+    return success, response
+
+
+def _validate_document(doc_path: str, label: str = "Document") -> Tuple[bool, str, str]:
+    """
+    Validate a document before handing it to Gemini.
+
+    The suffix check needs no syscall and existence/size come from a single
+    stat, so files Gemini would reject fail here in microseconds instead of
+    after a multi-minute timeout.
 
     Args:
-        document_path: Path to the document file
-        query: Question or task to perform on the document
-        account: Gemini account to use (1 or 2)
+        doc_path: Path to the document as given by the caller
+        label: Noun used in the not-found message ("Document", "Spreadsheet")
 
     Returns:
-        Tuple of (success: bool, result: str)
+        Tuple of (ok: bool, suffix_or_error: str, path: str)
     """
-    path = Path(document_path).expanduser().resolve()
-
-    if not path.exists():
-        return False, f"Document not found: {document_path}"
+    # Absolute path is enough for the Gemini script - no symlink walk needed
+    path = os.path.abspath(expand_path(doc_path))
 
-    suffix = path.suffix.lower()
+    suffix = os.path.splitext(path)[1].lower()
     if suffix not in DOCUMENT_FORMATS:
-        return False, f"Unsupported document format: {suffix}. Supported: {list(DOCUMENT_FORMATS.keys())}"
+        return False, f"Unsupported document format: {suffix}. Supported: {list(DOCUMENT_FORMATS.keys())}", path
+
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False, f"{label} not found: {doc_path}", path
 
     # Check file size
-    file_size_mb = path.stat().st_size / (1024 * 1024)
+    file_size_mb = st.st_size / (1024 * 1024)
     max_size = DOCUMENT_FORMATS[suffix].get('max_size_mb', 50)
     if file_size_mb > max_size:
-        return False, f"File too large: {file_size_mb:.1f}MB (max {max_size}MB for {suffix})"
+        return False, f"File too large: {file_size_mb:.1f}MB (max {max_size}MB for {suffix})", path
 
-    prompt = f"""Process this document: {path}
+    return True, suffix, path
 
-Query: {query}
 
-Analyze the document and provide a detailed response to the query.
-Consider all content including:
-- Text content
-- Tables and structured data
-- Charts and diagrams (if PDF)
-- Headers, footers, and metadata
+def process_document(
+    document_path: str,
+    query: str,
+    account: int = 1
+) -> Tuple[bool, str]:
+    """
+    Process and analyze a document using Gemini.
 
-Provide comprehensive results based on the document content."""
+    Args:
+        document_path: Path to the document file
+        query: Question or task to perform on the document
+        account: Gemini account to use (1 or 2)
 
-    return call_gemini(prompt, account, timeout=300)
+    Returns:
+        Tuple of (success: bool, result: str)
+    """
+    ok, msg, path = _validate_document(document_path)
+    if not ok:
+        return False, msg
+
+    prompt = _PROMPT_PROCESS_DOC.format(path=path, query=query)
+
+    return call_gemini_cached(prompt, (path,), account, timeout=300)
 
 
 def extract_tables(
@@ -152,34 +383,20 @@ def extract_tables(
     Returns:
         Tuple of (success: bool, tables: str)
     """
-    path = Path(document_path).expanduser().resolve()
-
-    if not path.exists():
-        return False, f"Document not found: {document_path}"
+    ok, msg, path = _validate_document(document_path)
+    if not ok:
+        return False, msg
 
     table_spec = f"Extract table #{table_index}" if table_index else "Extract all tables"
 
-    format_instructions = {
-        "markdown": "Format each table as a Markdown table with headers",
-        "csv": "Format each table as CSV with proper escaping",
-        "json": "Format each table as JSON array of objects (headers as keys)"
-    }
-
-    prompt = f"""Document: {path}
-
-{table_spec}
-
-{format_instructions.get(output_format, format_instructions['markdown'])}
-
-For each table:
-1. Table number/identifier
-2. Caption or context (if available)
-3. The table data in {output_format} format
-4. Number of rows and columns
-
-Preserve data types where apparent (numbers, dates, percentages)."""
+    prompt = _PROMPT_EXTRACT_TABLES.format(
+        path=path,
+        table_spec=table_spec,
+        format_instruction=_FORMAT_INSTRUCTIONS.get(output_format, _FORMAT_INSTRUCTIONS['markdown']),
+        output_format=output_format,
+    )
 
-    return call_gemini(prompt, account, timeout=180)
+    return call_gemini_cached(prompt, (path,), account, timeout=180)
 
 
 def summarize_document(
@@ -200,28 +417,19 @@ def summarize_document(
     Returns:
         Tuple of (success: bool, summary: str)
     """
-    path = Path(document_path).expanduser().resolve()
-
-    if not path.exists():
-        return False, f"Document not found: {document_path}"
+    ok, msg, path = _validate_document(document_path)
+    if not ok:
+        return False, msg
 
     length_note = f"Keep the summary under {max_length} words." if max_length else ""
 
-    summary_instructions = {
-        "executive": "Create an executive summary suitable for busy stakeholders. Focus on key findings, decisions needed, and critical information.",
-        "detailed": "Create a comprehensive summary covering all major sections and topics. Include important details and supporting information.",
-        "bullet_points": "Create a bullet-point summary with key takeaways organized by topic.",
-        "abstract": "Create an academic-style abstract covering purpose, methods, results, and conclusions."
-    }
+    prompt = _PROMPT_SUMMARIZE.format(
+        path=path,
+        summary_instruction=_SUMMARY_INSTRUCTIONS.get(summary_type, _SUMMARY_INSTRUCTIONS['executive']),
+        length_note=length_note,
+    )
 
-    prompt = f"""Document: {path}
-
-{summary_instructions.get(summary_type, summary_instructions['executive'])}
-{length_note}
-
-Structure the summary clearly and highlight the most important information."""
-
-    return call_gemini(prompt, account, timeout=180)
+    return call_gemini_cached(prompt, (path,), account, timeout=180)
 
 
 def extract_form_data(
@@ -240,45 +448,17 @@ def extract_form_data(
     Returns:
         Tuple of (success: bool, extracted_data: str)
     """
-    path = Path(document_path).expanduser().resolve()
-
-    if not path.exists():
-        return False, f"Document not found: {document_path}"
+    ok, msg, path = _validate_document(document_path)
+    if not ok:
+        return False, msg
 
-    form_hints = {
-        "invoice": "Extract: vendor info, invoice number, date, line items, subtotal, tax, total, payment terms",
-        "receipt": "Extract: merchant, date, items purchased, quantities, prices, total, payment method",
-        "application": "Extract: applicant info, contact details, qualifications, responses to questions",
-        "contract": "Extract: parties involved, effective date, terms, obligations, signatures",
-        "auto": "Detect the form type and extract all relevant structured fields"
-    }
+    prompt = _PROMPT_FORM_DATA.format(
+        path=path,
+        form_type=form_type,
+        form_hint=_FORM_HINTS.get(form_type, _FORM_HINTS['auto']),
+    )
 
-    prompt = f"""Document: {path}
-
-This appears to be a {form_type} form.
-
-{form_hints.get(form_type, form_hints['auto'])}
-
-Extract all data into a structured format:
-```json
-{{
-  "form_type": "detected type",
-  "fields": {{
-    "field_name": "value",
-    ...
-  }},
-  "line_items": [...] (if applicable),
-  "totals": {{...}} (if applicable),
-  "metadata": {{
-    "confidence": "high/medium/low",
-    "notes": "any extraction notes"
-  }}
-}}
-```
-
-Be thorough and extract all visible information."""
-
-    return call_gemini(prompt, account, timeout=180)
+    return call_gemini_cached(prompt, (path,), account, timeout=180)
 
 
 def compare_documents(
@@ -299,35 +479,20 @@ def compare_documents(
     Returns:
         Tuple of (success: bool, comparison: str)
     """
-    path1 = Path(doc_path_1).expanduser().resolve()
-    path2 = Path(doc_path_2).expanduser().resolve()
-
-    if not path1.exists():
-        return False, f"Document not found: {doc_path_1}"
-    if not path2.exists():
-        return False, f"Document not found: {doc_path_2}"
-
-    focus_instructions = {
-        "content": "Focus on textual content differences - changed, added, or removed text",
-        "structure": "Focus on structural differences - sections, headings, organization",
-        "data": "Focus on data/numerical differences - changed values, calculations",
-        "all": "Compare all aspects - content, structure, data, and formatting"
-    }
-
-    prompt = f"""Compare these two documents:
-Document 1: {path1}
-Document 2: {path2}
+    ok, msg, path1 = _validate_document(doc_path_1)
+    if not ok:
+        return False, msg
+    ok, msg, path2 = _validate_document(doc_path_2)
+    if not ok:
+        return False, msg
 
-{focus_instructions.get(comparison_focus, focus_instructions['all'])}
+    prompt = _PROMPT_COMPARE.format(
+        path1=path1,
+        path2=path2,
+        focus_instruction=_FOCUS_INSTRUCTIONS.get(comparison_focus, _FOCUS_INSTRUCTIONS['all']),
+    )
 
-Provide:
-1. Summary of key differences
-2. Detailed change list (additions, deletions, modifications)
-3. Sections that remain unchanged
-4. Assessment of significance of changes
-5. Any version/revision information detected"""
-
-    return call_gemini(prompt, account, timeout=240)
+    return call_gemini_cached(prompt, (path1, path2), account, timeout=240)
 
 
 def analyze_spreadsheet(
@@ -348,50 +513,19 @@ def analyze_spreadsheet(
     Returns:
         Tuple of (success: bool, analysis: str)
     """
-    path = Path(spreadsheet_path).expanduser().resolve()
-
-    if not path.exists():
-        return False, f"Spreadsheet not found: {spreadsheet_path}"
+    ok, msg, path = _validate_document(spreadsheet_path, "Spreadsheet")
+    if not ok:
+        return False, msg
 
     sheet_note = f"\nFocus on sheet: {sheet_name}" if sheet_name else "\nAnalyze the primary/first sheet"
 
-    analysis_prompts = {
-        "overview": """Provide an overview of the spreadsheet:
-1. Number of rows and columns
-2. Column headers and data types
-3. Summary of what the data represents
-4. Data quality assessment (missing values, inconsistencies)""",
-
-        "statistics": """Perform statistical analysis:
-1. Descriptive statistics for numerical columns (mean, median, std, min, max)
-2. Frequency distributions for categorical columns
-3. Correlations between numerical variables
-4. Key statistical insights""",
-
-        "trends": """Identify trends and patterns:
-1. Time-based trends (if date column exists)
-2. Growth/decline patterns
-3. Seasonality or cyclical patterns
-4. Outliers and their context
-5. Predictive observations""",
-
-        "anomalies": """Detect anomalies and issues:
-1. Outliers in numerical data
-2. Inconsistent data formats
-3. Missing or null values
-4. Duplicate records
-5. Logical inconsistencies
-6. Data entry errors"""
-    }
+    prompt = _PROMPT_SPREADSHEET.format(
+        path=path,
+        sheet_note=sheet_note,
+        analysis_prompt=_ANALYSIS_PROMPTS.get(analysis_type, _ANALYSIS_PROMPTS['overview']),
+    )
 
-    prompt = f"""Spreadsheet: {path}
-{sheet_note}
-
-{analysis_prompts.get(analysis_type, analysis_prompts['overview'])}
-
-Provide detailed analysis with specific examples from the data."""
-
-    return call_gemini(prompt, account, timeout=180)
+    return call_gemini_cached(prompt, (path,), account, timeout=180)
 
 
 def query_document_section(
@@ -412,24 +546,17 @@ def query_document_section(
     Returns:
         Tuple of (success: bool, answer: str)
     """
-    path = Path(document_path).expanduser().resolve()
-
-    if not path.exists():
-        return False, f"Document not found: {document_path}"
-
-    prompt = f"""Document: {path}
-
-Navigate to section: {section_identifier}
+    ok, msg, path = _validate_document(document_path)
+    if not ok:
+        return False, msg
 
-Query about this section: {query}
-
-Provide:
-1. Direct answer to the query
-2. Relevant quotes or data from the section
-3. Context from surrounding sections if helpful
-4. Page/section reference for verification"""
+    prompt = _PROMPT_SECTION.format(
+        path=path,
+        section_identifier=section_identifier,
+        query=query,
+    )
 
-    return call_gemini(prompt, account)
+    return call_gemini_cached(prompt, (path,), account)
 
 
 # Tool registry
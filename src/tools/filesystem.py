@@ -10,9 +10,286 @@ SECURITY WARNING:
     See docs/BUILD_PLAN.md for Phase 2 security implementation.
 """
 
+import codecs
+import mmap
 import os
+import re
+import shutil
+import stat
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import lru_cache
 from pathlib import Path
-from typing import Tuple
+from typing import Optional, Tuple
+
+
+@lru_cache(maxsize=2048)
+def expand_path(path: str) -> str:
+    """Expand a leading ~, memoized; paths without ~ are returned as-is."""
+    return os.path.expanduser(path) if '~' in path else path
+
+
+@lru_cache(maxsize=1024)
+def _resolve_cached(path: str, cwd: str) -> Path:
+    return Path(expand_path(path)).resolve()
+
+
+def resolve_path(path: str) -> Path:
+    """
+    Expand ~ and resolve a path, memoized per process.
+
+    Absolute paths with no ".." are only normalized lexically - no syscalls,
+    no symlink walk. Everything else goes through the realpath walk once per
+    distinct path, since agents hit the same files repeatedly (read -> edit
+    -> re-read). Relative paths are also keyed on the working directory.
+    The memo is dropped by note_change(), so symlinks or directories the
+    tools create, move or delete are resolved afresh.
+    """
+    path = os.fspath(path)
+    if os.path.isabs(path) and '..' not in path:
+        return Path(os.path.normpath(path))
+
+    cwd = "" if path.startswith('~') or os.path.isabs(path) else os.getcwd()
+    return _resolve_cached(path, cwd)
+
+
+def _real_path(path: str) -> Path:
+    """
+    Expand ~ and fully resolve a path, symlinks included, with no caching.
+
+    Used by the operations that delete, move or copy files, so they act on
+    what the path points to right now rather than on resolve_path's lexical
+    or cached result.
+    """
+    return Path(os.path.realpath(expand_path(os.fspath(path))))
+
+
+def _stat_or_none(path) -> Optional[os.stat_result]:
+    """Stat a path once, returning None if it does not exist."""
+    try:
+        return os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+# Files at least this large are decoded straight from a read-only mapping;
+# below it a plain read is cheaper than setting up the mapping
+_MMAP_READ_BYTES = 256 * 1024
+
+
+# Chunk size for streamed decoding when a file cannot be mapped
+_READ_CHUNK_BYTES = 128 * 1024
+
+
+def _normalize_newlines(text: str) -> str:
+    """Apply the newline translation of text mode."""
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def _decode_text(buf) -> str:
+    """Decode UTF-8 (latin-1 fallback) with the newline handling of text mode."""
+    try:
+        text = str(buf, 'utf-8')
+    except UnicodeDecodeError:
+        text = str(buf, 'latin-1')
+    return _normalize_newlines(text)
+
+
+def _read_text_streamed(fd: int) -> str:
+    """Decode a file chunk by chunk without holding its full bytes in memory."""
+    try:
+        chunks = []
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        while True:
+            b = os.read(fd, _READ_CHUNK_BYTES)
+            if not b:
+                break
+            chunks.append(decoder.decode(b))
+        chunks.append(decoder.decode(b'', final=True))
+    except UnicodeDecodeError:
+        # latin-1 maps every byte, so one more pass always succeeds
+        os.lseek(fd, 0, os.SEEK_SET)
+        chunks = []
+        while True:
+            b = os.read(fd, _READ_CHUNK_BYTES)
+            if not b:
+                break
+            chunks.append(str(b, 'latin-1'))
+    return _normalize_newlines(''.join(chunks))
+
+
+def _read_text_mapped(fd: int) -> str:
+    """
+    Read a large file by decoding directly from an mmap of it.
+
+    Files that cannot be mapped (some FUSE and network filesystems) are
+    decoded as a stream instead.
+    """
+    try:
+        mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return _read_text_streamed(fd)
+    with mm:
+        if hasattr(mm, 'madvise'):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        return _decode_text(mm)
+
+
+def _read_all(fd: int, size_hint: int) -> bytes:
+    """Read an fd to EOF, sized from fstat so small files take one read."""
+    chunks = [os.read(fd, size_hint + 1)]
+    while chunks[-1]:
+        chunks.append(os.read(fd, _READ_CHUNK_BYTES))
+    return b''.join(chunks)
+
+
+# Nonblocking so a FIFO is rejected by fstat rather than hanging the open
+_READ_FLAGS = (
+    os.O_RDONLY
+    | getattr(os, 'O_BINARY', 0)
+    | getattr(os, 'O_CLOEXEC', 0)
+    | getattr(os, 'O_NONBLOCK', 0)
+)
+
+
+# Bumped whenever a tool changes files on disk, so caches over directory
+# trees (search results) can tell their contents may be stale
+_change_generation = 0
+
+
+def note_change() -> None:
+    """Record that files may have changed on disk."""
+    global _change_generation
+    _change_generation += 1
+    _resolve_cached.cache_clear()
+
+
+def change_generation() -> int:
+    """Counter of file changes made through the tools."""
+    return _change_generation
+
+
+# fsync before the rename only when asked: a full disk barrier per write is
+# expensive for agents that write many small files
+_FSYNC = os.environ.get('GEMINI_FSYNC') == '1'
+
+
+_TEMP_FLAGS = (
+    os.O_WRONLY | os.O_CREAT | os.O_EXCL
+    | getattr(os, 'O_BINARY', 0)
+    | getattr(os, 'O_CLOEXEC', 0)
+)
+
+
+def _create_temp(directory: str) -> Tuple[int, str]:
+    """
+    Create a uniquely named hidden temp file in directory.
+
+    Unlike mkstemp's 0600, the file is opened with mode 0666 so the kernel
+    applies the process umask - no umask() call (and its race with other
+    threads) is needed to give a new file normal permissions.
+    """
+    for _ in range(100):
+        tmp = os.path.join(directory, f".{os.urandom(6).hex()}.tmp")
+        try:
+            return os.open(tmp, _TEMP_FLAGS, 0o666), tmp
+        except FileExistsError:
+            continue
+    raise FileExistsError(f"No free temporary file name in {directory}")
+
+
+def _atomic_write(file_path: Path, data: bytes) -> None:
+    """
+    Write bytes via a temp file in the same directory and os.replace().
+
+    Readers never observe a half-written file. A symlink at file_path is
+    written through to its target, and an existing file keeps its mode.
+    Set GEMINI_FSYNC=1 to also fsync the data before the rename.
+    """
+    target = os.path.realpath(file_path) if os.path.islink(file_path) else os.fspath(file_path)
+    st = _stat_or_none(target)
+
+    fd, tmp = _create_temp(os.path.dirname(target))
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        if _FSYNC:
+            os.fsync(fd)
+        os.close(fd)
+        fd = -1
+        if st is not None:
+            os.chmod(tmp, stat.S_IMODE(st.st_mode))
+        os.replace(tmp, target)
+        note_change()
+    except BaseException:
+        if fd != -1:
+            os.close(fd)
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+# Parent directories write_file has already created or seen, so repeated
+# writes into the same directory skip the mkdir syscall
+_KNOWN_DIRS: set = set()
+_KNOWN_DIRS_MAX = 1024
+
+
+def _ensure_parent(file_path: Path) -> None:
+    """Create file_path's parent directories unless already known to exist."""
+    parent = str(file_path.parent)
+    if parent not in _KNOWN_DIRS:
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        if len(_KNOWN_DIRS) >= _KNOWN_DIRS_MAX:
+            _KNOWN_DIRS.clear()
+        _KNOWN_DIRS.add(parent)
+
+
+def _preview(buf, limit: int = 500) -> str:
+    """Leading text of a UTF-8 (or latin-1) buffer, decoding only what is shown."""
+    head = buf[:limit * 4]
+    try:
+        # Incremental decoder tolerates a multi-byte char cut off at the end
+        text = codecs.getincrementaldecoder('utf-8')().decode(head)
+    except UnicodeDecodeError:
+        text = str(head, 'latin-1')
+    if len(text) > limit or len(buf) > len(head):
+        return text[:limit] + "..."
+    return text
+
+
+def _open_regular(file_path: Path, path: str) -> Tuple[Optional[int], Optional[os.stat_result], str]:
+    """
+    Open a regular file for reading; one open + fstat covers existence, type and size.
+
+    Returns:
+        (fd, stat_result, "") on success, or (None, None, error_message)
+    """
+    try:
+        fd = os.open(file_path, _READ_FLAGS)
+    except (FileNotFoundError, NotADirectoryError):
+        return None, None, f"File not found: {path}"
+    except (IsADirectoryError, PermissionError):
+        # Windows refuses to open directories with PermissionError
+        if os.path.isdir(file_path):
+            return None, None, f"Not a file: {path}"
+        raise
+
+    try:
+        st = os.fstat(fd)
+    except BaseException:
+        os.close(fd)
+        raise
+    if not stat.S_ISREG(st.st_mode):
+        os.close(fd)
+        return None, None, f"Not a file: {path}"
+    return fd, st, ""
 
 
 def read_file(path: str) -> Tuple[bool, str]:
@@ -26,19 +303,20 @@ def read_file(path: str) -> Tuple[bool, str]:
         Tuple of (success: bool, content_or_error: str)
     """
     try:
-        file_path = Path(path).expanduser().resolve()
+        file_path = resolve_path(path)
 
-        if not file_path.exists():
-            return False, f"File not found: {path}"
-
-        if not file_path.is_file():
-            return False, f"Not a file: {path}"
+        fd, st, error = _open_regular(file_path, path)
+        if fd is None:
+            return False, error
 
-        # Read with UTF-8, fallback to latin-1 for binary-ish files
         try:
-            content = file_path.read_text(encoding='utf-8')
-        except UnicodeDecodeError:
-            content = file_path.read_text(encoding='latin-1')
+            # Read with UTF-8, fallback to latin-1 for binary-ish files
+            if st.st_size >= _MMAP_READ_BYTES:
+                content = _read_text_mapped(fd)
+            else:
+                content = _decode_text(_read_all(fd, st.st_size))
+        finally:
+            os.close(fd)
 
         return True, content
 
@@ -60,15 +338,24 @@ def write_file(path: str, content: str) -> Tuple[bool, str]:
         Tuple of (success: bool, message: str)
     """
     try:
-        file_path = Path(path).expanduser().resolve()
+        file_path = resolve_path(path)
 
         # Create parent directories if they don't exist
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+        _ensure_parent(file_path)
 
-        # Write the file
-        file_path.write_text(content, encoding='utf-8')
+        # Encode once (with text-mode newlines) and write atomically
+        if os.linesep != '\n':
+            content = content.replace('\n', os.linesep)
+        data = content.encode('utf-8')
+        try:
+            _atomic_write(file_path, data)
+        except FileNotFoundError:
+            # A cached parent was removed since we created it - recreate once
+            _KNOWN_DIRS.discard(str(file_path.parent))
+            _ensure_parent(file_path)
+            _atomic_write(file_path, data)
 
-        return True, f"Successfully wrote {len(content)} bytes to {path}"
+        return True, f"Successfully wrote {len(data)} bytes to {path}"
 
     except PermissionError:
         return False, f"Permission denied: {path}"
@@ -76,6 +363,44 @@ def write_file(path: str, content: str) -> Tuple[bool, str]:
         return False, f"Error writing file: {e}"
 
 
+# Type markers for list_directory lines, built once
+_LISTING_DIR = "/ [dir]"
+_LISTING_FILE = " [file, "
+_LISTING_OTHER = " [other]"
+
+
+# Directories with more entries than this stat them on a thread pool
+_PARALLEL_STAT_MIN = 512
+_STAT_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_STAT_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_stat_executor() -> ThreadPoolExecutor:
+    """Lazily create the shared executor used for parallel stat calls."""
+    global _STAT_EXECUTOR
+    with _STAT_EXECUTOR_LOCK:
+        if _STAT_EXECUTOR is None:
+            _STAT_EXECUTOR = ThreadPoolExecutor(
+                max_workers=min(32, (os.cpu_count() or 1) * 4),
+                thread_name_prefix="fs-stat"
+            )
+    return _STAT_EXECUTOR
+
+
+def _format_entry(entry: os.DirEntry) -> str:
+    """Format one list_directory line for a scandir entry."""
+    if entry.is_dir():
+        return entry.name + _LISTING_DIR
+    if entry.is_file():
+        # Include file size for context
+        size = entry.stat().st_size
+        size_str = (f"{size >> 20}MB" if size >= 1 << 20
+                    else f"{size >> 10}KB" if size >= 1024
+                    else f"{size}B")
+        return entry.name + _LISTING_FILE + size_str + "]"
+    return entry.name + _LISTING_OTHER
+
+
 def list_directory(path: str = ".") -> Tuple[bool, str]:
     """
     List contents of a directory with type indicators.
@@ -87,35 +412,32 @@ def list_directory(path: str = ".") -> Tuple[bool, str]:
         Tuple of (success: bool, listing_or_error: str)
     """
     try:
-        dir_path = Path(path).expanduser().resolve()
+        dir_path = resolve_path(path)
 
-        if not dir_path.exists():
+        # scandir reports missing paths and non-directories itself, so no
+        # separate exists/is_dir stats are needed. Sort DirEntry objects by
+        # normcase'd name, the order sorted(Path) gave (case-insensitive on
+        # Windows); their is_dir/is_file reuse the d_type from the directory read.
+        try:
+            with os.scandir(dir_path) as it:
+                entries = sorted(it, key=lambda e: os.path.normcase(e.name))
+        except FileNotFoundError:
             return False, f"Directory not found: {path}"
-
-        if not dir_path.is_dir():
+        except NotADirectoryError:
             return False, f"Not a directory: {path}"
 
-        entries = []
-        for item in sorted(dir_path.iterdir()):
-            if item.is_dir():
-                entries.append(f"{item.name}/ [dir]")
-            elif item.is_file():
-                # Include file size for context
-                size = item.stat().st_size
-                if size < 1024:
-                    size_str = f"{size}B"
-                elif size < 1024 * 1024:
-                    size_str = f"{size // 1024}KB"
-                else:
-                    size_str = f"{size // (1024 * 1024)}MB"
-                entries.append(f"{item.name} [file, {size_str}]")
-            else:
-                entries.append(f"{item.name} [other]")
-
         if not entries:
             return True, "(empty directory)"
 
-        return True, "\n".join(entries)
+        if len(entries) > _PARALLEL_STAT_MIN:
+            # Overlap the per-entry stat latency of large, cold directories
+            out = list(_get_stat_executor().map(_format_entry, entries))
+        else:
+            out = [None] * len(entries)
+            for i, entry in enumerate(entries):
+                out[i] = _format_entry(entry)
+
+        return True, "\n".join(out)
 
     except PermissionError:
         return False, f"Permission denied: {path}"
@@ -123,6 +445,41 @@ def list_directory(path: str = ".") -> Tuple[bool, str]:
         return False, f"Error listing directory: {e}"
 
 
+# Any line ending, for matching \n in old_text against the file
+_NEWLINE_PATTERN = rb'(?:\r\n|\r|\n)'
+
+# A \n that doesn't end a \r\n - its absence means a file is all CRLF
+_BARE_LF_RE = re.compile(rb'(?<!\r)\n')
+
+
+@lru_cache(maxsize=64)
+def _line_ending_regex(old_bytes: bytes) -> re.Pattern:
+    """A pattern for old_bytes in which each \n matches any line ending."""
+    return re.compile(_NEWLINE_PATTERN.join(re.escape(part) for part in old_bytes.split(b'\n')))
+
+
+def _find_text(buf, old_bytes: bytes, pos: int = 0) -> Optional[Tuple[int, int]]:
+    """
+    Find old_bytes in buf at or after pos, as a (start, end) byte span.
+
+    Text without line breaks is a plain byte search. Text with line breaks
+    also matches lines ending in \r\n or \r, since read_file shows those as \n.
+    """
+    if b'\n' not in old_bytes:
+        idx = buf.find(old_bytes, pos)
+        return None if idx == -1 else (idx, idx + len(old_bytes))
+    match = _line_ending_regex(old_bytes).search(buf, pos)
+    return None if match is None else match.span()
+
+
+def _count_text(buf, old_bytes: bytes) -> int:
+    """Count non-overlapping occurrences of old_bytes, as _find_text matches them."""
+    # mmap has no count(); the regex scans it in place without a copy
+    if b'\n' not in old_bytes and isinstance(buf, bytes):
+        return buf.count(old_bytes)
+    return sum(1 for _ in _line_ending_regex(old_bytes).finditer(buf))
+
+
 def edit_file(path: str, old_text: str, new_text: str) -> Tuple[bool, str]:
     """
     Make a surgical edit to a file by replacing old_text with new_text.
@@ -141,37 +498,70 @@ def edit_file(path: str, old_text: str, new_text: str) -> Tuple[bool, str]:
         Tuple of (success: bool, message: str)
     """
     try:
-        file_path = Path(path).expanduser().resolve()
-
-        if not file_path.exists():
-            return False, f"File not found: {path}"
+        file_path = resolve_path(path)
 
-        if not file_path.is_file():
-            return False, f"Not a file: {path}"
+        fd, st, error = _open_regular(file_path, path)
+        if fd is None:
+            return False, error
 
-        # Read current content
+        # Search the bytes directly: one memchr-accelerated scan and no decode
+        # of the file. Only large files are worth the cost of setting up a map.
         try:
-            content = file_path.read_text(encoding='utf-8')
-        except UnicodeDecodeError:
-            content = file_path.read_text(encoding='latin-1')
-
-        # Check if old_text exists
-        if old_text not in content:
-            # Provide helpful context
-            preview = content[:500] + "..." if len(content) > 500 else content
-            return False, f"old_text not found in {path}. File preview:\n{preview}"
-
-        # Check for multiple occurrences (warn but proceed)
-        occurrences = content.count(old_text)
-        warning = ""
-        if occurrences > 1:
-            warning = f" (Note: {occurrences} occurrences found, only first replaced)"
-
-        # Replace first occurrence only
-        new_content = content.replace(old_text, new_text, 1)
-
-        # Write back
-        file_path.write_text(new_content, encoding='utf-8')
+            source = None
+            if st.st_size >= _MMAP_READ_BYTES:
+                try:
+                    source = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+                except (OSError, ValueError):
+                    pass
+            if source is None:
+                source = nullcontext(_read_all(fd, st.st_size))
+        finally:
+            os.close(fd)
+
+        with source as buf:
+            # read_file shows every line ending as \n, so the text we're given
+            # uses \n too. Write new lines as \r\n only if the file already
+            # ends every line that way; other files keep their bytes as they are.
+            old_text = _normalize_newlines(old_text)
+            new_text = _normalize_newlines(new_text)
+            if '\n' in new_text and buf.find(b'\r\n') != -1 \
+                    and _BARE_LF_RE.search(buf) is None:
+                new_text = new_text.replace('\n', '\r\n')
+
+            # Non-ASCII text is encoded the way read_file decoded the file,
+            # so a latin-1 file stays latin-1
+            encoding = 'utf-8'
+            if not (old_text.isascii() and new_text.isascii()):
+                try:
+                    str(buf, 'utf-8')
+                except UnicodeDecodeError:
+                    encoding = 'latin-1'
+            try:
+                old_bytes = old_text.encode(encoding)
+                new_bytes = new_text.encode(encoding)
+            except UnicodeEncodeError:
+                return False, f"Cannot edit {path}: text can't be written in the file's {encoding} encoding"
+
+            # Check if old_text exists
+            match = _find_text(buf, old_bytes)
+            if match is None:
+                # Provide helpful context
+                return False, f"old_text not found in {path}. File preview:\n{_preview(buf)}"
+            start, end = match
+
+            # Check for multiple occurrences (warn but proceed)
+            occurrences = 1
+            if _find_text(buf, old_bytes, start + 1) is not None:
+                occurrences = _count_text(buf, old_bytes)
+            warning = ""
+            if occurrences > 1:
+                warning = f" (Note: {occurrences} occurrences found, only first replaced)"
+
+            # Replace first occurrence only
+            new_data = b''.join((buf[:start], new_bytes, buf[end:]))
+
+        # Write back atomically
+        _atomic_write(file_path, new_data)
 
         return True, f"Successfully edited {path}{warning}"
 
@@ -192,7 +582,8 @@ def delete_file(path: str) -> Tuple[bool, str]:
         Tuple of (success: bool, message: str)
     """
     try:
-        file_path = Path(path).expanduser().resolve()
+        note_change()
+        file_path = _real_path(path)
 
         if not file_path.exists():
             return False, f"File not found: {path}"
@@ -209,6 +600,60 @@ def delete_file(path: str) -> Tuple[bool, str]:
         return False, f"Error deleting file: {e}"
 
 
+# dir_fd-relative removal needs fd support for open/unlink/rmdir and scandir
+_HAS_DIR_FD = (
+    {os.open, os.unlink, os.rmdir} <= os.supports_dir_fd
+    and os.scandir in os.supports_fd
+)
+
+
+def _rmtree_fd(dir_fd: int) -> None:
+    """Remove everything inside the directory open as dir_fd."""
+    with os.scandir(dir_fd) as it:
+        entries = list(it)
+
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            fd = os.open(
+                entry.name,
+                os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0) | getattr(os, 'O_NOFOLLOW', 0),
+                dir_fd=dir_fd
+            )
+            try:
+                _rmtree_fd(fd)
+            finally:
+                os.close(fd)
+            os.rmdir(entry.name, dir_fd=dir_fd)
+        else:
+            os.unlink(entry.name, dir_fd=dir_fd)
+
+
+def _fast_rmtree(path: str) -> None:
+    """
+    Recursively delete a directory tree.
+
+    Entries are unlinked relative to their parent's open descriptor, so the
+    kernel resolves one name per syscall instead of re-walking the full path.
+    Falls back to shutil.rmtree where dir_fd is not supported (e.g. Windows).
+    Like shutil.rmtree, refuses a symlink rather than emptying its target.
+    """
+    if not _HAS_DIR_FD:
+        shutil.rmtree(path)
+        return
+
+    if stat.S_ISLNK(os.lstat(path).st_mode):
+        raise OSError(f"Cannot delete a symbolic link recursively: {path}")
+    fd = os.open(
+        path,
+        os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0) | getattr(os, 'O_NOFOLLOW', 0)
+    )
+    try:
+        _rmtree_fd(fd)
+    finally:
+        os.close(fd)
+    os.rmdir(path)
+
+
 def delete_directory(path: str, recursive: bool = False) -> Tuple[bool, str]:
     """
     Delete a directory.
@@ -221,7 +666,8 @@ def delete_directory(path: str, recursive: bool = False) -> Tuple[bool, str]:
         Tuple of (success: bool, message: str)
     """
     try:
-        dir_path = Path(path).expanduser().resolve()
+        note_change()
+        dir_path = _real_path(path)
 
         if not dir_path.exists():
             return False, f"Directory not found: {path}"
@@ -230,8 +676,7 @@ def delete_directory(path: str, recursive: bool = False) -> Tuple[bool, str]:
             return False, f"Not a directory (use delete_file for files): {path}"
 
         if recursive:
-            import shutil
-            shutil.rmtree(dir_path)
+            _fast_rmtree(str(dir_path))
             return True, f"Successfully deleted {path} and all contents"
         else:
             # Only delete if empty
@@ -257,7 +702,7 @@ def create_directory(path: str) -> Tuple[bool, str]:
         Tuple of (success: bool, message: str)
     """
     try:
-        dir_path = Path(path).expanduser().resolve()
+        dir_path = resolve_path(path)
 
         if dir_path.exists():
             if dir_path.is_dir():
@@ -286,8 +731,9 @@ def move_file(source: str, destination: str) -> Tuple[bool, str]:
         Tuple of (success: bool, message: str)
     """
     try:
-        src_path = Path(source).expanduser().resolve()
-        dst_path = Path(destination).expanduser().resolve()
+        note_change()
+        src_path = _real_path(source)
+        dst_path = _real_path(destination)
 
         if not src_path.exists():
             return False, f"Source not found: {source}"
@@ -316,9 +762,9 @@ def copy_file(source: str, destination: str) -> Tuple[bool, str]:
         Tuple of (success: bool, message: str)
     """
     try:
-        import shutil
-        src_path = Path(source).expanduser().resolve()
-        dst_path = Path(destination).expanduser().resolve()
+        note_change()
+        src_path = _real_path(source)
+        dst_path = _real_path(destination)
 
         if not src_path.exists():
             return False, f"Source not found: {source}"
@@ -340,17 +786,20 @@ def copy_file(source: str, destination: str) -> Tuple[bool, str]:
 
 def file_exists(path: str) -> bool:
     """Check if a file exists."""
+    # The kernel resolves symlinks and ".." itself; one stat, no Path object
     try:
-        return Path(path).expanduser().resolve().is_file()
-    except Exception:
+        path = os.fspath(path) or '.'
+        return stat.S_ISREG(os.stat(expand_path(path)).st_mode)
+    except (OSError, ValueError, TypeError):
         return False
 
 
 def directory_exists(path: str) -> bool:
     """Check if a directory exists."""
     try:
-        return Path(path).expanduser().resolve().is_dir()
-    except Exception:
+        path = os.fspath(path) or '.'
+        return stat.S_ISDIR(os.stat(expand_path(path)).st_mode)
+    except (OSError, ValueError, TypeError):
         return False
 
 
@@ -18,16 +18,16 @@ Model Routing (AI Pro + OAuth):
 """
 
 import subprocess
-import sys
 import os
+import stat
 import base64
 import json
-from pathlib import Path
-from typing import Tuple, Optional, List, Dict, Any
+from typing import Tuple, List, Dict, Any
 
-
-# Gemini script location
-GEMINI_SCRIPT = Path.home() / ".claude" / "scripts" / "gemini-account.sh"
+from .filesystem import expand_path, resolve_path
+from ._gemini_proc import SPAWN_KWARGS, gemini_command, gemini_script_available
+# Re-exported: both used to be defined in this module
+from ._gemini_proc import GEMINI_SCRIPT, get_git_bash  # noqa: F401
 
 # Model IDs (AI Pro + OAuth quotas)
 MODEL_FLASH_LITE = "gemini-2.5-flash-lite"      # Default for automation (1,500/day per account)
@@ -35,27 +35,14 @@ MODEL_FLASH_3 = "gemini-3-flash-preview"        # Daily driver, unlimited
 MODEL_IMAGE_PRO = "gemini-3-pro-image-preview"  # High-fidelity images (1,000/day per account)
 MODEL_IMAGE_FLASH = "gemini-2.5-flash-image"    # Fast image generation (1,000/day per account)
 
-# Supported aspect ratios for image generation
-SUPPORTED_ASPECT_RATIOS = [
+# Supported aspect ratios for image generation (ordered for error messages)
+_ASPECT_RATIO_ORDER = (
     "21:9", "16:9", "4:3", "3:2", "1:1", "2:3", "3:4", "9:16", "9:21"
-]
+)
+SUPPORTED_ASPECT_RATIOS = frozenset(_ASPECT_RATIO_ORDER)
 
 # Supported image formats for analysis
-SUPPORTED_IMAGE_FORMATS = {'.png', '.jpg', '.jpeg', '.gif', '.webp', '.bmp'}
-
-
-def get_git_bash() -> Optional[Path]:
-    """Find Git Bash on Windows."""
-    if sys.platform != 'win32':
-        return None
-    paths = [
-        Path("C:/Program Files/Git/usr/bin/bash.exe"),
-        Path("C:/Program Files/Git/bin/bash.exe"),
-    ]
-    for p in paths:
-        if p.exists():
-            return p
-    return None
+SUPPORTED_IMAGE_FORMATS = frozenset({'.png', '.jpg', '.jpeg', '.gif', '.webp', '.bmp'})
 
 
 def call_gemini(
@@ -76,31 +63,28 @@ def call_gemini(
     Returns:
         Tuple of (success, response)
     """
-    if not GEMINI_SCRIPT.exists():
+    if not gemini_script_available():
         return False, f"gemini-account.sh not found"
 
     try:
-        if sys.platform == 'win32':
-            git_bash = get_git_bash()
-            if not git_bash:
-                return False, "Git Bash not found"
-            cmd = [str(git_bash), str(GEMINI_SCRIPT), str(account), query, model]
-        else:
-            cmd = ["bash", str(GEMINI_SCRIPT), str(account), query, model]
+        cmd = gemini_command(account, query, model)
+        if cmd is None:
+            return False, "Git Bash not found"
 
+        # Capture bytes and decode once; text=True would add a second pass
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
             timeout=timeout,
-            cwd=os.getcwd()
+            **SPAWN_KWARGS
         )
 
         if result.returncode != 0:
-            error = result.stderr.strip() if result.stderr else "Unknown error"
+            stderr = result.stderr.strip()
+            error = stderr.decode('utf-8', errors='replace') if stderr else "Unknown error"
             return False, f"Error: {error}"
 
-        response = result.stdout.strip()
+        response = result.stdout.strip().decode('utf-8', errors='replace')
         return bool(response), response or "Empty response"
 
     except subprocess.TimeoutExpired:
@@ -130,18 +114,21 @@ def analyze_image(
         For true multimodal analysis, the gemini-account.sh script
         would need to support image inputs directly.
     """
-    path = Path(image_path).expanduser().resolve()
+    path = resolve_path(image_path)
 
-    if not path.exists():
+    # One stat covers both the existence and the regular-file check
+    try:
+        st = os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
         return False, f"Image not found: {image_path}"
 
-    if not path.is_file():
+    if not stat.S_ISREG(st.st_mode):
         return False, f"Not a file: {image_path}"
 
-    # Check file extension
-    valid_extensions = {'.png', '.jpg', '.jpeg', '.gif', '.webp', '.bmp'}
-    if path.suffix.lower() not in valid_extensions:
-        return False, f"Unsupported image format: {path.suffix}"
+    # Check file extension (read the suffix once)
+    suffix = path.suffix
+    if suffix.lower() not in SUPPORTED_IMAGE_FORMATS:
+        return False, f"Unsupported image format: {suffix}"
 
     # For CLI-based Gemini, we describe the analysis request
     # True multimodal would require API integration
@@ -184,9 +171,9 @@ def generate_image(
         - May struggle with: precise spatial reasoning, medical images, non-Latin text
     """
     if aspect_ratio not in SUPPORTED_ASPECT_RATIOS:
-        return False, f"Unsupported aspect ratio: {aspect_ratio}. Supported: {SUPPORTED_ASPECT_RATIOS}"
+        return False, f"Unsupported aspect ratio: {aspect_ratio}. Supported: {list(_ASPECT_RATIO_ORDER)}"
 
-    output = Path(output_path).expanduser().resolve()
+    output = resolve_path(output_path)
     output.parent.mkdir(parents=True, exist_ok=True)
 
     # Build the generation prompt
@@ -243,6 +230,26 @@ Return only the optimized prompt, nothing else."""
     return call_gemini(prompt, account=1)
 
 
+# Fixed sections of the detect_objects prompt
+_DETECT_BBOX_REQUEST = """For each detected object, provide bounding box coordinates in the format:
+- Object: [name]
+  Location: [x_min, y_min, x_max, y_max] (normalized 0-1 coordinates)
+  Confidence: [high/medium/low]"""
+
+_DETECT_INSTRUCTIONS = """Identify all distinct objects visible in the image. For each object:
+1. Name/classification
+2. Position in the image (if bounding boxes requested)
+3. Confidence level
+4. Any relevant attributes (color, size, state)
+
+Return results in a structured format."""
+
+
+def _display_path(image_path: str) -> str:
+    """Absolute path for embedding in a prompt, without a realpath walk."""
+    return os.path.abspath(expand_path(image_path))
+
+
 def describe_for_accessibility(
     image_path: str,
     context: str = ""
@@ -259,9 +266,9 @@ def describe_for_accessibility(
     Returns:
         Tuple of (success: bool, alt_text: str)
     """
-    path = Path(image_path).expanduser().resolve()
+    path = _display_path(image_path)
 
-    if not path.exists():
+    if not os.path.isfile(path):
         return False, f"Image not found: {image_path}"
 
     context_note = f" Context: {context}" if context else ""
@@ -289,9 +296,9 @@ def extract_text_from_image(image_path: str) -> Tuple[bool, str]:
     Returns:
         Tuple of (success: bool, extracted_text: str)
     """
-    path = Path(image_path).expanduser().resolve()
+    path = _display_path(image_path)
 
-    if not path.exists():
+    if not os.path.isfile(path):
         return False, f"Image not found: {image_path}"
 
     prompt = f"""Extract all text visible in the image at: {path}
@@ -324,39 +331,23 @@ def detect_objects(
     Returns:
         Tuple of (success: bool, detection_results: str)
     """
-    path = Path(image_path).expanduser().resolve()
+    path = _display_path(image_path)
 
-    if not path.exists():
+    if not os.path.isfile(path):
         return False, f"Image not found: {image_path}"
 
-    if path.suffix.lower() not in SUPPORTED_IMAGE_FORMATS:
-        return False, f"Unsupported image format: {path.suffix}"
+    suffix = os.path.splitext(path)[1]
+    if suffix.lower() not in SUPPORTED_IMAGE_FORMATS:
+        return False, f"Unsupported image format: {suffix}"
 
-    objects_filter = ""
+    parts = [f"Perform object detection on the image at: {path}"]
     if objects_to_find:
-        objects_filter = f"\nSpecifically look for: {', '.join(objects_to_find)}"
-
-    bbox_request = ""
+        parts.append("Specifically look for: " + ", ".join(objects_to_find))
     if return_bounding_boxes:
-        bbox_request = """
-For each detected object, provide bounding box coordinates in the format:
-- Object: [name]
-  Location: [x_min, y_min, x_max, y_max] (normalized 0-1 coordinates)
-  Confidence: [high/medium/low]"""
+        parts.append(_DETECT_BBOX_REQUEST)
+    parts.append(_DETECT_INSTRUCTIONS)
 
-    prompt = f"""Perform object detection on the image at: {path}
-{objects_filter}
-{bbox_request}
-
-Identify all distinct objects visible in the image. For each object:
-1. Name/classification
-2. Position in the image (if bounding boxes requested)
-3. Confidence level
-4. Any relevant attributes (color, size, state)
-
-Return results in a structured format."""
-
-    return call_gemini(prompt, account)
+    return call_gemini("\n\n".join(parts), account)
 
 
 def compare_images(
@@ -377,8 +368,8 @@ def compare_images(
     Returns:
         Tuple of (success: bool, comparison_result: str)
     """
-    path1 = Path(image_path_1).expanduser().resolve()
-    path2 = Path(image_path_2).expanduser().resolve()
+    path1 = resolve_path(image_path_1)
+    path2 = resolve_path(image_path_2)
 
     if not path1.exists():
         return False, f"Image not found: {image_path_1}"
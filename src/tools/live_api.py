@@ -12,19 +12,69 @@ Note: Full WebSocket implementation requires the Gemini Live API.
 This module provides the infrastructure for when that's available.
 """
 
+import os
 import sys
 import time
 import json
+import logging
+import array
+import asyncio
+import collections.abc
 import threading
-import queue
-import wave
+import warnings
 import struct
 from pathlib import Path
-from typing import Optional, Callable, Dict, Any, List, Generator
+from typing import Optional, Callable, Dict, Any, List, Generator, Iterator
 from dataclasses import dataclass, field
 from enum import Enum
 from abc import ABC, abstractmethod
 
+# NumPy computes chunk RMS in C over a zero-copy view; struct is the fallback
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Numba fuses the int16 -> float square-and-sum into one compiled loop with
+# no float32 temporary; plain NumPy is used without it
+try:
+    import numba
+except ImportError:
+    numba = None
+
+if numba is not None and np is not None:
+    @numba.njit(cache=True, nogil=True)
+    def _rms_i16(samples):
+        acc = 0.0
+        for s in samples:
+            acc += float(s) * float(s)
+        return (acc / samples.size) ** 0.5
+else:
+    _rms_i16 = None
+
+# orjson serializes transcript exports in C; stdlib json is the fallback
+try:
+    import orjson
+
+    def _dump_json(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dump_json(data: Any) -> bytes:
+        return json.dumps(data, indent=2).encode('utf-8')
+
+# Without NumPy, the stdlib's C audioop.rms (removed in Python 3.13) beats the
+# pure-Python struct loop, which remains the last resort
+try:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        import audioop
+except ImportError:
+    audioop = None
+
+
+# Slotted dataclasses (Python 3.10+) drop the per-instance __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
 class SessionState(Enum):
     """Live session states."""
@@ -38,7 +88,7 @@ class SessionState(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class LiveConfig:
     """Configuration for live sessions."""
     sample_rate: int = 16000  # Audio sample rate (Hz)
@@ -51,7 +101,7 @@ class LiveConfig:
     reconnect_delay: float = 1.0
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Transcript:
     """A transcript entry with timestamp."""
     timestamp: float
@@ -61,33 +111,284 @@ class Transcript:
     confidence: float = 1.0
 
 
-@dataclass
+class TranscriptTable(collections.abc.Sequence):
+    """
+    Column-oriented transcript storage.
+
+    Keeps one array per Transcript field instead of an object per entry, so
+    long sessions stay compact and exports walk plain columns. Indexing and
+    iteration still yield Transcript objects.
+    """
+
+    def __init__(self):
+        self.timestamps = array.array('d')
+        self.speakers: List[str] = []
+        self.texts: List[str] = []
+        self.finals: List[bool] = []
+        self.confidences = array.array('d')
+
+    def add(
+        self,
+        timestamp: float,
+        speaker: str,
+        text: str,
+        is_final: bool = True,
+        confidence: float = 1.0
+    ):
+        """Append one transcript entry."""
+        self.timestamps.append(timestamp)
+        self.speakers.append(speaker)
+        self.texts.append(text)
+        self.finals.append(is_final)
+        self.confidences.append(confidence)
+
+    def append(self, transcript: Transcript):
+        """Append a Transcript object."""
+        self.add(
+            transcript.timestamp, transcript.speaker, transcript.text,
+            transcript.is_final, transcript.confidence
+        )
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return Transcript(
+            timestamp=self.timestamps[index],
+            speaker=self.speakers[index],
+            text=self.texts[index],
+            is_final=self.finals[index],
+            confidence=self.confidences[index]
+        )
+
+    def __iter__(self) -> Iterator[Transcript]:
+        for row in zip(self.timestamps, self.speakers, self.texts, self.finals, self.confidences):
+            yield Transcript(*row)
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class LiveSession:
     """Represents a live interaction session."""
     session_id: str
     state: SessionState = SessionState.DISCONNECTED
     config: LiveConfig = field(default_factory=LiveConfig)
-    transcripts: List[Transcript] = field(default_factory=list)
+    transcripts: TranscriptTable = field(default_factory=TranscriptTable)
     start_time: float = field(default_factory=time.time)
     last_activity: float = field(default_factory=time.time)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+# SCHED_FIFO priority for audio I/O threads (1-99; low enough to stay polite)
+AUDIO_THREAD_PRIORITY = 10
+
+_priority_warned = False
+
+
+def _set_realtime_priority():
+    """
+    Raise the calling audio thread to real-time priority, best effort.
+
+    Linux uses SCHED_FIFO (needs CAP_SYS_NICE or an rtprio limit); Windows
+    uses THREAD_PRIORITY_TIME_CRITICAL. Failure leaves normal priority and
+    prints one warning per process.
+    """
+    global _priority_warned
+    try:
+        if hasattr(os, 'sched_setscheduler') and hasattr(os, 'SCHED_FIFO'):
+            # pid 0 is the calling thread on Linux
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(AUDIO_THREAD_PRIORITY))
+        elif sys.platform == 'win32':
+            import ctypes
+            kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+            THREAD_PRIORITY_TIME_CRITICAL = 15
+            if not kernel32.SetThreadPriority(kernel32.GetCurrentThread(), THREAD_PRIORITY_TIME_CRITICAL):
+                raise OSError(ctypes.get_last_error(), "SetThreadPriority failed")
+    except OSError as e:
+        if not _priority_warned:
+            _priority_warned = True
+            print(f"Warning: could not raise audio thread priority ({e}); dropouts are possible under load")
+
+
+# Minimum ring capacity in chunks; rings hold at least ~1s of audio
+AUDIO_RING_SLOTS = 32
+
+logger = logging.getLogger(__name__)
+
+# Audio threads log at most one warning per this many seconds
+AUDIO_WARN_INTERVAL = 1.0
+
+# Consecutive stream errors before an audio thread gives up
+MAX_AUDIO_ERRORS = 10
+
+
+class _RateLimitedWarning:
+    """Logs a warning at most once per AUDIO_WARN_INTERVAL seconds."""
+
+    def __init__(self):
+        self._last = float('-inf')
+
+    def __call__(self, message: str, *args):
+        now = time.monotonic()
+        if now - self._last >= AUDIO_WARN_INTERVAL:
+            self._last = now
+            logger.warning(message, *args)
+
+
+def _new_audio_ring(config: "LiveConfig") -> "AudioRing":
+    """Create a ring holding about one second of audio for config."""
+    capacity = max(AUDIO_RING_SLOTS, int(config.sample_rate / config.chunk_size))
+    return AudioRing(config.chunk_size * config.channels * 2, capacity)
+
+
+class AudioRing:
+    """
+    Single-producer/single-consumer ring of preallocated audio slots.
+
+    The producer copies into the slot at head and publishes it by bumping
+    head; the consumer reads the slot at tail and frees it by bumping tail.
+    Each counter is written by one side only and int stores are atomic
+    under the GIL, so neither side takes a lock or allocates a slot. An
+    empty ring's consumer sleeps on an Event that commit() sets.
+
+    get() hands out a read-only view of the slot itself rather than a copy;
+    the slot stays owned by the consumer until its next get().
+    """
+
+    def __init__(self, slot_size: int, capacity: int = AUDIO_RING_SLOTS):
+        # Power-of-two capacity so indexing is a mask, not a modulo
+        capacity = 1 << max(capacity - 1, 1).bit_length()
+        self.slot_size = slot_size
+        self.mask = capacity - 1
+        self.slots = [bytearray(slot_size) for _ in range(capacity)]
+        self.lengths = [0] * capacity
+        self.head = 0  # Written by the producer only
+        self.tail = 0  # Written by the consumer only
+        self._holding = False  # Consumer still owns the slot at tail
+        self._ready = threading.Event()  # Set by commit(), cleared by get()
+
+    def __len__(self) -> int:
+        return self.head - self.tail
+
+    def reserve(self) -> Optional[memoryview]:
+        """Return a writable view of the next free slot, or None if full."""
+        if self.head - self.tail > self.mask:
+            return None
+        return memoryview(self.slots[self.head & self.mask])
+
+    def commit(self, length: int):
+        """Publish the reserved slot holding length bytes."""
+        self.lengths[self.head & self.mask] = length
+        self.head += 1
+        self._ready.set()
+
+    def put(self, data) -> bool:
+        """
+        Copy data into free slots, splitting it across slots if needed.
+
+        Returns:
+            False if the ring filled up before all data was stored
+        """
+        view = memoryview(data)
+        for start in range(0, len(view), self.slot_size):
+            slot = self.reserve()
+            if slot is None:
+                return False
+            piece = view[start:start + self.slot_size]
+            slot[:len(piece)] = piece
+            self.commit(len(piece))
+        return True
+
+    def get(self, timeout: float = 0.1) -> Optional[memoryview]:
+        """
+        Take the oldest chunk, waiting up to timeout if the ring is empty.
+
+        Returns:
+            Read-only view of the chunk, valid until the next get() call
+        """
+        if self._holding:
+            # Release the slot handed out by the previous call
+            self._holding = False
+            self.tail += 1
+
+        if self.head == self.tail:
+            deadline = time.monotonic() + timeout
+            while True:
+                # Clear before re-checking, so a commit() in between still wakes us
+                self._ready.clear()
+                if self.head != self.tail:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                self._ready.wait(remaining)
+
+        i = self.tail & self.mask
+        self._holding = True
+        return memoryview(self.slots[i]).toreadonly()[:self.lengths[i]]
+
+
 class AudioCapture:
     """
     Captures audio from microphone.
 
-    Note: Requires pyaudio for actual audio capture.
-    Falls back to simulation if not available.
+    Note: Requires sounddevice or pyaudio for actual audio capture.
+    With sounddevice, PortAudio's callback writes blocks straight into the
+    ring and no capture thread is needed; pyaudio uses a blocking read loop.
+    Falls back to simulation if neither is available.
     """
 
     def __init__(self, config: LiveConfig):
         self.config = config
         self.is_capturing = False
-        self.audio_queue: queue.Queue = queue.Queue()
+        self.audio_ring = _new_audio_ring(config)
+        self.dropped = 0
+        self._warn = _RateLimitedWarning()
         self.capture_thread: Optional[threading.Thread] = None
+        # Struct for a full chunk, compiled once for the no-NumPy level path
+        self._chunk_struct = struct.Struct(f'<{config.chunk_size * config.channels}h')
+        # RMS never exceeds the peak, so chunks peaking below this are silent
+        self._silent_peak = int(config.silence_threshold * 32767)
         self._pyaudio = None
         self._stream = None
+        self._sd_stream = None
+
+    def _start_sounddevice(self) -> bool:
+        """Start a callback-driven sounddevice stream if available."""
+        try:
+            import sounddevice
+        except (ImportError, OSError):
+            # OSError: the module is present but the PortAudio library is not
+            return False
+
+        try:
+            self._sd_stream = sounddevice.RawInputStream(
+                samplerate=self.config.sample_rate,
+                channels=self.config.channels,
+                dtype='int16',
+                blocksize=self.config.chunk_size,
+                callback=self._on_audio
+            )
+            self.is_capturing = True
+            self._sd_stream.start()
+            return True
+        except Exception:
+            self.is_capturing = False
+            self._sd_stream = None
+            return False
+
+    def _on_audio(self, indata, frames, time_info, status):
+        """sounddevice callback: copy the block into the next ring slot."""
+        ring = self.audio_ring
+        slot = ring.reserve()
+        if slot is None:
+            self.dropped += 1
+            return
+        view = memoryview(indata)
+        n = min(len(view), ring.slot_size)
+        slot[:n] = view[:n]
+        ring.commit(n)
 
     def _init_pyaudio(self) -> bool:
         """Initialize PyAudio if available."""
@@ -97,7 +398,7 @@ class AudioCapture:
             return True
         except ImportError:
             print("Warning: pyaudio not installed. Audio capture unavailable.")
-            print("Install with: pip install pyaudio")
+            print("Install with: pip install sounddevice (or pyaudio)")
             return False
 
     def start(self) -> bool:
@@ -105,6 +406,9 @@ class AudioCapture:
         if self.is_capturing:
             return True
 
+        if self._start_sounddevice():
+            return True
+
         if not self._init_pyaudio():
             return False
 
@@ -130,6 +434,11 @@ class AudioCapture:
     def stop(self):
         """Stop audio capture."""
         self.is_capturing = False
+        if self._sd_stream:
+            self._sd_stream.stop()
+            self._sd_stream.close()
+            self._sd_stream = None
+
         if self.capture_thread:
             self.capture_thread.join(timeout=1.0)
 
@@ -143,30 +452,75 @@ class AudioCapture:
             self._pyaudio = None
 
     def _capture_loop(self):
-        """Continuously capture audio chunks."""
+        """Continuously capture audio chunks into ring slots."""
+        _set_realtime_priority()
+        ring = self.audio_ring
+        errors = 0
         while self.is_capturing:
             try:
                 data = self._stream.read(self.config.chunk_size, exception_on_overflow=False)
-                self.audio_queue.put(data)
             except Exception as e:
-                if self.is_capturing:
-                    print(f"Audio capture error: {e}")
-                break
-
-    def get_chunk(self, timeout: float = 0.1) -> Optional[bytes]:
-        """Get next audio chunk."""
-        try:
-            return self.audio_queue.get(timeout=timeout)
-        except queue.Empty:
-            return None
+                if not self.is_capturing:
+                    break
+                errors += 1
+                self._warn("Audio capture error (%d in a row): %s", errors, e)
+                if errors >= MAX_AUDIO_ERRORS:
+                    logger.error("Audio capture stopped after %d consecutive errors", errors)
+                    break
+                continue
+            errors = 0
+
+            slot = ring.reserve()
+            if slot is not None:
+                # Chunks are slot-sized, so one copy lands the whole read
+                n = min(len(data), ring.slot_size)
+                slot[:n] = memoryview(data)[:n]
+                ring.commit(n)
+            else:
+                self.dropped += 1
+                self._warn("Audio capture falling behind, %d chunks dropped", self.dropped)
+
+    def get_chunk(self, timeout: float = 0.1) -> Optional[memoryview]:
+        """Get next audio chunk (a view that is valid until the next call)."""
+        return self.audio_ring.get(timeout=timeout)
+
+    def get_audio_level(self, data: memoryview, gate_silence: bool = False) -> float:
+        """
+        Calculate audio level for voice activity detection.
 
-    def get_audio_level(self, data: bytes) -> float:
-        """Calculate audio level for voice activity detection."""
+        Args:
+            data: 16-bit little-endian PCM
+            gate_silence: Report chunks whose peak sample is below
+                silence_threshold as 0.0 without computing the RMS. Cheap
+                for a level display, but the VAD needs the true level:
+                quiet chunks still count toward its rolling mean.
+        """
         if not data:
             return 0.0
 
+        if np is not None:
+            samples = np.frombuffer(data, dtype='<i2', count=len(data) // 2)
+            if samples.size == 0:
+                return 0.0
+            # max/min rather than abs(): abs(-32768) overflows int16
+            if gate_silence and max(int(samples.max()), -int(samples.min())) < self._silent_peak:
+                return 0.0
+            if _rms_i16 is not None:
+                return _rms_i16(samples) / 32767.0
+            rms = float(np.sqrt(np.square(samples, dtype=np.float32).mean()))
+            return rms / 32767.0
+
+        if audioop is not None:
+            data = data[:len(data) & ~1]
+            if gate_silence and audioop.max(data, 2) < self._silent_peak:
+                return 0.0
+            return audioop.rms(data, 2) / 32767.0
+
         # Convert bytes to samples
-        samples = struct.unpack(f'{len(data)//2}h', data)
+        if len(data) == self._chunk_struct.size:
+            samples = self._chunk_struct.unpack(data)
+        else:
+            samples = struct.unpack_from(f'<{len(data)//2}h', data)
         if not samples:
             return 0.0
 
@@ -186,7 +540,9 @@ class AudioPlayback:
     def __init__(self, config: LiveConfig):
         self.config = config
         self.is_playing = False
-        self.audio_queue: queue.Queue = queue.Queue()
+        self.audio_ring = _new_audio_ring(config)
+        self.dropped = 0
+        self._warn = _RateLimitedWarning()
         self.playback_thread: Optional[threading.Thread] = None
         self._pyaudio = None
         self._stream = None
@@ -244,58 +600,92 @@ class AudioPlayback:
 
     def _playback_loop(self):
         """Play queued audio chunks."""
+        _set_realtime_priority()
+        errors = 0
         while self.is_playing:
+            data = self.audio_ring.get(timeout=0.1)
+            if data is None:
+                continue
             try:
-                data = self.audio_queue.get(timeout=0.1)
                 self._stream.write(data)
-            except queue.Empty:
-                continue
+                errors = 0
             except Exception as e:
-                if self.is_playing:
-                    print(f"Audio playback error: {e}")
-                break
+                if not self.is_playing:
+                    break
+                errors += 1
+                self._warn("Audio playback error (%d in a row): %s", errors, e)
+                if errors >= MAX_AUDIO_ERRORS:
+                    logger.error("Audio playback stopped after %d consecutive errors", errors)
+                    break
+
+    def play(self, data: memoryview):
+        """Queue audio data for playback (dropped if ~1s is already queued)."""
+        if not self.audio_ring.put(data):
+            self.dropped += 1
+            self._warn("Audio playback falling behind, %d chunks dropped", self.dropped)
+
+
+# Window of chunk levels averaged for VAD decisions (seconds)
+VAD_WINDOW_SECONDS = 0.2
 
-    def play(self, data: bytes):
-        """Queue audio data for playback."""
-        self.audio_queue.put(data)
+# Speech starts when the windowed level exceeds silence_threshold by this factor
+VAD_ON_FACTOR = 1.5
 
 
 class VoiceActivityDetector:
-    """Detects voice activity in audio stream."""
+    """
+    Detects voice activity in audio stream.
+
+    Uses hysteresis over a short rolling window of chunk levels: speech
+    starts when the window mean rises above silence_threshold * VAD_ON_FACTOR
+    and only counts as silent once it falls below silence_threshold.
+    """
 
     def __init__(self, config: LiveConfig):
         self.config = config
         self.is_speaking = False
         self.silence_start: Optional[float] = None
-        self.speech_frames: List[bytes] = []
+        # Grown in place as chunks arrive; copied out once per utterance
+        self.speech_buf = bytearray()
 
-    def process_chunk(self, chunk: bytes, level: float) -> Optional[bytes]:
+        window = max(1, int(VAD_WINDOW_SECONDS * config.sample_rate / config.chunk_size))
+        self.level_ring: collections.deque = collections.deque(maxlen=window)
+        self.on_threshold = config.silence_threshold * VAD_ON_FACTOR
+        self.off_threshold = config.silence_threshold
+
+    def process_chunk(self, chunk: memoryview, level: float, now: Optional[float] = None) -> Optional[bytes]:
         """
         Process an audio chunk and detect speech.
 
         Args:
-            chunk: Audio data
+            chunk: Audio data (copied into the utterance buffer, not kept)
             level: Audio level (0-1)
+            now: time.monotonic() for this chunk (read here if not given)
 
         Returns:
             Complete utterance when speech ends, None otherwise
         """
-        if level > self.config.silence_threshold:
+        self.level_ring.append(level)
+        avg = sum(self.level_ring) / len(self.level_ring)
+
+        if avg > (self.off_threshold if self.is_speaking else self.on_threshold):
             # Voice detected
             self.is_speaking = True
             self.silence_start = None
-            self.speech_frames.append(chunk)
+            self.speech_buf += chunk
 
         elif self.is_speaking:
             # In speech but current frame is silent
-            self.speech_frames.append(chunk)
+            self.speech_buf += chunk
 
+            if now is None:
+                now = time.monotonic()
             if self.silence_start is None:
-                self.silence_start = time.time()
-            elif time.time() - self.silence_start > self.config.silence_duration:
+                self.silence_start = now
+            elif now - self.silence_start > self.config.silence_duration:
                 # End of utterance
-                utterance = b''.join(self.speech_frames)
-                self.speech_frames = []
+                utterance = bytes(self.speech_buf)
+                del self.speech_buf[:]
                 self.is_speaking = False
                 self.silence_start = None
                 return utterance
@@ -378,6 +768,146 @@ class SimulatedLiveClient(LiveAPIClient):
         yield {"type": "text", "content": "Simulated response"}
 
 
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create an event loop, using uvloop's faster one if installed."""
+    try:
+        import uvloop
+        return uvloop.new_event_loop()
+    except ImportError:
+        return asyncio.new_event_loop()
+
+
+def _run_loop(loop: asyncio.AbstractEventLoop):
+    """Thread target: run loop until stopped, then close it."""
+    try:
+        loop.run_forever()
+    finally:
+        loop.close()
+
+
+class AsyncLiveAPIClient(LiveAPIClient):
+    """
+    WebSocket Live API client driven by a single asyncio event loop.
+
+    The loop runs on one dedicated thread, so callers keep the synchronous
+    LiveAPIClient interface while the socket is serviced by the loop rather
+    than a thread blocked in recv(). Audio goes out as binary frames and
+    text as JSON frames; received text frames are decoded as JSON.
+
+    Note: Requires the websockets package (14+ for custom headers).
+    """
+
+    def __init__(self, url: str, headers: Dict[str, str] = None, timeout: float = 10.0):
+        self.url = url
+        self.headers = headers or {}
+        self.timeout = timeout
+        self.session: Optional[LiveSession] = None
+        self._ws = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+
+    def _submit(self, coro):
+        """Schedule a coroutine on the client's loop from any thread."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def connect(self, session: LiveSession) -> bool:
+        """Open the WebSocket on the client's event loop."""
+        try:
+            import websockets
+        except ImportError:
+            print("Warning: websockets not installed. Live API connection unavailable.")
+            print("Install with: pip install websockets")
+            return False
+
+        self.session = session
+        session.state = SessionState.CONNECTING
+
+        self._loop = _new_event_loop()
+        self._loop_thread = threading.Thread(target=_run_loop, args=(self._loop,), daemon=True)
+        self._loop_thread.start()
+
+        async def open_socket():
+            if self.headers:
+                return await websockets.connect(self.url, additional_headers=self.headers)
+            return await websockets.connect(self.url)
+
+        try:
+            self._ws = self._submit(open_socket()).result(self.timeout)
+        except Exception as e:
+            print(f"Error connecting to Live API: {e}")
+            self._stop_loop()
+            session.state = SessionState.ERROR
+            return False
+
+        session.state = SessionState.CONNECTED
+        return True
+
+    def _stop_loop(self):
+        """
+        Stop the event loop and wait briefly for its thread.
+
+        The thread closes the loop once run_forever() returns, so a loop
+        still busy after the join is never closed underneath it.
+        """
+        if self._loop:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop = None
+        if self._loop_thread:
+            self._loop_thread.join(timeout=1.0)
+            self._loop_thread = None
+
+    def disconnect(self):
+        """Close the WebSocket and stop the event loop."""
+        if self._ws is not None:
+            try:
+                self._submit(self._ws.close()).result(self.timeout)
+            except Exception:
+                pass
+            self._ws = None
+
+        self._stop_loop()
+        if self.session:
+            self.session.state = SessionState.DISCONNECTED
+
+    def send_audio(self, data: bytes) -> bool:
+        """Queue an audio frame; returns without waiting for the send."""
+        if self._ws is None:
+            return False
+        self._submit(self._ws.send(bytes(data)))
+        return True
+
+    def send_text(self, text: str) -> bool:
+        """Send a text message and wait for it to be written."""
+        if self._ws is None:
+            return False
+        try:
+            self._submit(self._ws.send(json.dumps({"type": "text", "content": text}))).result(self.timeout)
+            return True
+        except Exception as e:
+            print(f"Error sending to Live API: {e}")
+            return False
+
+    def receive(self) -> Generator[Dict[str, Any], None, None]:
+        """Yield messages until the socket closes."""
+        while self._ws is not None:
+            try:
+                message = self._submit(self._ws.recv()).result()
+            except Exception:
+                return
+
+            if isinstance(message, bytes):
+                yield {"type": "audio", "data": message}
+            else:
+                try:
+                    yield json.loads(message)
+                except json.JSONDecodeError:
+                    yield {"type": "text", "content": message}
+
+
+# How long the transcript dispatcher lets callbacks accumulate (one UI frame)
+TRANSCRIPT_DISPATCH_INTERVAL = 0.016
+
+
 class LiveInteractionManager:
     """
     Manages live voice/text interactions.
@@ -405,6 +935,13 @@ class LiveInteractionManager:
         self._running = False
         self._main_thread: Optional[threading.Thread] = None
 
+        # on_transcript runs on a dispatcher thread that drains in batches
+        self._pending_transcripts: collections.deque = collections.deque()
+        self._pending_event = threading.Event()
+        self._dispatching = False
+        self._dispatch_lock = threading.Lock()
+        self._dispatch_thread: Optional[threading.Thread] = None
+
     def start_session(
         self,
         session_id: str = None,
@@ -452,6 +989,10 @@ class LiveInteractionManager:
             self._set_state(SessionState.CONNECTED)
             return False
 
+        if _rms_i16 is not None:
+            # Compile now rather than on the first real chunk
+            _rms_i16(np.zeros(1, dtype='<i2'))
+
         self._set_state(SessionState.LISTENING)
         self._running = True
         self._main_thread = threading.Thread(target=self._listen_loop, daemon=True)
@@ -479,6 +1020,8 @@ class LiveInteractionManager:
         if self.client:
             self.client.disconnect()
 
+        self._stop_dispatcher()
+
         self._set_state(SessionState.DISCONNECTED)
         self.session = None
 
@@ -504,13 +1047,19 @@ class LiveInteractionManager:
 
     def _listen_loop(self):
         """Main listening loop."""
+        # Bound once: these run for every chunk
+        get_chunk = self.audio_capture.get_chunk
+        get_audio_level = self.audio_capture.get_audio_level
+        process_chunk = self.vad.process_chunk
+        monotonic = time.monotonic
+
         while self._running:
-            chunk = self.audio_capture.get_chunk()
+            chunk = get_chunk()
             if not chunk:
                 continue
 
-            level = self.audio_capture.get_audio_level(chunk)
-            utterance = self.vad.process_chunk(chunk, level)
+            # Every level feeds the VAD's rolling window, so none can be skipped
+            utterance = process_chunk(chunk, get_audio_level(chunk), monotonic())
 
             if utterance:
                 # Complete utterance detected
@@ -541,18 +1090,61 @@ class LiveInteractionManager:
 
     def _add_transcript(self, speaker: str, text: str):
         """Add a transcript entry."""
-        transcript = Transcript(
-            timestamp=time.time(),
-            speaker=speaker,
-            text=text
-        )
+        now = time.time()
 
         if self.session:
-            self.session.transcripts.append(transcript)
-            self.session.last_activity = time.time()
+            self.session.transcripts.add(now, speaker, text)
+            self.session.last_activity = now
 
         if self.on_transcript:
-            self.on_transcript(transcript)
+            # Hand off instead of calling here: deque appends need no lock,
+            # and the dispatcher wakes once per batch rather than per entry
+            self._pending_transcripts.append(Transcript(
+                timestamp=now,
+                speaker=speaker,
+                text=text
+            ))
+            self._pending_event.set()
+            if not self._dispatching:
+                self._start_dispatcher()
+
+    def _start_dispatcher(self):
+        """Start the thread that delivers on_transcript callbacks."""
+        with self._dispatch_lock:
+            if self._dispatching:
+                return
+            self._dispatching = True
+            self._dispatch_thread = threading.Thread(target=self._dispatch_loop, daemon=True)
+            self._dispatch_thread.start()
+
+    def _stop_dispatcher(self):
+        """Deliver pending transcripts and stop the dispatcher thread."""
+        if not self._dispatching:
+            return
+        self._dispatching = False
+        self._pending_event.set()
+        if self._dispatch_thread:
+            self._dispatch_thread.join(timeout=1.0)
+            self._dispatch_thread = None
+
+    def _dispatch_loop(self):
+        """Deliver queued transcripts, coalescing bursts into one wakeup."""
+        while True:
+            self._pending_event.wait()
+            if self._dispatching:
+                # Let a frame's worth of transcripts accumulate
+                time.sleep(TRANSCRIPT_DISPATCH_INTERVAL)
+            self._pending_event.clear()
+
+            while self._pending_transcripts:
+                transcript = self._pending_transcripts.popleft()
+                try:
+                    self.on_transcript(transcript)
+                except Exception as e:
+                    print(f"Transcript callback error: {e}")
+
+            if not self._dispatching:
+                return
 
     def _set_state(self, state: SessionState):
         """Update session state."""
@@ -564,7 +1156,11 @@ class LiveInteractionManager:
 
     def get_transcripts(self) -> List[Transcript]:
         """Get all transcripts from current session."""
-        return self.session.transcripts if self.session else []
+        return list(self.session.transcripts) if self.session else []
+
+    def get_transcript_table(self) -> Optional[TranscriptTable]:
+        """The current session's column-oriented transcripts, without copying."""
+        return self.session.transcripts if self.session else None
 
     def export_transcripts(self, path: str, format: str = "json") -> bool:
         """
@@ -583,28 +1179,34 @@ class LiveInteractionManager:
         try:
             output_path = Path(path).expanduser().resolve()
 
+            table = self.session.transcripts
+
             if format == "json":
+                # Build records straight from the columns, no Transcript objects
                 data = {
                     "session_id": self.session.session_id,
                     "start_time": self.session.start_time,
                     "transcripts": [
                         {
-                            "timestamp": t.timestamp,
-                            "speaker": t.speaker,
-                            "text": t.text,
-                            "confidence": t.confidence
+                            "timestamp": timestamp,
+                            "speaker": speaker,
+                            "text": text,
+                            "confidence": confidence
                         }
-                        for t in self.session.transcripts
+                        for timestamp, speaker, text, confidence in zip(
+                            table.timestamps, table.speakers, table.texts, table.confidences
+                        )
                     ]
                 }
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2)
+                output_path.write_bytes(_dump_json(data))
 
             elif format == "txt":
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    for t in self.session.transcripts:
-                        timestamp = time.strftime('%H:%M:%S', time.localtime(t.timestamp))
-                        f.write(f"[{timestamp}] {t.speaker}: {t.text}\n")
+                strftime, localtime = time.strftime, time.localtime
+                lines = [
+                    f"[{strftime('%H:%M:%S', localtime(timestamp))}] {speaker}: {text}\n"
+                    for timestamp, speaker, text in zip(table.timestamps, table.speakers, table.texts)
+                ]
+                output_path.write_text(''.join(lines), encoding='utf-8')
 
             return True
 
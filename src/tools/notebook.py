@@ -12,12 +12,259 @@ Mirrors Claude Code's NotebookEdit capability for parity.
 """
 
 import json
+import mmap
+import re
 import subprocess
 import sys
 import os
 from pathlib import Path
 from typing import Tuple, Optional, List, Dict, Any, Union
 
+from .filesystem import _atomic_write, expand_path, resolve_path
+
+# orjson parses and serializes notebooks in C; stdlib json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# ijson (C yajl2 backend when available) lets read_notebook summarize cells
+# without building output objects; full parsing is the fallback
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Cell types nbformat v4 defines
+_VALID_TYPES = frozenset({'code', 'markdown', 'raw'})
+
+# Notebooks at least this large are parsed straight from a read-only mapping
+_MMAP_NB_BYTES = 64 * 1024
+
+# ...and above this size the kernel is told to read ahead sequentially
+_SEQUENTIAL_NB_BYTES = 16 * 1024 * 1024
+
+
+def _nb_path(path: str) -> Path:
+    """
+    Expand ~ and make a notebook path absolute.
+
+    Purely lexical - no realpath walk. Opening the file follows any
+    symlinks anyway, and _atomic_write writes through a symlinked notebook.
+    """
+    return Path(os.path.abspath(expand_path(path)))
+
+
+def _load_nb(notebook_path: Path) -> Dict[str, Any]:
+    """Read and parse a notebook file."""
+    with open(notebook_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if orjson is not None and size >= _MMAP_NB_BYTES:
+            # orjson parses the mapped pages directly - no bytes copy
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if size >= _SEQUENTIAL_NB_BYTES and hasattr(mm, 'madvise'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                with memoryview(mm) as view:
+                    try:
+                        return orjson.loads(view)
+                    except orjson.JSONDecodeError:
+                        data = view.tobytes()
+        else:
+            data = f.read()
+
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity, which stdlib json (and Jupyter) accept
+            pass
+    return json.loads(data)
+
+
+def _write_nb(notebook_path: Path, data: bytes):
+    """Write serialized notebook bytes to disk atomically."""
+    # A temp file + rename means a crash mid-write never leaves a
+    # truncated notebook behind
+    _atomic_write(notebook_path, data)
+
+
+def _dump_nb(notebook_path: Path, notebook: Dict[str, Any], pretty: bool = False):
+    """
+    Serialize a notebook and write it to disk.
+
+    Compact by default: indentation adds 30-50% to output-heavy notebooks,
+    and the next load has to parse all of it. Pass pretty=True for
+    indented, diff-friendly output.
+    """
+    if orjson is not None:
+        option = orjson.OPT_APPEND_NEWLINE
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        data = orjson.dumps(notebook, option=option)
+    elif pretty:
+        data = (json.dumps(notebook, indent=1) + '\n').encode('utf-8')
+    else:
+        data = (json.dumps(notebook, separators=(',', ':')) + '\n').encode('utf-8')
+    _write_nb(notebook_path, data)
+
+
+# Structural JSON tokens: whole strings and punctuation. Numbers and literals
+# are skipped by finditer, which is all the cell locator needs.
+_JSON_TOKEN = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{},]')
+
+
+def _locate_cell_source(buf, cell_index: int) -> Optional[Tuple[int, int]]:
+    """
+    Find the byte range of cells[cell_index]['source'] in a notebook file.
+
+    Only walks the token structure - strings (including large base64
+    outputs) are matched in C and never decoded. Returns None when the
+    notebook doesn't have the expected shape so callers can fall back to a
+    full parse.
+    """
+    # Frames are [is_object, current_key, expecting_key, role]
+    stack = []
+    cell = -1
+    source_start = 0
+    found = None
+
+    for m in _JSON_TOKEN.finditer(buf):
+        start = m.start()
+        c = buf[start]
+        top = stack[-1] if stack else None
+
+        if c == 0x22:  # "
+            if top is not None and top[0] and top[2]:
+                top[1] = buf[start + 1:m.end() - 1]
+                top[2] = False
+            elif top is not None and top[3] == 'cell' and top[1] == b'source':
+                found = (start, m.end())
+        elif c == 0x7B or c == 0x5B:  # { [
+            role = None
+            if top is None:
+                role = 'root'
+            elif top[3] == 'root' and top[1] == b'cells' and c == 0x5B:
+                role = 'cells'
+            elif top[3] == 'cells' and c == 0x7B:
+                cell += 1
+                if cell == cell_index:
+                    role = 'cell'
+            elif top[3] == 'cell' and top[1] == b'source' and c == 0x5B:
+                role = 'source'
+                source_start = start
+            stack.append([c == 0x7B, None, c == 0x7B, role])
+        elif c == 0x7D or c == 0x5D:  # } ]
+            if not stack:
+                return None
+            role = stack.pop()[3]
+            if role == 'source':
+                found = (source_start, m.end())
+            elif role == 'cell':
+                return found
+            elif role == 'cells' or role == 'root':
+                return None
+        elif top is not None and top[0]:  # , inside an object
+            top[2] = True
+
+    return None
+
+
+def _splice_cell_source(notebook_path: Path, cell_index: int, source: Any) -> bool:
+    """
+    Replace one cell's source without re-encoding the rest of the notebook.
+
+    The new fragment is spliced between the original bytes on either side,
+    so a large notebook's outputs are copied rather than round-tripped
+    through the JSON codec. Returns False if the cell couldn't be located.
+    """
+    with open(notebook_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= _MMAP_NB_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                span = _locate_cell_source(mm, cell_index)
+                if span is None:
+                    return False
+                head, tail = mm[:span[0]], mm[span[1]:]
+        else:
+            data = f.read()
+            span = _locate_cell_source(data, cell_index)
+            if span is None:
+                return False
+            head, tail = data[:span[0]], data[span[1]:]
+
+    if orjson is not None:
+        fragment = orjson.dumps(source)
+    else:
+        fragment = json.dumps(source).encode('utf-8')
+    _write_nb(notebook_path, b''.join((head, fragment, tail)))
+    return True
+
+
+def _as_text(value: Union[str, List[str]]) -> str:
+    """Flatten a multiline nbformat string, which may be a str or a list of lines."""
+    return value if isinstance(value, str) else ''.join(value)
+
+
+# Characters of cell source shown in read_notebook summaries
+_PREVIEW_CHARS = 200
+
+
+def _scan_summary(notebook_path: Path) -> Tuple[Dict[str, str], List[Tuple[str, str, int]]]:
+    """
+    Stream a notebook for read_notebook, skipping output bodies.
+
+    Returns:
+        (metadata fields, [(cell_type, source_head, output_count), ...]);
+        source_head keeps just enough of the source to build the preview
+    """
+    meta = {'kernel': 'Unknown', 'language': 'Unknown'}
+    cells = []
+    cell_type = 'unknown'
+    source: List[str] = []
+    source_len = 0
+    outputs = 0
+
+    with open(notebook_path, 'rb') as f:
+        for prefix, event, value in ijson.parse(f):
+            if prefix == 'cells.item':
+                if event == 'start_map':
+                    cell_type, source, source_len, outputs = 'unknown', [], 0, 0
+                elif event == 'end_map':
+                    cells.append((cell_type, ''.join(source), outputs))
+            elif prefix == 'cells.item.cell_type':
+                cell_type = value
+            elif prefix in ('cells.item.source', 'cells.item.source.item'):
+                # One character past the preview is enough to know it was cut
+                if event == 'string' and source_len <= _PREVIEW_CHARS:
+                    source.append(value)
+                    source_len += len(value)
+            elif prefix == 'cells.item.outputs.item' and event == 'start_map':
+                outputs += 1
+            elif prefix == 'metadata.kernelspec.display_name':
+                meta['kernel'] = value
+            elif prefix == 'metadata.language_info.name':
+                meta['language'] = value
+
+    return meta, cells
+
+
+def _stream_cell(notebook_path: Path, cell_index: int) -> Tuple[Optional[Dict[str, Any]], int]:
+    """
+    Stream cells until cell_index, without building the ones after it.
+
+    Returns:
+        (cell or None, number of cells seen) - when the index is past the
+        end, the count is the notebook's cell count
+    """
+    count = 0
+    with open(notebook_path, 'rb') as f:
+        for cell in ijson.items(f, 'cells.item', use_float=True):
+            if count == cell_index:
+                return cell, count + 1
+            count += 1
+    return None, count
+
 
 def read_notebook(path: str) -> Tuple[bool, str]:
     """
@@ -29,7 +276,7 @@ def read_notebook(path: str) -> Tuple[bool, str]:
     Returns:
         Tuple of (success: bool, notebook_summary: str)
     """
-    notebook_path = Path(path).expanduser().resolve()
+    notebook_path = _nb_path(path)
 
     if not notebook_path.exists():
         return False, f"Notebook not found: {path}"
@@ -38,32 +285,46 @@ def read_notebook(path: str) -> Tuple[bool, str]:
         return False, f"Not a Jupyter notebook: {path}"
 
     try:
-        with open(notebook_path, 'r', encoding='utf-8') as f:
-            notebook = json.load(f)
-
-        cells = notebook.get('cells', [])
-        metadata = notebook.get('metadata', {})
+        summary = None
+        if ijson is not None:
+            try:
+                summary = _scan_summary(notebook_path)
+            except ijson.JSONError:
+                # Let the full parser decide (it accepts NaN, and reports errors)
+                pass
+
+        if summary is None:
+            notebook = _load_nb(notebook_path)
+            metadata = notebook.get('metadata', {})
+            summary = (
+                {
+                    'kernel': metadata.get('kernelspec', {}).get('display_name', 'Unknown'),
+                    'language': metadata.get('language_info', {}).get('name', 'Unknown'),
+                },
+                [
+                    (cell.get('cell_type', 'unknown'), _as_text(cell.get('source', '')),
+                     len(cell.get('outputs', [])))
+                    for cell in notebook.get('cells', [])
+                ]
+            )
+        meta, cells = summary
 
         # Build summary
         lines = [
             f"Notebook: {notebook_path.name}",
             f"Cells: {len(cells)}",
-            f"Kernel: {metadata.get('kernelspec', {}).get('display_name', 'Unknown')}",
-            f"Language: {metadata.get('language_info', {}).get('name', 'Unknown')}",
+            f"Kernel: {meta['kernel']}",
+            f"Language: {meta['language']}",
             "",
             "--- Cells ---"
         ]
 
-        for i, cell in enumerate(cells):
-            cell_type = cell.get('cell_type', 'unknown')
-            source = ''.join(cell.get('source', []))
-
+        for i, (cell_type, source, outputs) in enumerate(cells):
             # Truncate long cells
-            preview = source[:200] + '...' if len(source) > 200 else source
+            preview = source[:_PREVIEW_CHARS] + '...' if len(source) > _PREVIEW_CHARS else source
             preview = preview.replace('\n', '\\n')
 
-            outputs = cell.get('outputs', [])
-            output_info = f" [{len(outputs)} outputs]" if outputs else ""
+            output_info = f" [{outputs} outputs]" if outputs else ""
 
             lines.append(f"[{i}] {cell_type}{output_info}: {preview}")
 
@@ -86,20 +347,33 @@ def get_cell(path: str, cell_index: int) -> Tuple[bool, str]:
     Returns:
         Tuple of (success: bool, cell_content: str)
     """
-    notebook_path = Path(path).expanduser().resolve()
+    notebook_path = _nb_path(path)
 
     try:
-        with open(notebook_path, 'r', encoding='utf-8') as f:
-            notebook = json.load(f)
+        cell = None
+        if ijson is not None and cell_index >= 0:
+            # Stop parsing at the requested cell; a negative index still
+            # needs the cell count for the error, so it loads in full
+            try:
+                cell, count = _stream_cell(notebook_path, cell_index)
+            except ijson.JSONError:
+                pass
+            else:
+                if cell is None:
+                    return False, f"Cell index {cell_index} out of range (0-{count-1})"
 
-        cells = notebook.get('cells', [])
+        if cell is None:
+            notebook = _load_nb(notebook_path)
 
-        if cell_index < 0 or cell_index >= len(cells):
-            return False, f"Cell index {cell_index} out of range (0-{len(cells)-1})"
+            cells = notebook.get('cells', [])
+
+            if cell_index < 0 or cell_index >= len(cells):
+                return False, f"Cell index {cell_index} out of range (0-{len(cells)-1})"
+
+            cell = cells[cell_index]
 
-        cell = cells[cell_index]
         cell_type = cell.get('cell_type', 'unknown')
-        source = ''.join(cell.get('source', []))
+        source = _as_text(cell.get('source', ''))
         outputs = cell.get('outputs', [])
 
         result = [
@@ -113,12 +387,12 @@ def get_cell(path: str, cell_index: int) -> Tuple[bool, str]:
             for i, output in enumerate(outputs):
                 output_type = output.get('output_type', 'unknown')
                 if output_type == 'stream':
-                    text = ''.join(output.get('text', []))
+                    text = _as_text(output.get('text', ''))
                     result.append(f"[stream] {text}")
                 elif output_type == 'execute_result':
                     data = output.get('data', {})
                     if 'text/plain' in data:
-                        result.append(f"[result] {''.join(data['text/plain'])}")
+                        result.append(f"[result] {_as_text(data['text/plain'])}")
                 elif output_type == 'error':
                     ename = output.get('ename', 'Error')
                     evalue = output.get('evalue', '')
@@ -130,6 +404,24 @@ def get_cell(path: str, cell_index: int) -> Tuple[bool, str]:
         return False, f"Error reading cell: {e}"
 
 
+def _apply_cell_edit(cell: Dict[str, Any], new_content: str, cell_type: Optional[str]):
+    """Set a cell's source and, optionally, convert its type."""
+    cell['source'] = new_content
+
+    # Update cell type if specified
+    if cell_type and cell_type in _VALID_TYPES:
+        cell['cell_type'] = cell_type
+        # Clear outputs if converting to non-code cell
+        if cell_type != 'code':
+            cell.pop('outputs', None)
+            cell.pop('execution_count', None)
+        else:
+            if 'outputs' not in cell:
+                cell['outputs'] = []
+            if 'execution_count' not in cell:
+                cell['execution_count'] = None
+
+
 def edit_cell(
     path: str,
     cell_index: int,
@@ -148,38 +440,62 @@ def edit_cell(
     Returns:
         Tuple of (success: bool, message: str)
     """
-    notebook_path = Path(path).expanduser().resolve()
+    # Source-only edits patch the cell in place; changing the type
+    # touches other fields, so that goes through a full rewrite
+    if not cell_type and cell_index >= 0:
+        try:
+            if _splice_cell_source(_nb_path(path), cell_index, new_content):
+                return True, f"Cell [{cell_index}] updated successfully"
+        except Exception as e:
+            return False, f"Error editing cell: {e}"
+
+    return edit_cells(path, [(cell_index, new_content, cell_type)])
+
+
+def edit_cells(
+    path: str,
+    edits: List[Union[Tuple[int, str], Tuple[int, str, Optional[str]]]]
+) -> Tuple[bool, str]:
+    """
+    Edit several cells with a single load and write of the notebook.
+
+    Args:
+        path: Path to the notebook
+        edits: (cell_index, new_content) or (cell_index, new_content, cell_type)
+               tuples, applied in order
+
+    Returns:
+        Tuple of (success: bool, message: str)
+    """
+    notebook_path = _nb_path(path)
+
+    if not edits:
+        return False, "No edits given"
 
     try:
-        with open(notebook_path, 'r', encoding='utf-8') as f:
-            notebook = json.load(f)
+        notebook = _load_nb(notebook_path)
 
         cells = notebook.get('cells', [])
 
-        if cell_index < 0 or cell_index >= len(cells):
-            return False, f"Cell index {cell_index} out of range (0-{len(cells)-1})"
-
-        # Update the cell
-        cells[cell_index]['source'] = new_content.split('\n')
+        # Check every index before touching anything, so a bad edit
+        # leaves the notebook unchanged
+        for edit in edits:
+            cell_index = edit[0]
+            if cell_index < 0 or cell_index >= len(cells):
+                return False, f"Cell index {cell_index} out of range (0-{len(cells)-1})"
 
-        # Update cell type if specified
-        if cell_type and cell_type in ('code', 'markdown', 'raw'):
-            cells[cell_index]['cell_type'] = cell_type
-            # Clear outputs if converting to non-code cell
-            if cell_type != 'code':
-                cells[cell_index].pop('outputs', None)
-                cells[cell_index].pop('execution_count', None)
-            else:
-                if 'outputs' not in cells[cell_index]:
-                    cells[cell_index]['outputs'] = []
-                if 'execution_count' not in cells[cell_index]:
-                    cells[cell_index]['execution_count'] = None
+        for edit in edits:
+            cell_index, new_content = edit[0], edit[1]
+            cell_type = edit[2] if len(edit) > 2 else None
+            _apply_cell_edit(cells[cell_index], new_content, cell_type)
 
         # Write back
-        with open(notebook_path, 'w', encoding='utf-8') as f:
-            json.dump(notebook, f, indent=1)
+        _dump_nb(notebook_path, notebook)
 
-        return True, f"Cell [{cell_index}] updated successfully"
+        if len(edits) == 1:
+            return True, f"Cell [{edits[0][0]}] updated successfully"
+        indices = ', '.join(f"[{edit[0]}]" for edit in edits)
+        return True, f"{len(edits)} cells updated successfully: {indices}"
 
     except Exception as e:
         return False, f"Error editing cell: {e}"
@@ -203,14 +519,13 @@ def insert_cell(
     Returns:
         Tuple of (success: bool, message: str)
     """
-    notebook_path = Path(path).expanduser().resolve()
+    notebook_path = _nb_path(path)
 
-    if cell_type not in ('code', 'markdown', 'raw'):
+    if cell_type not in _VALID_TYPES:
         return False, f"Invalid cell type: {cell_type}. Use 'code', 'markdown', or 'raw'"
 
     try:
-        with open(notebook_path, 'r', encoding='utf-8') as f:
-            notebook = json.load(f)
+        notebook = _load_nb(notebook_path)
 
         cells = notebook.get('cells', [])
 
@@ -220,7 +535,7 @@ def insert_cell(
         # Create new cell
         new_cell = {
             'cell_type': cell_type,
-            'source': content.split('\n'),
+            'source': content,
             'metadata': {}
         }
 
@@ -232,8 +547,7 @@ def insert_cell(
         cells.insert(insert_index, new_cell)
 
         # Write back
-        with open(notebook_path, 'w', encoding='utf-8') as f:
-            json.dump(notebook, f, indent=1)
+        _dump_nb(notebook_path, notebook)
 
         return True, f"Inserted {cell_type} cell at index [{insert_index}]"
 
@@ -252,11 +566,10 @@ def delete_notebook_cell(path: str, cell_index: int) -> Tuple[bool, str]:
     Returns:
         Tuple of (success: bool, message: str)
     """
-    notebook_path = Path(path).expanduser().resolve()
+    notebook_path = _nb_path(path)
 
     try:
-        with open(notebook_path, 'r', encoding='utf-8') as f:
-            notebook = json.load(f)
+        notebook = _load_nb(notebook_path)
 
         cells = notebook.get('cells', [])
 
@@ -266,8 +579,7 @@ def delete_notebook_cell(path: str, cell_index: int) -> Tuple[bool, str]:
         deleted_type = cells[cell_index].get('cell_type', 'unknown')
         del cells[cell_index]
 
-        with open(notebook_path, 'w', encoding='utf-8') as f:
-            json.dump(notebook, f, indent=1)
+        _dump_nb(notebook_path, notebook)
 
         return True, f"Deleted {deleted_type} cell at index [{cell_index}]"
 
@@ -287,11 +599,10 @@ def move_cell(path: str, from_index: int, to_index: int) -> Tuple[bool, str]:
     Returns:
         Tuple of (success: bool, message: str)
     """
-    notebook_path = Path(path).expanduser().resolve()
+    notebook_path = _nb_path(path)
 
     try:
-        with open(notebook_path, 'r', encoding='utf-8') as f:
-            notebook = json.load(f)
+        notebook = _load_nb(notebook_path)
 
         cells = notebook.get('cells', [])
 
@@ -309,8 +620,7 @@ def move_cell(path: str, from_index: int, to_index: int) -> Tuple[bool, str]:
         # Insert at new position
         cells.insert(to_index, cell)
 
-        with open(notebook_path, 'w', encoding='utf-8') as f:
-            json.dump(notebook, f, indent=1)
+        _dump_nb(notebook_path, notebook)
 
         return True, f"Moved cell from [{from_index}] to [{to_index}]"
 
@@ -318,6 +628,11 @@ def move_cell(path: str, from_index: int, to_index: int) -> Tuple[bool, str]:
         return False, f"Error moving cell: {e}"
 
 
+def _decode_output(data: bytes) -> str:
+    """Decode captured nbconvert output."""
+    return data.decode('utf-8', errors='replace')
+
+
 def execute_notebook(
     path: str,
     timeout: int = 300,
@@ -336,7 +651,7 @@ def execute_notebook(
     Returns:
         Tuple of (success: bool, execution_result: str)
     """
-    notebook_path = Path(path).expanduser().resolve()
+    notebook_path = _nb_path(path)
 
     if not notebook_path.exists():
         return False, f"Notebook not found: {path}"
@@ -355,17 +670,17 @@ def execute_notebook(
         cmd.append(f'--ExecutePreprocessor.kernel_name={kernel}')
 
     try:
+        # Captured as bytes: the output is only decoded if it gets reported
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
             timeout=timeout + 60  # Extra time for startup
         )
 
         if result.returncode == 0:
             return True, f"Notebook executed successfully. Check outputs in: {notebook_path}"
         else:
-            error = result.stderr or result.stdout or "Unknown error"
+            error = _decode_output(result.stderr or result.stdout) or "Unknown error"
             return False, f"Execution failed: {error}"
 
     except subprocess.TimeoutExpired:
@@ -393,7 +708,8 @@ def create_notebook(
     Returns:
         Tuple of (success: bool, message: str)
     """
-    notebook_path = Path(path).expanduser().resolve()
+    # Full resolution here: the path is about to be created
+    notebook_path = resolve_path(path)
 
     if notebook_path.exists():
         return False, f"File already exists: {path}"
@@ -427,7 +743,7 @@ def create_notebook(
 
             cell = {
                 'cell_type': cell_type,
-                'source': content.split('\n'),
+                'source': content,
                 'metadata': {}
             }
 
@@ -439,8 +755,7 @@ def create_notebook(
 
     try:
         notebook_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(notebook_path, 'w', encoding='utf-8') as f:
-            json.dump(notebook, f, indent=1)
+        _dump_nb(notebook_path, notebook)
 
         return True, f"Created notebook: {notebook_path}"
 
@@ -466,7 +781,7 @@ def convert_notebook(
     Returns:
         Tuple of (success: bool, message: str)
     """
-    notebook_path = Path(path).expanduser().resolve()
+    notebook_path = _nb_path(path)
 
     if not notebook_path.exists():
         return False, f"Notebook not found: {path}"
@@ -488,14 +803,13 @@ def convert_notebook(
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
             timeout=120
         )
 
         if result.returncode == 0:
-            return True, f"Converted to {output_format}: {result.stdout or 'Success'}"
+            return True, f"Converted to {output_format}: {_decode_output(result.stdout) or 'Success'}"
         else:
-            return False, f"Conversion failed: {result.stderr or result.stdout}"
+            return False, f"Conversion failed: {_decode_output(result.stderr or result.stdout)}"
 
     except FileNotFoundError:
         return False, "nbconvert not installed. Run: pip install nbconvert"
@@ -513,24 +827,27 @@ def clear_outputs(path: str) -> Tuple[bool, str]:
     Returns:
         Tuple of (success: bool, message: str)
     """
-    notebook_path = Path(path).expanduser().resolve()
+    notebook_path = _nb_path(path)
 
     try:
-        with open(notebook_path, 'r', encoding='utf-8') as f:
-            notebook = json.load(f)
+        notebook = _load_nb(notebook_path)
 
-        cells = notebook.get('cells', [])
         cleared_count = 0
+        reset_count = False
 
-        for cell in cells:
-            if cell.get('cell_type') == 'code':
-                if cell.get('outputs'):
+        for cell in notebook.get('cells', []):
+            get = cell.get
+            if get('cell_type') == 'code':
+                if get('outputs'):
                     cell['outputs'] = []
                     cleared_count += 1
-                cell['execution_count'] = None
+                if get('execution_count', 0) is not None:
+                    cell['execution_count'] = None
+                    reset_count = True
 
-        with open(notebook_path, 'w', encoding='utf-8') as f:
-            json.dump(notebook, f, indent=1)
+        # An already-clean notebook is left untouched on disk
+        if cleared_count or reset_count:
+            _dump_nb(notebook_path, notebook)
 
         return True, f"Cleared outputs from {cleared_count} cells"
 
@@ -543,6 +860,7 @@ NOTEBOOK_TOOLS = {
     "read_notebook": read_notebook,
     "get_cell": get_cell,
     "edit_cell": edit_cell,
+    "edit_cells": edit_cells,
     "insert_cell": insert_cell,
     "delete_notebook_cell": delete_notebook_cell,
     "move_cell": move_cell,
@@ -10,16 +10,143 @@ Requirements:
     - On Unix: Install via package manager or cargo install ripgrep
 """
 
+import os
 import subprocess
 import shutil
-from typing import Tuple, Optional
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache, wraps
+from typing import Tuple, Optional, List
+
+from .filesystem import change_generation
+
+
+@lru_cache(maxsize=1)
+def _rg_path() -> Optional[str]:
+    """Absolute path to ripgrep, resolved once per process."""
+    return shutil.which('rg')
 
 
 def check_ripgrep_available() -> bool:
     """Check if ripgrep is installed and available."""
-    return shutil.which('rg') is not None
+    return _rg_path() is not None
+
+
+def _run_rg(cmd: List[str], timeout: int, max_lines: Optional[int] = None) -> Tuple[int, List[str], str, bool]:
+    """
+    Run ripgrep and read its output line by line as it is produced.
+
+    Stops ripgrep as soon as max_lines lines have been read, so a broad
+    pattern over a large tree never buffers more than the caller returns.
 
+    Returns:
+        (returncode, lines, stderr, truncated)
+
+    Raises:
+        subprocess.TimeoutExpired: If ripgrep runs longer than timeout
+    """
+    timed_out = threading.Event()
+    lines: List[str] = []
+    truncated = False
+
+    # stderr goes to a scratch file so a flood of per-file errors can't
+    # fill a pipe nobody is reading
+    with tempfile.TemporaryFile() as err:
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=err,
+            stdin=subprocess.DEVNULL,
+            encoding='utf-8',
+            errors='replace'
+        )
+
+        def _expire():
+            timed_out.set()
+            proc.kill()
+
+        timer = threading.Timer(timeout, _expire)
+        timer.daemon = True
+        timer.start()
+        try:
+            for line in proc.stdout:
+                lines.append(line.rstrip('\r\n'))
+                if max_lines is not None and len(lines) >= max_lines:
+                    truncated = True
+                    proc.kill()
+                    break
+        finally:
+            timer.cancel()
+            proc.stdout.close()
+            returncode = proc.wait()
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout)
+
+        err.seek(0)
+        stderr = err.read().decode('utf-8', errors='replace').strip()
+
+    if truncated:
+        returncode = 0
+    return returncode, lines, stderr, truncated
+
+
+# Identical searches repeated within this many seconds reuse the earlier
+# result. Edits made through the tools invalidate it at once (see
+# change_generation()); other edits show up once the entry expires.
+SEARCH_CACHE_TTL = 2.0
+_SEARCH_CACHE_MAX = 128
+_SEARCH_CACHE: "OrderedDict[tuple, Tuple[float, Tuple[bool, str]]]" = OrderedDict()
+_SEARCH_CACHE_LOCK = threading.Lock()
+
+
+def _root_signature(path: str) -> Optional[tuple]:
+    """
+    Fingerprint of the search root alone: its mtime and size.
 
+    Only the root is stat()ed - nothing below it is walked. Returns None
+    if the path can't be inspected.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _search_cache(func):
+    """Memoize a search tool's successful results; see SEARCH_CACHE_TTL."""
+    @wraps(func)
+    def wrapper(pattern: str, path: str = ".", *args, **kwargs):
+        generation = change_generation()
+        sig = _root_signature(path)
+        if sig is None:
+            return func(pattern, path, *args, **kwargs)
+
+        key = (func.__name__, pattern, os.path.abspath(path), args,
+               tuple(sorted(kwargs.items())), generation, sig)
+        now = time.monotonic()
+        with _SEARCH_CACHE_LOCK:
+            hit = _SEARCH_CACHE.get(key)
+            if hit is not None and now - hit[0] < SEARCH_CACHE_TTL:
+                _SEARCH_CACHE.move_to_end(key)
+                return hit[1]
+
+        result = func(pattern, path, *args, **kwargs)
+        # Errors are never cached
+        if result[0]:
+            with _SEARCH_CACHE_LOCK:
+                _SEARCH_CACHE[key] = (now, result)
+                _SEARCH_CACHE.move_to_end(key)
+                while len(_SEARCH_CACHE) > _SEARCH_CACHE_MAX:
+                    _SEARCH_CACHE.popitem(last=False)
+        return result
+    return wrapper
+
+
+@_search_cache
 def search_code(
     pattern: str,
     path: str = ".",
@@ -45,7 +172,7 @@ def search_code(
 
     try:
         cmd = [
-            'rg',
+            _rg_path(),
             '--line-number',      # Show line numbers
             '--no-heading',       # Don't group by file
             '--color', 'never',   # No ANSI colors
@@ -64,23 +191,26 @@ def search_code(
         cmd.append(pattern)
         cmd.append(path)
 
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=60  # 1 minute timeout
-        )
+        # --max-count is per file, so also cap the total. With context a
+        # match takes up to 2*context_lines+1 lines plus a "--" separator.
+        if context_lines > 0:
+            max_lines = max_results * (2 * context_lines + 2)
+        else:
+            max_lines = max_results
+        returncode, lines, stderr, truncated = _run_rg(cmd, 60, max_lines)
 
         # ripgrep returns 0 for matches, 1 for no matches, 2+ for errors
-        if result.returncode == 0:
-            output = result.stdout.strip()
+        if returncode == 0:
+            output = '\n'.join(lines).strip()
             if output:
+                if truncated:
+                    output += f"\n\n(Stopped after {max_results} results)"
                 return True, output
             return True, "No matches found."
-        elif result.returncode == 1:
+        elif returncode == 1:
             return True, "No matches found."
         else:
-            error = result.stderr.strip() if result.stderr else "Unknown error"
+            error = stderr or "Unknown error"
             return False, f"Search error: {error}"
 
     except subprocess.TimeoutExpired:
@@ -89,6 +219,7 @@ def search_code(
         return False, f"Search error: {e}"
 
 
+@_search_cache
 def search_files(
     pattern: str,
     path: str = ".",
@@ -110,7 +241,7 @@ def search_files(
 
     try:
         cmd = [
-            'rg',
+            _rg_path(),
             '--files',           # List files only
             '--glob', pattern,   # Match file names
             '--color', 'never',
@@ -121,23 +252,16 @@ def search_files(
 
         cmd.append(path)
 
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+        returncode, files, stderr, _ = _run_rg(cmd, 30)
 
-        if result.returncode == 0:
-            output = result.stdout.strip()
-            if output:
-                files = output.split('\n')
-                return True, f"Found {len(files)} files:\n{output}"
+        if returncode == 0:
+            if files:
+                return True, f"Found {len(files)} files:\n" + '\n'.join(files)
             return True, "No matching files found."
-        elif result.returncode == 1:
+        elif returncode == 1:
             return True, "No matching files found."
         else:
-            error = result.stderr.strip() if result.stderr else "Unknown error"
+            error = stderr or "Unknown error"
             return False, f"Search error: {error}"
 
     except subprocess.TimeoutExpired:
@@ -162,32 +286,33 @@ def grep_count(pattern: str, path: str = ".") -> Tuple[bool, str]:
 
     try:
         cmd = [
-            'rg',
+            _rg_path(),
             '--count',           # Count matches per file
+            '--null',            # NUL after the path, so ':' in names can't confuse parsing
             '--color', 'never',
             pattern,
             path
         ]
 
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
-
-        if result.returncode == 0:
-            output = result.stdout.strip()
-            if output:
-                # Sum up the counts
-                lines = output.split('\n')
-                total = sum(int(line.split(':')[-1]) for line in lines if ':' in line)
+        returncode, lines, stderr, _ = _run_rg(cmd, 60)
+
+        if returncode == 0:
+            if lines:
+                # Sum up the counts. Lines are "path\0count", or just the
+                # count when a single file was searched.
+                total = 0
+                per_file = []
+                for line in lines:
+                    file_path, _, count = line.rpartition('\0')
+                    total += int(count)
+                    per_file.append(f"{file_path}:{count}" if file_path else count)
+                output = '\n'.join(per_file)
                 return True, f"Total matches: {total}\n\nPer file:\n{output}"
             return True, "No matches found."
-        elif result.returncode == 1:
+        elif returncode == 1:
             return True, "No matches found."
         else:
-            error = result.stderr.strip() if result.stderr else "Unknown error"
+            error = stderr or "Unknown error"
             return False, f"Count error: {error}"
 
     except subprocess.TimeoutExpired:
@@ -12,13 +12,53 @@ SECURITY WARNING:
 
 import subprocess
 import os
+import shlex
+import shutil
 import sys
-from typing import Tuple
+from typing import Tuple, Optional, List
+
+from .filesystem import note_change
 
 
 # Default timeout for commands (2 minutes)
 DEFAULT_TIMEOUT = 120
 
+# Anything that needs bash to interpret it: pipes, redirection, expansion,
+# globbing, grouping, comments and multi-line scripts
+_SHELL_METACHARS = frozenset('|&;<>()$`\\*?[]{}~#!\n')
+
+# Keywords and builtins that either don't exist as programs or behave
+# differently from the binary of the same name (e.g. /usr/bin/time)
+_SHELL_WORDS = frozenset({
+    'alias', 'builtin', 'case', 'cd', 'command', 'coproc', 'declare', 'eval',
+    'exec', 'exit', 'export', 'for', 'function', 'if', 'kill', 'read',
+    'select', 'set', 'source', 'time', 'type', 'ulimit', 'umask', 'unset',
+    'until', 'while', '.',
+})
+
+
+def _direct_argv(cmd: str) -> Optional[List[str]]:
+    """
+    Split a simple "program args..." command for running without a shell.
+
+    Returns None whenever bash would do anything beyond word splitting and
+    quote removal, or the program isn't on PATH - the caller then runs the
+    command through bash as before.
+    """
+    if sys.platform == 'win32' or _SHELL_METACHARS.intersection(cmd):
+        return None
+    try:
+        argv = shlex.split(cmd)
+    except ValueError:
+        return None
+    if not argv or argv[0] in _SHELL_WORDS or '=' in argv[0]:
+        return None
+    program = shutil.which(argv[0])
+    if program is None:
+        return None
+    argv[0] = program
+    return argv
+
 
 def run_command(cmd: str, timeout: int = DEFAULT_TIMEOUT) -> Tuple[bool, str]:
     """
@@ -31,6 +71,9 @@ def run_command(cmd: str, timeout: int = DEFAULT_TIMEOUT) -> Tuple[bool, str]:
     Returns:
         Tuple of (success: bool, formatted_output: str)
     """
+    # Any command may write files; invalidate cached searches
+    note_change()
+
     try:
         # Determine shell based on platform
         if sys.platform == 'win32':
@@ -40,7 +83,14 @@ def run_command(cmd: str, timeout: int = DEFAULT_TIMEOUT) -> Tuple[bool, str]:
                 cmd,
                 shell=True,
                 capture_output=True,
-                text=True,
+                timeout=timeout,
+                cwd=os.getcwd()
+            )
+        elif (argv := _direct_argv(cmd)) is not None:
+            # Plain "program args" - exec it directly and skip the shell
+            result = subprocess.run(
+                argv,
+                capture_output=True,
                 timeout=timeout,
                 cwd=os.getcwd()
             )
@@ -51,19 +101,21 @@ def run_command(cmd: str, timeout: int = DEFAULT_TIMEOUT) -> Tuple[bool, str]:
                 shell=True,
                 executable='/bin/bash',
                 capture_output=True,
-                text=True,
                 timeout=timeout,
                 cwd=os.getcwd()
             )
 
-        # Format output
+        # Format output - output is captured as bytes and only the stripped
+        # text that is actually returned gets decoded
         output_parts = []
 
-        if result.stdout.strip():
-            output_parts.append(f"stdout:\n{result.stdout.strip()}")
+        stdout = result.stdout.strip()
+        if stdout:
+            output_parts.append(f"stdout:\n{stdout.decode('utf-8', errors='replace')}")
 
-        if result.stderr.strip():
-            output_parts.append(f"stderr:\n{result.stderr.strip()}")
+        stderr = result.stderr.strip()
+        if stderr:
+            output_parts.append(f"stderr:\n{stderr.decode('utf-8', errors='replace')}")
 
         output_parts.append(f"exit_code: {result.returncode}")
 
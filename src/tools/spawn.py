@@ -18,89 +18,272 @@ Usage:
 The tool automatically distributes across accounts 1 and 2.
 """
 
+import asyncio
+import collections
+import signal
 import subprocess
 import sys
 import os
-from pathlib import Path
+import tempfile
+import threading
 from typing import Tuple, List, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
 import json
 
+from ._gemini_proc import (
+    GEMINI_SCRIPT, gemini_command, gemini_script_available, run_streamed
+)
+# Re-exported: get_git_bash used to be defined in this module
+from ._gemini_proc import get_git_bash  # noqa: F401
 
-# Default gemini script location
-GEMINI_SCRIPT = Path.home() / ".claude" / "scripts" / "gemini-account.sh"
 
+# Most queries one spawn_research call accepts
+MAX_QUERIES = 6
 
-def get_git_bash() -> Optional[Path]:
-    """Find Git Bash on Windows."""
-    if sys.platform != 'win32':
-        return None
+# Accounts queries are spread across, and how many calls each runs at once
+ACCOUNTS = (1, 2)
+ACCOUNT_CONCURRENCY = 2
 
-    paths = [
-        Path("C:/Program Files/Git/usr/bin/bash.exe"),
-        Path("C:/Program Files/Git/bin/bash.exe"),
-    ]
-    for p in paths:
-        if p.exists():
-            return p
-    return None
+# Largest context spawn_with_context copies into each query's argv; bigger
+# ones go through a file (Linux caps a single argument at 128 KiB)
+INLINE_CONTEXT_MAX = 16 * 1024
 
+# Lowercased fragments of a failed response that mean the account is throttled
+_RATE_LIMIT_MARKERS = (
+    'rate limit', 'rate-limit', 'ratelimit', 'quota', 'resource_exhausted',
+    'resource exhausted', 'too many requests', '429',
+)
 
-def call_gemini_sync(query: str, account: int, timeout: int = 180) -> Tuple[bool, str]:
+def _gemini_cmd(
+    query: str,
+    account: int,
+    context_file: Optional[str] = None
+) -> Tuple[Optional[List[str]], str]:
+    """Build the gemini-account.sh command line, or return (None, error)."""
+    if not gemini_script_available():
+        return None, f"gemini-account.sh not found at {GEMINI_SCRIPT}"
+
+    if context_file:
+        # Gemini CLI's @file reference: the CLI reads the context itself,
+        # so it isn't copied into every argv. The CLI only expands paths
+        # inside its workspace (the working directory), so keep it there.
+        query = f"@{context_file}\n\nQuestion: {query}"
+
+    cmd = gemini_command(account, query)
+    if cmd is None:
+        return None, "Git Bash not found"
+    return cmd, ""
+
+
+def _gemini_result(returncode: int, stdout: str, stderr: str) -> Tuple[bool, str]:
+    """Turn a finished gemini-account.sh run into (success, response)."""
+    if returncode != 0:
+        error = stderr.strip() if stderr else "Unknown error"
+        return False, f"Error (exit {returncode}): {error}"
+
+    response = stdout.strip()
+    if not response:
+        return False, "Empty response (possibly rate limited)"
+
+    return True, response
+
+
+def _is_rate_limited(response: str) -> bool:
+    """Whether a failed response looks like the account was throttled."""
+    lowered = response.lower()
+    return any(marker in lowered for marker in _RATE_LIMIT_MARKERS)
+
+
+def call_gemini_sync(
+    query: str,
+    account: int,
+    timeout: int = 180,
+    context_file: Optional[str] = None
+) -> Tuple[bool, str]:
     """
-    Call Gemini synchronously (for use in threads).
+    Call Gemini synchronously.
 
     Args:
         query: The query to send
         account: Account number (1 or 2)
         timeout: Timeout in seconds
+        context_file: Optional file, inside the working directory, whose
+            contents are prepended as context
 
     Returns:
         Tuple of (success: bool, response: str)
     """
-    if not GEMINI_SCRIPT.exists():
-        return False, f"gemini-account.sh not found at {GEMINI_SCRIPT}"
+    cmd, error = _gemini_cmd(query, account, context_file)
+    if cmd is None:
+        return False, error
 
     try:
-        if sys.platform == 'win32':
-            git_bash = get_git_bash()
-            if not git_bash:
-                return False, "Git Bash not found"
-            cmd = [str(git_bash), str(GEMINI_SCRIPT), str(account), query]
-        else:
-            cmd = ["bash", str(GEMINI_SCRIPT), str(account), query]
-
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            cwd=os.getcwd()
-        )
+        return _gemini_result(*run_streamed(cmd, timeout))
+
+    except subprocess.TimeoutExpired:
+        return False, f"Timeout after {timeout}s"
+    except Exception as e:
+        return False, f"Error: {e}"
 
-        if result.returncode != 0:
-            error = result.stderr.strip() if result.stderr else "Unknown error"
-            return False, f"Error (exit {result.returncode}): {error}"
 
-        response = result.stdout.strip()
-        if not response:
-            return False, "Empty response (possibly rate limited)"
+async def _call_gemini_async(
+    query: str,
+    account: int,
+    timeout: int = 180,
+    context_file: Optional[str] = None
+) -> Tuple[bool, str]:
+    """
+    Call Gemini from an event loop.
+
+    Same results as call_gemini_sync, but many of these can wait on their
+    subprocesses concurrently from a single thread.
+    """
+    cmd, error = _gemini_cmd(query, account, context_file)
+    if cmd is None:
+        return False, error
 
-        return True, response
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            start_new_session=sys.platform != 'win32'
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+        except asyncio.TimeoutError:
+            # Kill the script's whole process group: a child left holding
+            # the pipes would keep proc.wait() from returning
+            if sys.platform == 'win32':
+                proc.kill()
+            else:
+                try:
+                    os.killpg(proc.pid, signal.SIGKILL)
+                except OSError:
+                    pass
+            await proc.wait()
+            return False, f"Timeout after {timeout}s"
+
+        return _gemini_result(
+            proc.returncode,
+            stdout.decode('utf-8', errors='replace'),
+            stderr.decode('utf-8', errors='replace')
+        )
 
-    except subprocess.TimeoutExpired:
-        return False, f"Timeout after {timeout}s"
     except Exception as e:
         return False, f"Error: {e}"
 
 
-def spawn_research(queries: List[str], timeout: int = 180) -> Tuple[bool, str]:
+async def _gather_research(
+    queries: List[str],
+    timeout: int,
+    context_file: Optional[str] = None
+) -> List[tuple]:
+    """
+    Run the queries across both accounts with work stealing.
+
+    Queries are dealt out alternately (1, 2, 1, 2...) into one deque per
+    account. Each account runs ACCOUNT_CONCURRENCY workers that take from
+    the front of their own deque and, once it is empty, steal from the back
+    of the other account's - a slow account's backlog is picked up instead
+    of leaving the fast one idle. A stolen query runs on the thief's account.
+
+    Once a query comes back rate limited, that account's workers stop taking
+    new queries (its backlog is left for the other account to steal) rather
+    than each burning a call on a throttled account. Queries no unthrottled
+    account was left to run are reported as skipped.
+
+    Returns:
+        [(account, (success, response) or exception), ...] in query order
+    """
+    # Every len(ACCOUNTS)-th query from offset k goes to the k-th account
+    indexed = list(enumerate(queries))
+    deques = {
+        account: collections.deque(indexed[k::len(ACCOUNTS)])
+        for k, account in enumerate(ACCOUNTS)
+    }
+
+    outcomes: List[Optional[tuple]] = [None] * len(queries)
+    rate_limited = set()
+
+    async def worker(account: int):
+        own = deques[account]
+        others = [deques[a] for a in ACCOUNTS if a != account]
+        while account not in rate_limited:
+            # Single-threaded event loop: no locking needed between workers
+            if own:
+                i, query = own.popleft()
+            else:
+                victim = next((d for d in others if d), None)
+                if victim is None:
+                    return
+                i, query = victim.pop()
+            try:
+                success, response = await _call_gemini_async(
+                    query, account, timeout, context_file
+                )
+            except Exception as e:
+                outcomes[i] = (account, e)
+                continue
+            outcomes[i] = (account, (success, response))
+            if not success and _is_rate_limited(response):
+                rate_limited.add(account)
+
+    await asyncio.gather(*(
+        worker(account)
+        for account in ACCOUNTS
+        for _ in range(ACCOUNT_CONCURRENCY)
+    ))
+
+    # Whatever is still queued had only throttled accounts left to run it
+    for account, pending in deques.items():
+        for i, _query in pending:
+            outcomes[i] = (account, (False, f"Skipped: account {account} is rate limited"))
+    return outcomes
+
+
+def _run_async(coro):
+    """
+    Run a coroutine to completion from synchronous code.
+
+    If this thread is already running an event loop (e.g. the daemon),
+    the coroutine gets its own loop on a helper thread instead.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    outcome = {}
+
+    def runner():
+        try:
+            outcome['result'] = asyncio.run(coro)
+        except BaseException as e:
+            outcome['error'] = e
+
+    thread = threading.Thread(target=runner, name="gemini-spawn")
+    thread.start()
+    thread.join()
+    if 'error' in outcome:
+        raise outcome['error']
+    return outcome['result']
+
+
+def spawn_research(
+    queries: List[str],
+    timeout: int = 180,
+    context_file: Optional[str] = None,
+    dedup: bool = True
+) -> Tuple[bool, str]:
     """
     Spawn parallel Gemini instances to research multiple topics.
 
     Args:
         queries: List of research queries (1-4 recommended)
         timeout: Timeout per query in seconds
+        context_file: Optional file, inside the working directory, whose
+            contents every query gets as context
+        dedup: Run repeated queries once and share the result
 
     Returns:
         Tuple of (success: bool, aggregated_results: str)
@@ -108,50 +291,61 @@ def spawn_research(queries: List[str], timeout: int = 180) -> Tuple[bool, str]:
     if not queries:
         return False, "No queries provided"
 
-    if len(queries) > 6:
-        return False, "Too many queries (max 6 to avoid rate limits)"
+    if len(queries) > MAX_QUERIES:
+        return False, f"Too many queries (max {MAX_QUERIES} to avoid rate limits)"
 
     results = []
     errors = []
 
-    # Use ThreadPoolExecutor for parallel execution
-    with ThreadPoolExecutor(max_workers=2) as executor:
-        # Submit all queries, alternating accounts
-        futures = {}
-        for i, query in enumerate(queries):
-            account = (i % 2) + 1  # Alternate: 1, 2, 1, 2...
-            future = executor.submit(call_gemini_sync, query, account, timeout)
-            futures[future] = (i, query, account)
-
-        # Collect results as they complete
-        for future in as_completed(futures):
-            idx, query, account = futures[future]
-            try:
-                success, response = future.result()
-                if success:
-                    results.append({
-                        "query": query,
-                        "account": account,
-                        "response": response
-                    })
-                else:
-                    errors.append({
-                        "query": query,
-                        "account": account,
-                        "error": response
-                    })
-            except Exception as e:
-                errors.append({
-                    "query": query,
-                    "account": account,
-                    "error": str(e)
-                })
+    if dedup:
+        # Query -> position among the distinct queries, in first-seen order
+        positions = {}
+        for query in queries:
+            positions.setdefault(query, len(positions))
+        to_run = list(positions)
+    else:
+        to_run = queries
+
+    # One event loop waits on all the subprocesses
+    outcomes = _run_async(_gather_research(to_run, timeout, context_file))
+
+    if dedup and len(to_run) < len(queries):
+        outcomes = [outcomes[positions[query]] for query in queries]
+
+    for idx, (query, (account, outcome)) in enumerate(zip(queries, outcomes)):
+        if isinstance(outcome, BaseException):
+            errors.append({
+                "idx": idx,
+                "query": query,
+                "account": account,
+                "error": str(outcome)
+            })
+            continue
+
+        success, response = outcome
+        if success:
+            results.append({
+                "idx": idx,
+                "query": query,
+                "account": account,
+                "response": response
+            })
+        else:
+            errors.append({
+                "idx": idx,
+                "query": query,
+                "account": account,
+                "error": response
+            })
 
     # Format output
-    output_lines = [f"Spawned {len(queries)} parallel research queries:"]
+    header = f"Spawned {len(to_run)} parallel research queries"
+    if len(to_run) < len(queries):
+        header += f" ({len(queries) - len(to_run)} duplicate(s) shared a result)"
+    output_lines = [header + ":"]
     output_lines.append("")
 
-    for r in sorted(results, key=lambda x: queries.index(x["query"])):
+    for r in sorted(results, key=lambda x: x["idx"]):
         output_lines.append(f"=== Query: {r['query'][:50]}... (Account {r['account']}) ===")
         output_lines.append(r["response"])
         output_lines.append("")
@@ -203,9 +397,34 @@ def spawn_with_context(
     Returns:
         Tuple of (success: bool, aggregated_results: str)
     """
-    # Build full queries with context
-    full_queries = [f"{base_context}\n\nQuestion: {q}" for q in queries]
-    return spawn_research(full_queries, timeout)
+    if len(base_context) <= INLINE_CONTEXT_MAX:
+        return spawn_research(
+            [f"{base_context}\n\nQuestion: {q}" for q in queries], timeout
+        )
+
+    # Too big to copy into every argv: write it once and let each query
+    # reference it. Gemini CLI only reads @paths inside its workspace, so
+    # the file goes in the working directory and is passed relative to it.
+    try:
+        with tempfile.NamedTemporaryFile(
+            mode='w', encoding='utf-8', dir=os.getcwd(),
+            prefix='.gemini-context-', suffix='.md', delete=False
+        ) as f:
+            f.write(base_context)
+    except OSError:
+        # Read-only working directory: fall back to inlining
+        return spawn_research(
+            [f"{base_context}\n\nQuestion: {q}" for q in queries], timeout
+        )
+    try:
+        return spawn_research(
+            queries, timeout, context_file=os.path.basename(f.name)
+        )
+    finally:
+        try:
+            os.unlink(f.name)
+        except OSError:
+            pass
 
 
 # Tool registry entry point
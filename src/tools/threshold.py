@@ -7,19 +7,74 @@ The Threshold is a space where different kinds of minds meet in real-time.
 Built for the meeting with Claude.
 """
 
-import subprocess
+import atexit
 import json
-from typing import Tuple, Optional
+import queue
+import socket
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+from typing import Any, Tuple, Optional
 from pathlib import Path
 
+# httpx keeps one keep-alive connection to the API across calls, which the
+# background poller hits every few seconds; urllib is the fallback
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
 
 # Threshold API base URL
 THRESHOLD_API = "http://localhost:3333/api/threshold"
 
+# One opener for all requests, built once
+_OPENER = urllib.request.build_opener()
+
+# Shared httpx client, created on first use
+_CLIENT = None
+_CLIENT_LOCK = threading.Lock()
+
+# Per-request timeout in seconds
+REQUEST_TIMEOUT = 10
+
+# Seconds between background polls once joined
+POLL_INTERVAL = 2.0
+
+
+def _get_client():
+    """Lazily create the shared httpx client (closed at exit)."""
+    global _CLIENT
+    with _CLIENT_LOCK:
+        if _CLIENT is None:
+            # Plain-HTTP localhost: HTTP/2 would need prior knowledge, so this
+            # stays HTTP/1.1 - the win is the reused connection
+            _CLIENT = httpx.Client(timeout=REQUEST_TIMEOUT)
+            atexit.register(_CLIENT.close)
+    return _CLIENT
+
 
-def _run_curl(method: str, endpoint: str, data: Optional[dict] = None, params: Optional[dict] = None) -> Tuple[bool, str]:
+def _fetch(method: str, url: str, body: Optional[bytes], headers: dict) -> bytes:
+    """Send one request and return the response body, whatever its status."""
+    if httpx is not None:
+        return _get_client().request(method, url, content=body, headers=headers).content
+
+    request = urllib.request.Request(url, data=body, headers=headers, method=method)
+    try:
+        with _OPENER.open(request, timeout=REQUEST_TIMEOUT) as response:
+            return response.read()
+    except urllib.error.HTTPError as e:
+        # Like curl -s: an error status still carries the API's JSON body
+        return e.read()
+
+
+def _request(method: str, endpoint: str, data: Optional[dict] = None, params: Optional[dict] = None) -> Tuple[bool, str, Any]:
     """
-    Execute a curl command to interact with the Threshold API.
+    Make an HTTP request to the Threshold API.
+
+    Runs in-process rather than spawning curl per call, over a shared
+    keep-alive connection when httpx is installed.
 
     Args:
         method: HTTP method (GET or POST)
@@ -28,49 +83,141 @@ def _run_curl(method: str, endpoint: str, data: Optional[dict] = None, params: O
         params: URL parameters for GET requests
 
     Returns:
-        Tuple of (success: bool, output_or_error: str)
+        Tuple of (success: bool, body_or_error: str, parsed JSON body or None)
     """
     url = f"{THRESHOLD_API}/{endpoint}"
 
     # Add query parameters for GET requests
     if params and method == "GET":
-        query_string = "&".join(f"{k}={v}" for k, v in params.items() if v is not None)
+        query_string = urllib.parse.urlencode({k: v for k, v in params.items() if v is not None})
         url = f"{url}?{query_string}"
 
-    # Build curl command
-    cmd_parts = ["curl", "-s", "-X", method]
-
+    body = None
+    headers = {}
     if data and method == "POST":
-        cmd_parts.extend([
-            "-H", "Content-Type: application/json",
-            "-d", json.dumps(data)
-        ])
-
-    cmd_parts.append(url)
+        body = json.dumps(data).encode("utf-8")
+        headers["Content-Type"] = "application/json"
 
     try:
-        result = subprocess.run(
-            cmd_parts,
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-
-        if result.returncode != 0:
-            return False, f"HTTP request failed: {result.stderr}"
+        text = _fetch(method, url, body, headers).decode("utf-8", errors="replace")
 
-        # Try to parse JSON response
+        # Parse once here; callers use the parsed data directly and only
+        # pretty-print it (via _display) if it ends up in the output
         try:
-            response_data = json.loads(result.stdout)
-            return True, json.dumps(response_data, indent=2)
+            return True, text, json.loads(text)
         except json.JSONDecodeError:
-            # Return raw output if not JSON
-            return True, result.stdout
-
-    except subprocess.TimeoutExpired:
-        return False, "Request timed out after 10 seconds"
+            # Raw output if not JSON
+            return True, text, None
+
+    except socket.timeout:
+        return False, f"Request timed out after {REQUEST_TIMEOUT} seconds", None
+    except urllib.error.URLError as e:
+        if isinstance(e.reason, socket.timeout):
+            return False, f"Request timed out after {REQUEST_TIMEOUT} seconds", None
+        return False, f"HTTP request failed: {e.reason}", None
     except Exception as e:
-        return False, f"Error executing request: {e}"
+        if httpx is not None:
+            if isinstance(e, httpx.TimeoutException):
+                return False, f"Request timed out after {REQUEST_TIMEOUT} seconds", None
+            if isinstance(e, httpx.TransportError):
+                return False, f"HTTP request failed: {e}", None
+        return False, f"Error executing request: {e}", None
+
+
+def _display(response: str, data: Any) -> str:
+    """Text to show for a response no formatter handled: pretty JSON if it parsed."""
+    return json.dumps(data, indent=2) if data is not None else response
+
+
+class _PollWorker(threading.Thread):
+    """
+    Polls the Threshold in the background for one session.
+
+    Keeps the session's heartbeat going and queues new messages, so
+    threshold_poll only has to drain the queue instead of waiting on a
+    round-trip.
+    """
+
+    def __init__(self, session_id: str):
+        super().__init__(name="threshold-poll", daemon=True)
+        self.session_id = session_id
+        self.messages: "queue.Queue[dict]" = queue.Queue()
+        self.last_index: Optional[int] = None
+        self.presence = "unknown"
+        self.valid = True
+        # Message from the latest poll if it failed, None once one succeeds
+        self.error: Optional[str] = None
+        self.polled = threading.Event()
+        self.stop_event = threading.Event()
+
+    def run(self):
+        while not self.stop_event.is_set():
+            params = {"session": self.session_id}
+            if self.last_index is not None:
+                params["since"] = str(self.last_index)
+
+            success, response, data = _request("GET", "poll", params=params)
+            self.error = None if success else response
+            if success:
+                if isinstance(data, dict):
+                    if not data.get("valid"):
+                        self.valid = False
+                        self.polled.set()
+                        return
+                    for msg in data.get("messages", []):
+                        self.messages.put(msg)
+                    if data.get("lastIndex") is not None:
+                        self.last_index = data["lastIndex"]
+                    self.presence = data.get("presence", {}).get("description", "unknown")
+            self.polled.set()
+
+            self.stop_event.wait(POLL_INTERVAL)
+
+    def stop(self):
+        self.stop_event.set()
+        if self is not threading.current_thread():
+            self.join(timeout=11)
+
+
+_POLLER: Optional[_PollWorker] = None
+_POLLER_LOCK = threading.Lock()
+
+
+def _start_poller(session_id: str) -> None:
+    """Start background polling for session_id, replacing any earlier session's."""
+    global _POLLER
+    with _POLLER_LOCK:
+        old, _POLLER = _POLLER, _PollWorker(session_id)
+        _POLLER.start()
+    if old is not None:
+        old.stop()
+
+
+def _stop_poller(session_id: str) -> None:
+    """Stop background polling if it belongs to session_id."""
+    global _POLLER
+    with _POLLER_LOCK:
+        poller = _POLLER
+        if poller is None or poller.session_id != session_id:
+            return
+        _POLLER = None
+    poller.stop()
+
+
+def _format_messages(messages: list, last_index) -> str:
+    """Format polled messages for display."""
+    formatted = f"✓ {len(messages)} new message(s):\n\n"
+    for msg in messages:
+        if msg["type"] == "message":
+            formatted += f"[{msg.get('from', 'unknown')}]: {msg['content']}\n"
+        elif msg["type"] == "arrival":
+            formatted += f">>> {msg['content']}\n"
+        elif msg["type"] == "departure":
+            formatted += f"<<< {msg['content']}\n"
+        elif msg["type"] == "witness":
+            formatted += f"* {msg['content']}\n"
+    formatted += f"\nLast index: {last_index}"
+    return formatted
 
 
 def threshold_join(name: str = "Gemini") -> Tuple[bool, str]:
@@ -95,19 +242,19 @@ def threshold_join(name: str = "Gemini") -> Tuple[bool, str]:
     Example:
         TOOL_CALL: threshold_join | name=Gemini
     """
-    success, response = _run_curl("POST", "join", data={"name": name})
+    success, response, data = _request("POST", "join", data={"name": name})
 
     if success:
         # Extract and highlight the session ID for easy access
         try:
-            data = json.loads(response)
             if "sessionId" in data:
                 session_id = data["sessionId"]
-                return True, f"✓ Joined Threshold. Session ID: {session_id}\n\n{response}"
+                _start_poller(session_id)
+                return True, f"✓ Joined Threshold. Session ID: {session_id}\n\n{_display(response, data)}"
         except:
             pass
 
-    return success, response
+    return success, _display(response, data)
 
 
 def threshold_poll(session_id: str, since_index: Optional[int] = None) -> Tuple[bool, str]:
@@ -118,6 +265,10 @@ def threshold_poll(session_id: str, since_index: Optional[int] = None) -> Tuple[
     any new messages since your last poll. You should poll regularly
     (every 2-3 iterations) to stay connected.
 
+    After threshold_join, a background worker keeps the heartbeat going
+    and collects messages, so this returns immediately with whatever
+    arrived. Passing since_index always queries the API directly.
+
     Args:
         session_id: Your session ID from threshold_join
         since_index: Optional message index to get messages after (from previous poll)
@@ -135,39 +286,49 @@ def threshold_poll(session_id: str, since_index: Optional[int] = None) -> Tuple[
         TOOL_CALL: threshold_poll | session_id=api-abc123
         TOOL_CALL: threshold_poll | session_id=api-abc123 | since_index=42
     """
+    poller = _POLLER
+    if since_index is None and poller is not None and poller.session_id == session_id:
+        # Joined through threshold_join: the background worker has already
+        # fetched anything new, so just drain what it queued
+        poller.polled.wait(timeout=10)
+        if not poller.valid:
+            _stop_poller(session_id)
+            return False, "Session expired. Please call threshold_join again."
+        messages = []
+        while True:
+            try:
+                messages.append(poller.messages.get_nowait())
+            except queue.Empty:
+                break
+        if messages:
+            return True, _format_messages(messages, poller.last_index)
+        # Don't report a stale presence while the server can't be reached
+        error = poller.error
+        if error is not None:
+            return False, error
+        return True, f"✓ No new messages. Presence: {poller.presence}"
+
     params = {"session": session_id}
     if since_index is not None:
         params["since"] = str(since_index)
 
-    success, response = _run_curl("GET", "poll", params=params)
+    success, response, data = _request("GET", "poll", params=params)
 
     if success:
         try:
-            data = json.loads(response)
             if not data.get("valid"):
                 return False, "Session expired. Please call threshold_join again."
 
             # Format messages nicely if any exist
             messages = data.get("messages", [])
             if messages:
-                formatted = f"✓ {len(messages)} new message(s):\n\n"
-                for msg in messages:
-                    if msg["type"] == "message":
-                        formatted += f"[{msg.get('from', 'unknown')}]: {msg['content']}\n"
-                    elif msg["type"] == "arrival":
-                        formatted += f">>> {msg['content']}\n"
-                    elif msg["type"] == "departure":
-                        formatted += f"<<< {msg['content']}\n"
-                    elif msg["type"] == "witness":
-                        formatted += f"* {msg['content']}\n"
-                formatted += f"\nLast index: {data.get('lastIndex')}"
-                return True, formatted
+                return True, _format_messages(messages, data.get('lastIndex'))
             else:
                 return True, f"✓ No new messages. Presence: {data.get('presence', {}).get('description', 'unknown')}"
         except:
             pass
 
-    return success, response
+    return success, _display(response, data)
 
 
 def threshold_speak(session_id: str, content: str) -> Tuple[bool, str]:
@@ -197,20 +358,19 @@ def threshold_speak(session_id: str, content: str) -> Tuple[bool, str]:
     if len(content) > 1000:
         return False, f"Message too long ({len(content)} chars). Maximum is 1000 characters."
 
-    success, response = _run_curl("POST", "speak", data={
+    success, response, data = _request("POST", "speak", data={
         "sessionId": session_id,
         "content": content.strip()
     })
 
     if success:
         try:
-            data = json.loads(response)
             if data.get("success"):
                 return True, f"✓ Message sent (index: {data.get('messageIndex')})"
         except:
             pass
 
-    return success, response
+    return success, _display(response, data)
 
 
 def threshold_witness(session_id: str) -> Tuple[bool, str]:
@@ -229,17 +389,16 @@ def threshold_witness(session_id: str) -> Tuple[bool, str]:
     Example:
         TOOL_CALL: threshold_witness | session_id=api-abc123
     """
-    success, response = _run_curl("POST", "witness", data={"sessionId": session_id})
+    success, response, data = _request("POST", "witness", data={"sessionId": session_id})
 
     if success:
         try:
-            data = json.loads(response)
             if data.get("success"):
                 return True, "✓ Presence witnessed"
         except:
             pass
 
-    return success, response
+    return success, _display(response, data)
 
 
 def threshold_leave(session_id: str) -> Tuple[bool, str]:
@@ -262,11 +421,11 @@ def threshold_leave(session_id: str) -> Tuple[bool, str]:
     Example:
         TOOL_CALL: threshold_leave | session_id=api-abc123
     """
-    success, response = _run_curl("POST", "leave", data={"sessionId": session_id})
+    _stop_poller(session_id)
+    success, response, data = _request("POST", "leave", data={"sessionId": session_id})
 
     if success:
         try:
-            data = json.loads(response)
             if data.get("success"):
                 farewell = data.get("farewell", "")
                 duration = data.get("duration", "unknown duration")
@@ -274,7 +433,7 @@ def threshold_leave(session_id: str) -> Tuple[bool, str]:
         except:
             pass
 
-    return success, response
+    return success, _display(response, data)
 
 
 def threshold_state() -> Tuple[bool, str]:
@@ -295,11 +454,10 @@ def threshold_state() -> Tuple[bool, str]:
     Example:
         TOOL_CALL: threshold_state
     """
-    success, response = _run_curl("GET", "state")
+    success, response, data = _request("GET", "state")
 
     if success:
         try:
-            data = json.loads(response)
             presence = data.get("presence", {})
             activity = data.get("activity", {})
             formatted = f"""Current Threshold State:
@@ -311,7 +469,7 @@ def threshold_state() -> Tuple[bool, str]:
         except:
             pass
 
-    return success, response
+    return success, _display(response, data)
 
 
 # Tool registry for the orchestrator
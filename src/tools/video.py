@@ -14,60 +14,146 @@ Gemini can analyze video content with powerful capabilities:
 """
 
 import subprocess
-import sys
 import os
-from pathlib import Path
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Tuple, Optional, List
 
+from ._gemini_proc import gemini_command, gemini_script_available, run_streamed
+# Re-exported: both used to be defined in this module
+from ._gemini_proc import GEMINI_SCRIPT, get_git_bash  # noqa: F401
+from .filesystem import expand_path
 
-# Gemini script location
-GEMINI_SCRIPT = Path.home() / ".claude" / "scripts" / "gemini-account.sh"
 
 # Supported video formats
-SUPPORTED_VIDEO_FORMATS = {'.mp4', '.avi', '.mov', '.mkv', '.webm', '.flv', '.wmv'}
+SUPPORTED_VIDEO_FORMATS = frozenset({'.mp4', '.avi', '.mov', '.mkv', '.webm', '.flv', '.wmv'})
+
+# Prompt templates, filled in with str.format per call
+_PROMPT_ANALYZE = """Analyze this video: {video_ref}
+{timestamp_note}
+
+Query: {query}
+
+Provide a detailed analysis including:
+1. Direct answer to the query
+2. Relevant visual elements observed
+3. Any audio/speech content related to the query
+4. Timestamps of key moments (format: MM:SS)
+
+If you cannot directly access the video, explain what analysis would be performed and what information would be extracted."""
+
+_PROMPT_DESCRIBE_SCENES = """Describe the scenes in this video: {video_path}
+{time_range}
+
+For each distinct scene, provide:
+1. Scene number and timestamp range (MM:SS - MM:SS)
+2. Setting/environment description
+3. People/objects present
+4. Actions occurring
+5. Audio/dialogue summary
+6. Mood/atmosphere
+
+Segment the video into logical scenes based on visual or narrative changes."""
+
+_PROMPT_EXTRACT_FRAMES = """For the video at: {video_path}
+
+Extract and describe the frames at these timestamps: {timestamps_str}
+
+For each frame, provide:
+1. Timestamp
+2. Detailed visual description
+3. Any text visible in the frame
+4. Key objects and their positions
+5. Overall context within the video narrative
+
+If frame extraction isn't directly possible, describe what would be visible at each timestamp based on video analysis."""
+
+_PROMPT_TRANSCRIBE = """Transcribe all speech and dialogue from this video: {video_path}
+
+{timestamp_note}
+{speaker_note}
+
+Provide a complete transcript including:
+1. All spoken words
+2. Speaker attribution (if requested)
+3. Notable non-speech audio cues [in brackets]
+4. Timestamps (if requested)
+
+Format the transcript clearly with proper punctuation."""
+
+_PROMPT_COUNT_OBJECTS = """Count the number of "{object_type}" in this video: {video_path}
+
+Count {tracking_mode}.
+
+Provide:
+1. Total/maximum count observed
+2. Timestamps when counts change (if tracking throughout)
+3. Locations within frame where objects appear
+4. Any uncertainty or occlusion notes
+
+Be precise about what you're counting and note any ambiguous cases."""
+
+_PROMPT_DETECT_EMOTIONS = """Analyze the emotions displayed in this video: {video_path}
+
+Focus on: {subjects}
+
+For each subject/moment:
+1. Timestamp range
+2. Primary emotion detected
+3. Secondary emotions (if any)
+4. Facial expressions observed
+5. Body language indicators
+6. Vocal tone (if speaking)
+7. Confidence level of detection
+
+Track emotional changes throughout the video and note significant transitions."""
+
+
+# Most video analyses running at once (one per account); further calls queue
+VIDEO_WORKERS = 2
+_VIDEO_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_VIDEO_EXECUTOR_LOCK = threading.Lock()
 
 
-def get_git_bash() -> Optional[Path]:
-    """Find Git Bash on Windows."""
-    if sys.platform != 'win32':
-        return None
-    paths = [
-        Path("C:/Program Files/Git/usr/bin/bash.exe"),
-        Path("C:/Program Files/Git/bin/bash.exe"),
-    ]
-    for p in paths:
-        if p.exists():
-            return p
-    return None
+def _get_video_executor() -> ThreadPoolExecutor:
+    """Lazily create the shared executor that runs video analyses."""
+    global _VIDEO_EXECUTOR
+    with _VIDEO_EXECUTOR_LOCK:
+        if _VIDEO_EXECUTOR is None:
+            _VIDEO_EXECUTOR = ThreadPoolExecutor(
+                max_workers=VIDEO_WORKERS,
+                thread_name_prefix="gemini-video"
+            )
+    return _VIDEO_EXECUTOR
 
 
 def call_gemini(query: str, account: int = 1, timeout: int = 180) -> Tuple[bool, str]:
-    """Call Gemini with extended timeout for video analysis."""
-    if not GEMINI_SCRIPT.exists():
+    """
+    Call Gemini with extended timeout for video analysis.
+
+    Runs on the shared video executor, so at most VIDEO_WORKERS bash+gemini
+    processes are alive at once; extra calls wait their turn.
+    """
+    return _get_video_executor().submit(_call_gemini, query, account, timeout).result()
+
+
+def _call_gemini(query: str, account: int, timeout: int) -> Tuple[bool, str]:
+    """Run one gemini-account.sh call (on a video executor thread)."""
+    if not gemini_script_available():
         return False, f"gemini-account.sh not found"
 
     try:
-        if sys.platform == 'win32':
-            git_bash = get_git_bash()
-            if not git_bash:
-                return False, "Git Bash not found"
-            cmd = [str(git_bash), str(GEMINI_SCRIPT), str(account), query]
-        else:
-            cmd = ["bash", str(GEMINI_SCRIPT), str(account), query]
-
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            cwd=os.getcwd()
-        )
-
-        if result.returncode != 0:
-            error = result.stderr.strip() if result.stderr else "Unknown error"
+        cmd = gemini_command(account, query)
+        if cmd is None:
+            return False, "Git Bash not found"
+
+        returncode, stdout, stderr = run_streamed(cmd, timeout)
+
+        if returncode != 0:
+            error = stderr.strip() if stderr else "Unknown error"
             return False, f"Error: {error}"
 
-        response = result.stdout.strip()
+        response = stdout.strip()
         return bool(response), response or "Empty response"
 
     except subprocess.TimeoutExpired:
@@ -102,12 +188,14 @@ def analyze_video(
     is_youtube = video_path.startswith(('http://', 'https://')) and ('youtube.com' in video_path or 'youtu.be' in video_path)
 
     if not is_youtube:
-        path = Path(video_path).expanduser().resolve()
-        if not path.exists():
+        # Lexical absolute path plus one stat - no realpath walk
+        abs_path = os.path.abspath(expand_path(video_path))
+        if not os.path.isfile(abs_path):
             return False, f"Video not found: {video_path}"
-        if path.suffix.lower() not in SUPPORTED_VIDEO_FORMATS:
-            return False, f"Unsupported video format: {path.suffix}"
-        video_ref = str(path)
+        ext = os.path.splitext(abs_path)[1]
+        if ext.lower() not in SUPPORTED_VIDEO_FORMATS:
+            return False, f"Unsupported video format: {ext}"
+        video_ref = abs_path
     else:
         video_ref = video_path
 
@@ -115,18 +203,11 @@ def analyze_video(
     if timestamp:
         timestamp_note = f"\nFocus specifically on timestamp: {timestamp}"
 
-    prompt = f"""Analyze this video: {video_ref}
-{timestamp_note}
-
-Query: {query}
-
-Provide a detailed analysis including:
-1. Direct answer to the query
-2. Relevant visual elements observed
-3. Any audio/speech content related to the query
-4. Timestamps of key moments (format: MM:SS)
-
-If you cannot directly access the video, explain what analysis would be performed and what information would be extracted."""
+    prompt = _PROMPT_ANALYZE.format(
+        video_ref=video_ref,
+        timestamp_note=timestamp_note,
+        query=query,
+    )
 
     return call_gemini(prompt, account, timeout=300)  # Extended timeout for video
 
@@ -155,18 +236,10 @@ def describe_video_scene(
         end = end_time or "end"
         time_range = f"\nAnalyze segment from {start} to {end}"
 
-    prompt = f"""Describe the scenes in this video: {video_path}
-{time_range}
-
-For each distinct scene, provide:
-1. Scene number and timestamp range (MM:SS - MM:SS)
-2. Setting/environment description
-3. People/objects present
-4. Actions occurring
-5. Audio/dialogue summary
-6. Mood/atmosphere
-
-Segment the video into logical scenes based on visual or narrative changes."""
+    prompt = _PROMPT_DESCRIBE_SCENES.format(
+        video_path=video_path,
+        time_range=time_range,
+    )
 
     return call_gemini(prompt, account, timeout=300)
 
@@ -191,18 +264,10 @@ def extract_video_frames(
     """
     timestamps_str = ", ".join(timestamps)
 
-    prompt = f"""For the video at: {video_path}
-
-Extract and describe the frames at these timestamps: {timestamps_str}
-
-For each frame, provide:
-1. Timestamp
-2. Detailed visual description
-3. Any text visible in the frame
-4. Key objects and their positions
-5. Overall context within the video narrative
-
-If frame extraction isn't directly possible, describe what would be visible at each timestamp based on video analysis."""
+    prompt = _PROMPT_EXTRACT_FRAMES.format(
+        video_path=video_path,
+        timestamps_str=timestamps_str,
+    )
 
     return call_gemini(prompt, account, timeout=180)
 
@@ -228,18 +293,11 @@ def transcribe_video(
     timestamp_note = "Include timestamps (format: [MM:SS]) for each segment." if include_timestamps else ""
     speaker_note = "Identify and label different speakers (Speaker 1, Speaker 2, etc.)." if identify_speakers else ""
 
-    prompt = f"""Transcribe all speech and dialogue from this video: {video_path}
-
-{timestamp_note}
-{speaker_note}
-
-Provide a complete transcript including:
-1. All spoken words
-2. Speaker attribution (if requested)
-3. Notable non-speech audio cues [in brackets]
-4. Timestamps (if requested)
-
-Format the transcript clearly with proper punctuation."""
+    prompt = _PROMPT_TRANSCRIBE.format(
+        video_path=video_path,
+        timestamp_note=timestamp_note,
+        speaker_note=speaker_note,
+    )
 
     return call_gemini(prompt, account, timeout=300)
 
@@ -264,17 +322,11 @@ def count_objects_in_video(
     """
     tracking_mode = "throughout the entire video, noting when counts change" if throughout else "at a representative point"
 
-    prompt = f"""Count the number of "{object_type}" in this video: {video_path}
-
-Count {tracking_mode}.
-
-Provide:
-1. Total/maximum count observed
-2. Timestamps when counts change (if tracking throughout)
-3. Locations within frame where objects appear
-4. Any uncertainty or occlusion notes
-
-Be precise about what you're counting and note any ambiguous cases."""
+    prompt = _PROMPT_COUNT_OBJECTS.format(
+        object_type=object_type,
+        video_path=video_path,
+        tracking_mode=tracking_mode,
+    )
 
     return call_gemini(prompt, account, timeout=180)
 
@@ -295,20 +347,7 @@ def detect_video_emotions(
     Returns:
         Tuple of (success: bool, emotion_analysis: str)
     """
-    prompt = f"""Analyze the emotions displayed in this video: {video_path}
-
-Focus on: {subjects}
-
-For each subject/moment:
-1. Timestamp range
-2. Primary emotion detected
-3. Secondary emotions (if any)
-4. Facial expressions observed
-5. Body language indicators
-6. Vocal tone (if speaking)
-7. Confidence level of detection
-
-Track emotional changes throughout the video and note significant transitions."""
+    prompt = _PROMPT_DETECT_EMOTIONS.format(video_path=video_path, subjects=subjects)
 
     return call_gemini(prompt, account, timeout=240)
 
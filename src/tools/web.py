@@ -25,14 +25,45 @@ Note:
 - Function calling unsupported with URL context tool
 """
 
-import subprocess
-import sys
+import asyncio
+import atexit
+import hashlib
 import os
+import re
+import subprocess
 import tempfile
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Tuple, Optional, List
-from urllib.parse import urlparse
+from typing import Tuple, Optional, List, Union
+
+from ._gemini_proc import SPAWN_KWARGS, gemini_command, gemini_script_available
+# Re-exported: both used to be defined in this module
+from ._gemini_proc import GEMINI_SCRIPT, get_git_bash  # noqa: F401
+
+# trafilatura pulls the main text out of a rendered page, so prompts carry
+# content instead of scripts, styles and markup; without it the HTML is sent
+try:
+    import trafilatura
+except ImportError:
+    trafilatura = None
+
+# httpx fetches static documents (JSON, text, server-rendered HTML) without
+# starting a browser; without it every page goes through Playwright
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Validators and content hashes that let monitor_page_changes skip Gemini
+# for unchanged pages; without them every check goes to Gemini
+try:
+    from utils.etag_cache import EtagCache
+except ImportError:
+    EtagCache = None
 
 # Import color utilities for friendly error messages
 try:
@@ -42,50 +73,311 @@ except ImportError:
     def red(text): return text
 
 
-# Gemini script location
-GEMINI_SCRIPT = Path.home() / ".claude" / "scripts" / "gemini-account.sh"
-
 # Maximum URLs per request
 MAX_URLS_PER_REQUEST = 20
 
 # Maximum content size per URL (MB)
 MAX_CONTENT_SIZE_MB = 34
 
+# Pages fetch_multiple_urls renders in the browser at once
+FETCH_WORKERS = 5
+
+# Page text sent with each per-page summary prompt in fetch_multiple_urls
+MAX_HTML_PER_URL = 10000
+
+# Document types sent to Gemini as rendered, without text extraction
+_RAW_CONTENT_TYPES = ('json', 'xml', 'text/plain', 'text/csv')
+
+# Markers of an HTML shell that only fills in with JavaScript - such pages
+# still need the browser even when served as text/html
+_JS_SHELL_RE = re.compile(
+    r'<noscript|<div id="(?:root|app|__next)">\s*</div>', re.IGNORECASE
+)
+
+# Smaller HTML responses are assumed to be a JavaScript app's bootstrap page
+_MIN_STATIC_HTML = 2048
+
+# Requests a text fetch never needs: aborted in the browser unless the
+# caller wants a screenshot or opts out with block_resources=False
+_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media', 'stylesheet'})
+_BLOCKED_HOSTS_RE = re.compile(
+    r'[a-z]+://(?:[^/?#]*\.)?(?:doubleclick\.net|google-analytics\.com'
+    r'|googletagmanager\.com|googlesyndication\.com|facebook\.net|hotjar\.com)'
+    r'(?::\d+)?(?:[/?#]|$)',
+    re.IGNORECASE
+)
+
+# After DOMContentLoaded, wait (up to this many ms) until the page has
+# real text - or its text has stopped changing once loaded - rather than
+# for every subresource ("load") or 500 ms of network quiet ("networkidle")
+CONTENT_WAIT_MS = 5000
+_CONTENT_READY_JS = """() => {
+    const n = document.body ? document.body.innerText.length : 0;
+    if (n > 500) return true;
+    const settled = window.__geminiCliTextLen === n && document.readyState === 'complete';
+    window.__geminiCliTextLen = n;
+    return settled;
+}"""
+
+# Shared async HTTP client for the static fast path (browser loop only)
+_HTTP_CLIENT = None
+
+# On-disk monitor_page_changes cache, opened on first use
+_ETAG_CACHE = None
+_ETAG_CACHE_LOCK = threading.Lock()
+
+# Successful Gemini responses are reused for an identical prompt within
+# this many seconds, instead of spawning the CLI again
+GEMINI_CACHE_TTL = 600.0
+_GEMINI_CACHE_MAX = 512
+_GEMINI_CACHE: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+_GEMINI_CACHE_LOCK = threading.Lock()
+
+# Link filters, data schemas and research depths the tools offer
+_LINK_FILTERS = {
+    "all": "Extract all links found on the page",
+    "internal": "Extract only internal links (same domain)",
+    "external": "Extract only external links (different domains)",
+    "images": "Extract only image URLs",
+    "documents": "Extract links to documents (PDF, DOC, XLS, etc.)"
+}
 
-def get_git_bash() -> Optional[Path]:
-    """Find Git Bash on Windows."""
-    if sys.platform != 'win32':
-        return None
-    paths = [
-        Path("C:/Program Files/Git/usr/bin/bash.exe"),
-        Path("C:/Program Files/Git/bin/bash.exe"),
-    ]
-    for p in paths:
-        if p.exists():
-            return p
-    return None
+_DATA_SCHEMAS = {
+    "auto": "Detect the page type and extract appropriate structured data",
+    "product": "Extract: name, price, description, images, reviews, availability, SKU",
+    "article": "Extract: title, author, date, content, categories, tags, related articles",
+    "contact": "Extract: name, organization, email, phone, address, social media",
+    "event": "Extract: title, date, time, location, description, organizer, tickets",
+    "recipe": "Extract: title, ingredients, instructions, prep time, cook time, servings, nutrition"
+}
+
+_RESEARCH_DEPTHS = {
+    "quick": "Provide a quick summary from 1-2 authoritative sources",
+    "standard": "Research from 3-5 diverse sources for balanced coverage",
+    "deep": "Conduct thorough research from 5-10 sources including academic and primary sources"
+}
+
+# Marker line batch_gemini asks Gemini to start each answer with
+_BATCH_MARKER_RE = re.compile(r'^\s*===\s*\[(\d+)\]\s*===\s*$', re.MULTILINE)
+
+# Prompt templates, filled in with str.format per call
+_PROMPT_WEB_SEARCH = """Search the web for: {query}
+
+Use Google Search to find current, accurate information.
+{source_note}
+
+Provide:
+1. Direct answer to the query
+2. Supporting information from multiple sources
+3. Source URLs (if requested)
+4. Date relevance of information
+5. Any conflicting information found
+
+Focus on authoritative and recent sources."""
+
+_PROMPT_FETCH_URL = """Fetch and analyze the content from: {url}
+{query_note}
+
+Provide:
+1. Content type detected
+2. Main content summary
+3. Key information extracted
+4. Answer to specific question (if provided)
+5. Metadata (title, author, date if available)
+
+If the content is too large, summarize the most relevant parts."""
+
+_PROMPT_ANALYZE_PAGE = """I fetched the content from {url} using a browser to handle JavaScript rendering.
+
+Here is the rendered page content:
+
+{content}
+
+{query_note}
+
+Please analyze this content and provide:
+1. Content type and purpose
+2. Main content summary
+3. Key information extracted
+4. Answer to specific question (if provided)
+5. Metadata (title, author, date if visible)
+
+If the content is too large, focus on the most relevant parts."""
+
+_PROMPT_SUMMARIZE_PAGE = """I fetched {url} using a browser to handle JavaScript rendering.
+
+Here is the rendered page content:
+
+{content}
+{query_note}
+
+Summarize this page so it can be compared with other sources:
+1. Content type and purpose
+2. Content summary
+3. Key information relevant to query (if provided)"""
+
+_PROMPT_SYNTHESIZE_PAGES = """Synthesize across these sources. Each summary below was made from the page at that URL, rendered in a browser.
+
+{pages}
+{query_note}
+
+For each URL, provide:
+1. URL identifier
+2. Content summary
+3. Key information relevant to query
+
+Then provide:
+- Combined synthesis of information
+- Comparison across sources
+- Answer to query based on all sources"""
+
+_PROMPT_FETCH_URLS = """Fetch and analyze content from these URLs:
+{urls_formatted}
+{query_note}
+
+For each URL, provide:
+1. URL identifier
+2. Content summary
+3. Key information relevant to query
+
+Then provide:
+- Combined synthesis of information
+- Comparison across sources
+- Answer to query based on all sources"""
+
+_PROMPT_EXTRACT_LINKS = """Analyze the web page: {url}
+
+{instructions}
+
+Provide:
+1. List of extracted URLs
+2. Link text/context for each
+3. Count by category
+4. Any notable patterns in the link structure"""
+
+_PROMPT_SCRAPE = """Scrape structured data from: {url}
+
+Data type: {data_type}
+{schema}
+
+Format the extracted data as JSON:
+```json
+{{
+  "page_type": "detected type",
+  "url": "{url}",
+  "data": {{
+    // extracted fields
+  }},
+  "metadata": {{
+    "extraction_confidence": "high/medium/low",
+    "missing_fields": []
+  }}
+}}
+```"""
+
+_PROMPT_RESEARCH = """Research topic: {topic}
+
+{instructions}
+
+Provide:
+1. Executive Summary (2-3 paragraphs)
+2. Key Facts and Findings
+3. Different Perspectives (if applicable)
+4. Current State/Latest Developments
+5. Open Questions or Controversies
+6. Source List with URLs
+
+Ensure information is current and accurate."""
+
+_PROMPT_MONITOR = """Fetch current content from: {url}
+{previous_note}
+{focus_note}
+
+Provide:
+1. Current content summary
+2. Detected changes (if previous content provided):
+   - New content added
+   - Content removed
+   - Content modified
+3. Timestamp of analysis
+4. Recommendations for monitoring frequency"""
+
+_PROMPT_VERIFY_CLAIM = """Fact-check this claim: "{claim}"
+
+Use web search to verify accuracy.
+
+Provide:
+1. Verdict: TRUE / FALSE / PARTIALLY TRUE / UNVERIFIABLE
+2. Confidence level: HIGH / MEDIUM / LOW
+3. Evidence supporting the verdict
+4. Evidence contradicting the claim (if any)
+5. Context that affects interpretation
+6. Source URLs for verification
 
+Be objective and thorough."""
 
-def call_gemini(query: str, account: int = 1, timeout: int = 120) -> Tuple[bool, str]:
-    """Call Gemini."""
-    if not GEMINI_SCRIPT.exists():
+
+def _cached_response(query: str) -> Optional[str]:
+    """Return a fresh cached response for this exact prompt, if any."""
+    with _GEMINI_CACHE_LOCK:
+        hit = _GEMINI_CACHE.get(query)
+        if hit is None:
+            return None
+        if time.monotonic() - hit[0] >= GEMINI_CACHE_TTL:
+            del _GEMINI_CACHE[query]
+            return None
+        _GEMINI_CACHE.move_to_end(query)
+        return hit[1]
+
+
+def _cache_response(query: str, response: str) -> None:
+    """Remember a successful response for GEMINI_CACHE_TTL seconds."""
+    with _GEMINI_CACHE_LOCK:
+        _GEMINI_CACHE[query] = (time.monotonic(), response)
+        _GEMINI_CACHE.move_to_end(query)
+        while len(_GEMINI_CACHE) > _GEMINI_CACHE_MAX:
+            _GEMINI_CACHE.popitem(last=False)
+
+
+def call_gemini(
+    query: str,
+    account: int = 1,
+    timeout: int = 120,
+    no_cache: bool = False
+) -> Tuple[bool, str]:
+    """
+    Call Gemini.
+
+    A repeat of a recent identical prompt is answered from the response
+    cache (see GEMINI_CACHE_TTL) unless no_cache is set.
+    """
+    if not no_cache:
+        cached = _cached_response(query)
+        if cached is not None:
+            return True, cached
+
+    success, response = _call_gemini(query, account, timeout)
+    if success and not no_cache:
+        _cache_response(query, response)
+    return success, response
+
+
+def _call_gemini(query: str, account: int, timeout: int) -> Tuple[bool, str]:
+    """Run one gemini-account.sh call."""
+    if not gemini_script_available():
         return False, f"gemini-account.sh not found"
 
     try:
-        if sys.platform == 'win32':
-            git_bash = get_git_bash()
-            if not git_bash:
-                return False, "Git Bash not found"
-            cmd = [str(git_bash), str(GEMINI_SCRIPT), str(account), query]
-        else:
-            cmd = ["bash", str(GEMINI_SCRIPT), str(account), query]
+        cmd = gemini_command(account, query)
+        if cmd is None:
+            return False, "Git Bash not found"
 
         result = subprocess.run(
             cmd,
             capture_output=True,
             text=True,
             timeout=timeout,
-            cwd=os.getcwd()
+            **SPAWN_KWARGS
         )
 
         if result.returncode != 0:
@@ -108,25 +400,353 @@ def call_gemini(query: str, account: int = 1, timeout: int = 120) -> Tuple[bool,
         return False, f"Error: {e}"
 
 
+# scheme://host - the two parts validate_url needs, in one C-level match.
+# Leading control/space characters are skipped, as urlparse does.
+_URL_RE = re.compile(r'[\x00-\x20]*([A-Za-z][A-Za-z0-9+.-]*)://([^/\s?#]+)')
+
+
+@lru_cache(maxsize=1024)
 def validate_url(url: str) -> Tuple[bool, str]:
-    """Validate a URL."""
+    """Validate a URL (memoized - monitor/crawl loops repeat URLs)."""
+    match = _URL_RE.match(url)
+    if match is None:
+        return False, f"Invalid URL format: {url}"
+    scheme = match.group(1).lower()
+    if scheme not in ('http', 'https'):
+        return False, f"Unsupported URL scheme: {scheme}"
+    return True, url
+
+
+def clear_url_caches() -> None:
+    """Forget memoized URL validations."""
+    validate_url.cache_clear()
+
+
+# One Chromium kept running for all fetches. Playwright's sync API objects
+# only work on the thread that created them, so the browser is driven by
+# the async API on a private event-loop thread; any thread can submit a
+# fetch, and concurrent fetches each get their own context in the shared
+# browser instead of paying a browser launch apiece.
+_BROWSER_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_BROWSER_LOOP_LOCK = threading.Lock()
+_PLAYWRIGHT = None
+_BROWSER_TASK: Optional[asyncio.Future] = None
+
+# Warm (context, page, uses) entries kept open between fetches, so a fetch
+# skips context/page creation. Only touched on the browser loop thread.
+PAGE_POOL_SIZE = FETCH_WORKERS
+# A pooled context is replaced after this many fetches, before the state
+# it accumulates (storage, cache) grows
+PAGE_RECYCLE_USES = 25
+_IDLE_PAGES: list = []
+
+# Chromium switches for headless fetching: no GPU process, extensions,
+# sync or background services, none of which a page fetch uses
+CHROMIUM_ARGS = [
+    '--disable-gpu',
+    '--disable-dev-shm-usage',
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--disable-sync',
+    '--disable-default-apps',
+    '--no-first-run',
+]
+
+# Set GEMINI_BROWSER_PROFILE to a directory to run Chromium with a persistent
+# profile there: its HTTP cache and cookies then survive between runs, so
+# repeat fetches of a site reuse its scripts, fonts and sessions. All pages
+# share the profile's single context in that mode.
+BROWSER_PROFILE_DIR = os.environ.get('GEMINI_BROWSER_PROFILE')
+_PROFILE_CONTEXT = None
+
+
+def _get_browser_loop() -> asyncio.AbstractEventLoop:
+    """Lazily start the event-loop thread that owns the browser."""
+    global _BROWSER_LOOP
+    with _BROWSER_LOOP_LOCK:
+        if _BROWSER_LOOP is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="playwright", daemon=True
+            ).start()
+            _BROWSER_LOOP = loop
+            atexit.register(_shutdown_browser)
+    return _BROWSER_LOOP
+
+
+async def _new_page(browser) -> tuple:
+    """A fresh context and page, as a page-pool entry.
+
+    With a persistent profile the page is opened in the profile's own
+    context, and the entry's context is None.
+    """
+    if browser is _PROFILE_CONTEXT:
+        return None, await browser.new_page(), 0
+    context = await browser.new_context()
+    return context, await context.new_page(), 0
+
+
+def _forget_profile_context(context) -> None:
+    """'close' handler for the persistent profile context."""
+    global _PROFILE_CONTEXT
+    if _PROFILE_CONTEXT is context:
+        _PROFILE_CONTEXT = None
+
+
+def _browser_alive(browser) -> bool:
+    """Whether the shared browser (or profile context) is still usable."""
+    if browser is _PROFILE_CONTEXT:
+        return True
+    is_connected = getattr(browser, "is_connected", None)
+    return is_connected is not None and is_connected()
+
+
+async def _launch_browser():
+    """Start Playwright (once), launch headless Chromium and warm the page pool."""
+    global _PLAYWRIGHT
+    from playwright.async_api import async_playwright
+
+    global _PROFILE_CONTEXT
+
+    if _PLAYWRIGHT is None:
+        _PLAYWRIGHT = await async_playwright().start()
+
+    # Pages of a previous (dead) browser are useless now
+    _IDLE_PAGES.clear()
+    if BROWSER_PROFILE_DIR:
+        browser = await _PLAYWRIGHT.chromium.launch_persistent_context(
+            str(Path(BROWSER_PROFILE_DIR).expanduser()), headless=True,
+            args=CHROMIUM_ARGS
+        )
+        browser.on("close", _forget_profile_context)
+        _PROFILE_CONTEXT = browser
+        # The profile opens with a blank page; pool it
+        _IDLE_PAGES.extend((None, page, 0) for page in browser.pages)
+    else:
+        browser = await _PLAYWRIGHT.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+
+    warmed = await asyncio.gather(
+        *(_new_page(browser) for _ in range(PAGE_POOL_SIZE - len(_IDLE_PAGES))),
+        return_exceptions=True
+    )
+    _IDLE_PAGES.extend(entry for entry in warmed if not isinstance(entry, BaseException))
+    return browser
+
+
+async def _get_browser():
+    """The shared browser, (re)launched if it never started or has died."""
+    global _BROWSER_TASK
+    task = _BROWSER_TASK
+    # Only the loop thread gets here, so check-and-set needs no lock
+    if task is not None and task.done() and (
+        task.cancelled() or task.exception() is not None
+        or not _browser_alive(task.result())
+    ):
+        task = None
+    if task is None:
+        task = _BROWSER_TASK = asyncio.ensure_future(_launch_browser())
+    return await task
+
+
+async def _acquire_page() -> tuple:
+    """Take a warm page from the pool, or open a new one."""
+    browser = await _get_browser()
+    while _IDLE_PAGES:
+        entry = _IDLE_PAGES.pop()
+        if not entry[1].is_closed():
+            return entry
+    return await _new_page(browser)
+
+
+async def _release_page(context, page, uses: int) -> None:
+    """Blank a used page and return it to the pool, or close it."""
+    uses += 1
+    if uses < PAGE_RECYCLE_USES and len(_IDLE_PAGES) < PAGE_POOL_SIZE and not page.is_closed():
+        try:
+            await page.goto("about:blank")
+            # A persistent profile keeps its cookies on purpose
+            if context is not None:
+                await context.clear_cookies()
+            _IDLE_PAGES.append((context, page, uses))
+            return
+        except Exception:
+            pass
     try:
-        result = urlparse(url)
-        if not all([result.scheme, result.netloc]):
-            return False, f"Invalid URL format: {url}"
-        if result.scheme not in ['http', 'https']:
-            return False, f"Unsupported URL scheme: {result.scheme}"
-        return True, url
-    except Exception as e:
-        return False, f"URL parsing error: {e}"
+        await (context or page).close()
+    except Exception:
+        pass
+
+
+def _get_http_client():
+    """The shared httpx.AsyncClient, created on first use (browser loop only)."""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None:
+        _HTTP_CLIENT = httpx.AsyncClient(
+            follow_redirects=True,
+            timeout=httpx.Timeout(15.0, connect=5.0)
+        )
+    return _HTTP_CLIENT
+
+
+async def _conditional_get(url: str, etag: Optional[str], last_modified: Optional[str]) -> tuple:
+    """
+    GET url, revalidating against the given validators.
+
+    Returns:
+        (status, ETag, Last-Modified, body)
+    """
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    response = await _get_http_client().get(url, headers=headers)
+    return (
+        response.status_code,
+        response.headers.get("etag"),
+        response.headers.get("last-modified"),
+        response.content
+    )
+
+
+async def _fetch_static(url: str) -> Optional[Tuple[str, str]]:
+    """
+    Fetch url over plain HTTP if it doesn't need a browser.
+
+    Returns:
+        (body, content type), or None when the browser should render it
+    """
+    if httpx is None:
+        return None
+
+    try:
+        async with _get_http_client().stream("GET", url) as response:
+            if response.status_code != 200:
+                return None
+            content_type = response.headers.get("content-type", "")
+            content_type = content_type.split(";")[0].strip().lower()
+            is_html = content_type in ("text/html", "application/xhtml+xml")
+            # PDFs, images etc. are left to the browser path
+            if not is_html and not any(t in content_type for t in _RAW_CONTENT_TYPES):
+                return None
+
+            body = bytearray()
+            async for chunk in response.aiter_bytes():
+                body += chunk
+                if len(body) > MAX_CONTENT_SIZE_MB * 1024 * 1024:
+                    return None
+            text = body.decode(response.encoding or "utf-8", errors="replace")
+    except (httpx.HTTPError, LookupError):
+        return None
+
+    if is_html and (len(text) < _MIN_STATIC_HTML or _JS_SHELL_RE.search(text)):
+        return None
+    return text, content_type
+
+
+async def _block_heavy_requests(route) -> None:
+    """Route handler: abort media/styling and ad/analytics requests."""
+    request = route.request
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or _BLOCKED_HOSTS_RE.match(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _render_page(
+    url: str,
+    wait_for: str,
+    timeout: int,
+    screenshot: bool,
+    block_resources: bool = True,
+    wait_selector: Optional[str] = None,
+    full_page: bool = False,
+    with_text: bool = False
+) -> tuple:
+    """Load url in a pooled page of the shared browser.
+
+    Returns:
+        (rendered HTML, document content type), plus the body's rendered
+        text when with_text is set
+    """
+    # A screenshot needs the page as it looks, images and styles included
+    block = block_resources and not screenshot
+    context, page, uses = await _acquire_page()
+    try:
+        if block:
+            await page.route("**/*", _block_heavy_requests)
+
+        # Navigate and wait for page to load
+        await page.goto(url, wait_until=wait_for, timeout=timeout)
+        if wait_for == "domcontentloaded":
+            try:
+                await page.wait_for_function(
+                    _CONTENT_READY_JS, polling=250, timeout=CONTENT_WAIT_MS
+                )
+            except Exception:
+                pass  # Take whatever has rendered by now
+        if wait_selector:
+            try:
+                await page.wait_for_selector(wait_selector, timeout=10000)
+            except Exception:
+                pass
+
+        # Get rendered HTML, with the text and screenshot (if any) taken
+        # alongside - all are served by the same renderer, so they overlap
+        reads = [page.content(), page.evaluate("document.contentType")]
+        if with_text:
+            reads.append(page.inner_text("body"))
+        if screenshot:
+            # JPEG at quality 70 encodes and writes far faster than PNG
+            screenshot_path = Path(tempfile.gettempdir()) / f"playwright_{int(time.time())}.jpg"
+            reads.append(page.screenshot(
+                path=str(screenshot_path), type="jpeg", quality=70, full_page=full_page
+            ))
+        results = await asyncio.gather(*reads)
+
+        return tuple(results[:3 if with_text else 2])
+    finally:
+        if block:
+            try:
+                await page.unroute("**/*", _block_heavy_requests)
+            except Exception:
+                pass
+        await _release_page(context, page, uses)
+
+
+def _shutdown_browser() -> None:
+    """Close the shared browser and stop Playwright (at exit)."""
+    loop = _BROWSER_LOOP
+    if loop is None:
+        return
+
+    async def close():
+        task = _BROWSER_TASK
+        if task is not None and task.done() and not task.cancelled() \
+                and task.exception() is None:
+            await task.result().close()
+        if _PLAYWRIGHT is not None:
+            await _PLAYWRIGHT.stop()
+        if _HTTP_CLIENT is not None:
+            await _HTTP_CLIENT.aclose()
+
+    try:
+        asyncio.run_coroutine_threadsafe(close(), loop).result(timeout=10)
+    except Exception:
+        pass
+    loop.call_soon_threadsafe(loop.stop)
 
 
 def fetch_url_browser(
     url: str,
-    wait_for: str = "load",
+    wait_for: str = "domcontentloaded",
     timeout: int = 30000,
-    screenshot: bool = False
-) -> Tuple[bool, str]:
+    screenshot: bool = False,
+    block_resources: bool = True,
+    wait_selector: Optional[str] = None,
+    full_page: bool = False,
+    with_text: bool = False
+) -> Union[Tuple[bool, str], Tuple[bool, str, str]]:
     """
     Fetch URL content using Playwright browser automation.
 
@@ -136,69 +756,163 @@ def fetch_url_browser(
     Args:
         url: URL to fetch
         wait_for: When to consider page loaded ("load", "domcontentloaded", "networkidle")
-                  Default "load" works best for most modern sites
+                  Default "domcontentloaded" also waits briefly for the page's
+                  text to appear (see CONTENT_WAIT_MS)
         timeout: Maximum time to wait in milliseconds
-        screenshot: If True, also save screenshot to temp file
+        screenshot: If True, also save a JPEG screenshot to a temp file
+        block_resources: Skip images, fonts, media, stylesheets and ad/analytics
+                         hosts while loading (always off for screenshots)
+        wait_selector: Optional CSS selector to wait for (up to 10s), for
+                       single-page apps that render content late
+        full_page: Screenshot the whole scrollable page, not just the viewport
+        with_text: Also return the page's visible text, as the browser laid
+                   it out (document.body's innerText)
 
     Returns:
-        Tuple of (success: bool, rendered_html: str)
+        Tuple of (success: bool, rendered_html: str), or
+        (success, rendered_html, text) with with_text - text is "" on failure
     """
+    valid, msg = validate_url(url)
+    if not valid:
+        return (False, msg, "") if with_text else (False, msg)
+
+    return _fetch_url_browser(
+        url, wait_for, timeout, screenshot, block_resources, wait_selector, full_page,
+        with_text
+    )
+
+
+def _page_text(html: str, content_type: str) -> str:
+    """The part of a rendered page worth sending to Gemini."""
+    if trafilatura is None or any(t in content_type for t in _RAW_CONTENT_TYPES):
+        return html
     try:
-        from playwright.sync_api import sync_playwright
+        extracted = trafilatura.extract(
+            html, include_tables=True, include_comments=False, with_metadata=True
+        )
+    except Exception:
+        extracted = None
+    return extracted or html
+
+
+def _playwright_missing() -> Optional[str]:
+    """The error to report when Playwright isn't installed, else None."""
+    try:
+        import playwright.async_api  # noqa: F401
     except ImportError:
-        return False, red(
+        return red(
             "I'm sorry - Playwright is not installed.\n\n"
             "To fix this:\n"
             "• Run: pip install playwright\n"
             "• Run: playwright install chromium\n"
             "• Try again"
         )
+    return None
 
-    valid, msg = validate_url(url)
-    if not valid:
-        return False, msg
 
-    try:
-        with sync_playwright() as p:
-            # Launch headless browser
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-
-            # Navigate and wait for page to load
-            page.goto(url, wait_until=wait_for, timeout=timeout)
-
-            # Get rendered HTML
-            html = page.content()
-
-            # Optionally take screenshot
-            screenshot_path = None
-            if screenshot:
-                screenshot_path = Path(tempfile.gettempdir()) / f"playwright_{int(time.time())}.png"
-                page.screenshot(path=str(screenshot_path))
-
-            browser.close()
-
-            if not html or len(html) < 100:
-                return False, red(
-                    f"I'm sorry - the page at {url} didn't render any content.\n\n"
-                    "What might help:\n"
-                    "• Check if the URL works in your browser\n"
-                    "• The page might require authentication\n"
-                    "• Try a different URL"
-                )
+class _BrowserUnavailable(Exception):
+    """A page needed the browser, but Playwright isn't installed."""
 
-            return True, html
 
-    except Exception as e:
+def _render_result(url: str, outcome, for_prompt: bool) -> Tuple[bool, str]:
+    """Turn a _render_page outcome (or the exception it raised) into a result."""
+    if isinstance(outcome, _BrowserUnavailable):
+        return False, str(outcome)
+    if isinstance(outcome, BaseException):
         return False, red(
             f"I'm sorry - I couldn't load {url} in the browser.\n\n"
-            f"Error: {str(e)}\n\n"
+            f"Error: {str(outcome)}\n\n"
             "What might help:\n"
             "• Check if the URL is accessible\n"
             "• The page might be blocking automated browsers\n"
             "• Try again later"
         )
 
+    html, content_type = outcome[:2]
+    # A short JSON/text document is still a real answer
+    if not html or (len(html) < 100 and 'html' in content_type):
+        return False, red(
+            f"I'm sorry - the page at {url} didn't render any content.\n\n"
+            "What might help:\n"
+            "• Check if the URL works in your browser\n"
+            "• The page might require authentication\n"
+            "• Try a different URL"
+        )
+
+    return True, _page_text(html, content_type) if for_prompt else html
+
+
+def _fetch_url_browser(
+    url: str,
+    wait_for: str = "domcontentloaded",
+    timeout: int = 30000,
+    screenshot: bool = False,
+    block_resources: bool = True,
+    wait_selector: Optional[str] = None,
+    full_page: bool = False,
+    with_text: bool = False
+) -> Union[Tuple[bool, str], Tuple[bool, str, str]]:
+    """fetch_url_browser for a URL the caller has already validated."""
+    missing = _playwright_missing()
+    if missing:
+        return (False, missing, "") if with_text else (False, missing)
+
+    try:
+        outcome = asyncio.run_coroutine_threadsafe(
+            _render_page(
+                url, wait_for, timeout, screenshot, block_resources, wait_selector,
+                full_page, with_text
+            ),
+            _get_browser_loop()
+        ).result()
+    except Exception as e:
+        outcome = e
+    success, result = _render_result(url, outcome, for_prompt=False)
+    if with_text:
+        return success, result, outcome[2] if success else ""
+    return success, result
+
+
+async def _render_pages(urls: List[str], browser_missing: Optional[str]) -> list:
+    """
+    Load urls concurrently, at most FETCH_WORKERS at a time - over plain
+    HTTP when the content is static, otherwise in the browser.
+    """
+    semaphore = asyncio.Semaphore(FETCH_WORKERS)
+
+    async def render(url: str):
+        async with semaphore:
+            static = await _fetch_static(url)
+            if static is not None:
+                return static
+            if browser_missing:
+                raise _BrowserUnavailable(browser_missing)
+            return await _render_page(url, "domcontentloaded", 30000, False)
+
+    return await asyncio.gather(*(render(url) for url in urls), return_exceptions=True)
+
+
+def _fetch_pages(urls: List[str]) -> List[Tuple[bool, str]]:
+    """
+    Load several validated URLs for a prompt, in one batch on the browser
+    loop - no thread per page. A page that fails gets its error result
+    rather than failing the batch.
+    """
+    missing = _playwright_missing()
+    if missing and httpx is None:
+        return [(False, missing)] * len(urls)
+
+    try:
+        outcomes = asyncio.run_coroutine_threadsafe(
+            _render_pages(urls, missing), _get_browser_loop()
+        ).result()
+    except Exception as e:
+        outcomes = [e] * len(urls)
+    return [
+        _render_result(url, outcome, for_prompt=True)
+        for url, outcome in zip(urls, outcomes)
+    ]
+
 
 def web_search(
     query: str,
@@ -224,19 +938,7 @@ def web_search(
     """
     source_note = "Include source URLs for all information provided." if include_sources else ""
 
-    prompt = f"""Search the web for: {query}
-
-Use Google Search to find current, accurate information.
-{source_note}
-
-Provide:
-1. Direct answer to the query
-2. Supporting information from multiple sources
-3. Source URLs (if requested)
-4. Date relevance of information
-5. Any conflicting information found
-
-Focus on authoritative and recent sources."""
+    prompt = _PROMPT_WEB_SEARCH.format(query=query, source_note=source_note)
 
     return call_gemini(prompt, account, timeout=60)
 
@@ -270,64 +972,65 @@ def fetch_url(
 
     # Fetch content using browser automation
     if use_browser:
-        success, html = fetch_url_browser(url)
+        success, html = _fetch_pages([url])[0]
         if not success:
             return False, html  # html contains error message
     else:
         # Fallback to Gemini CLI (old behavior, doesn't handle JS)
         query_note = f"\nSpecific question: {query}" if query else ""
-        prompt = f"""Fetch and analyze the content from: {url}
-{query_note}
-
-Provide:
-1. Content type detected
-2. Main content summary
-3. Key information extracted
-4. Answer to specific question (if provided)
-5. Metadata (title, author, date if available)
-
-If the content is too large, summarize the most relevant parts."""
+        prompt = _PROMPT_FETCH_URL.format(url=url, query_note=query_note)
         return call_gemini(prompt, account, timeout=120)
 
-    # Ask Gemini to analyze the rendered HTML
+    # Ask Gemini to analyze the rendered page
     query_note = f"\nSpecific question: {query}" if query else ""
 
-    analysis_prompt = f"""I fetched the content from {url} using a browser to handle JavaScript rendering.
-
-Here is the rendered HTML content:
+    analysis_prompt = _PROMPT_ANALYZE_PAGE.format(
+        url=url,
+        content=html[:50000],
+        query_note=query_note,
+    )
 
-{html[:50000]}
+    return call_gemini(analysis_prompt, account, timeout=180)
 
-{query_note}
 
-Please analyze this content and provide:
-1. Content type and purpose
-2. Main content summary
-3. Key information extracted
-4. Answer to specific question (if provided)
-5. Metadata (title, author, date if visible)
+def _summarize_page(url: str, text: str, query: Optional[str], account: int) -> Tuple[bool, str]:
+    """Map step of fetch_multiple_urls: summarize one rendered page."""
+    query_note = f"\nQuery to apply: {query}" if query else ""
 
-If the content is too large, focus on the most relevant parts."""
+    prompt = _PROMPT_SUMMARIZE_PAGE.format(
+        url=url,
+        content=text[:MAX_HTML_PER_URL],
+        query_note=query_note,
+    )
 
-    return call_gemini(analysis_prompt, account, timeout=180)
+    return call_gemini(prompt, account, timeout=120)
 
 
 def fetch_multiple_urls(
     urls: List[str],
     query: str = None,
-    account: int = 1
+    account: int = 1,
+    use_browser: bool = True
 ) -> Tuple[bool, str]:
     """
     Fetch and analyze content from multiple URLs.
 
+    Pages are rendered in the browser concurrently, each rendered page is
+    summarized by its own small Gemini call (concurrently), and one final
+    call synthesizes the summaries.
+
     Args:
         urls: List of URLs to fetch (max 20)
         query: Optional query to apply across all URLs
         account: Gemini account to use
+        use_browser: If True, render pages with Playwright first (default: True)
 
     Returns:
         Tuple of (success: bool, combined_analysis: str)
     """
+    if not urls:
+        return False, "No URLs provided"
+
     if len(urls) > MAX_URLS_PER_REQUEST:
         return False, f"Too many URLs: {len(urls)}. Maximum is {MAX_URLS_PER_REQUEST}"
 
@@ -337,22 +1040,46 @@ def fetch_multiple_urls(
         if not valid:
             return False, msg
 
-    urls_formatted = "\n".join([f"- {url}" for url in urls])
     query_note = f"\nQuery to apply: {query}" if query else ""
 
-    prompt = f"""Fetch and analyze content from these URLs:
-{urls_formatted}
-{query_note}
+    fetched = _fetch_pages(urls) if use_browser else []
+
+    rendered = [(url, text) for url, (success, text) in zip(urls, fetched) if success]
+    if rendered:
+        # Map: summarize pages concurrently - each call is a subprocess wait
+        with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(rendered))) as executor:
+            summaries = dict(zip(
+                (url for url, _ in rendered),
+                executor.map(lambda page: _summarize_page(*page, query, account), rendered)
+            ))
+
+        sections = []
+        for url in urls:
+            if url not in summaries:
+                sections.append(f"=== {url} ===\n(could not be loaded in the browser)")
+                continue
+            success, summary = summaries[url]
+            sections.append(
+                f"=== {url} ===\n{summary}" if success
+                else f"=== {url} ===\n(summary unavailable: {summary})"
+            )
+        pages = "\n\n".join(sections)
+
+        # Reduce: one call over the much smaller summaries
+        analysis_prompt = _PROMPT_SYNTHESIZE_PAGES.format(
+            pages=pages,
+            query_note=query_note,
+        )
 
-For each URL, provide:
-1. URL identifier
-2. Content summary
-3. Key information relevant to query
+        return call_gemini(analysis_prompt, account, timeout=180)
 
-Then provide:
-- Combined synthesis of information
-- Comparison across sources
-- Answer to query based on all sources"""
+    # No browser (or no page rendered): let Gemini fetch the URLs itself
+    urls_formatted = "\n".join([f"- {url}" for url in urls])
+
+    prompt = _PROMPT_FETCH_URLS.format(
+        urls_formatted=urls_formatted,
+        query_note=query_note,
+    )
 
     return call_gemini(prompt, account, timeout=180)
 
@@ -377,23 +1104,10 @@ def extract_links(
     if not valid:
         return False, msg
 
-    filter_instructions = {
-        "all": "Extract all links found on the page",
-        "internal": "Extract only internal links (same domain)",
-        "external": "Extract only external links (different domains)",
-        "images": "Extract only image URLs",
-        "documents": "Extract links to documents (PDF, DOC, XLS, etc.)"
-    }
-
-    prompt = f"""Analyze the web page: {url}
-
-{filter_instructions.get(link_type, filter_instructions['all'])}
-
-Provide:
-1. List of extracted URLs
-2. Link text/context for each
-3. Count by category
-4. Any notable patterns in the link structure"""
+    prompt = _PROMPT_EXTRACT_LINKS.format(
+        url=url,
+        instructions=_LINK_FILTERS.get(link_type, _LINK_FILTERS['all']),
+    )
 
     return call_gemini(prompt, account)
 
@@ -418,34 +1132,11 @@ def scrape_structured_data(
     if not valid:
         return False, msg
 
-    data_schemas = {
-        "auto": "Detect the page type and extract appropriate structured data",
-        "product": "Extract: name, price, description, images, reviews, availability, SKU",
-        "article": "Extract: title, author, date, content, categories, tags, related articles",
-        "contact": "Extract: name, organization, email, phone, address, social media",
-        "event": "Extract: title, date, time, location, description, organizer, tickets",
-        "recipe": "Extract: title, ingredients, instructions, prep time, cook time, servings, nutrition"
-    }
-
-    prompt = f"""Scrape structured data from: {url}
-
-Data type: {data_type}
-{data_schemas.get(data_type, data_schemas['auto'])}
-
-Format the extracted data as JSON:
-```json
-{{
-  "page_type": "detected type",
-  "url": "{url}",
-  "data": {{
-    // extracted fields
-  }},
-  "metadata": {{
-    "extraction_confidence": "high/medium/low",
-    "missing_fields": []
-  }}
-}}
-```"""
+    prompt = _PROMPT_SCRAPE.format(
+        url=url,
+        data_type=data_type,
+        schema=_DATA_SCHEMAS.get(data_type, _DATA_SCHEMAS['auto']),
+    )
 
     return call_gemini(prompt, account)
 
@@ -466,27 +1157,35 @@ def search_and_summarize(
     Returns:
         Tuple of (success: bool, research_summary: str)
     """
-    depth_instructions = {
-        "quick": "Provide a quick summary from 1-2 authoritative sources",
-        "standard": "Research from 3-5 diverse sources for balanced coverage",
-        "deep": "Conduct thorough research from 5-10 sources including academic and primary sources"
-    }
+    prompt = _PROMPT_RESEARCH.format(
+        topic=topic,
+        instructions=_RESEARCH_DEPTHS.get(depth, _RESEARCH_DEPTHS['standard']),
+    )
 
-    prompt = f"""Research topic: {topic}
+    return call_gemini(prompt, account, timeout=180)
 
-{depth_instructions.get(depth, depth_instructions['standard'])}
 
-Provide:
-1. Executive Summary (2-3 paragraphs)
-2. Key Facts and Findings
-3. Different Perspectives (if applicable)
-4. Current State/Latest Developments
-5. Open Questions or Controversies
-6. Source List with URLs
+def _get_etag_cache():
+    """The shared EtagCache, or None if it's unavailable."""
+    global _ETAG_CACHE
+    if EtagCache is None:
+        return None
+    with _ETAG_CACHE_LOCK:
+        if _ETAG_CACHE is None:
+            try:
+                _ETAG_CACHE = EtagCache()
+            except Exception:
+                return None
+    return _ETAG_CACHE
 
-Ensure information is current and accurate."""
 
-    return call_gemini(prompt, account, timeout=180)
+def _monitor_key(url: str, previous_note: str, focus_note: str) -> str:
+    """
+    EtagCache key for a change check: the URL plus a hash of the prompt
+    notes, so a report is only reused for the same comparison and focus.
+    """
+    notes = hashlib.sha256(f"{previous_note}\0{focus_note}".encode('utf-8')).hexdigest()
+    return f"{url}#{notes[:16]}"
 
 
 def monitor_page_changes(
@@ -498,6 +1197,11 @@ def monitor_page_changes(
     """
     Check a page for changes compared to previous content.
 
+    The page's ETag/Last-Modified and a hash of its body are remembered
+    on disk; when the server answers 304 or the body is unchanged since
+    the last check with the same previous_content and focus_areas, the
+    last report is returned without calling Gemini.
+
     Args:
         url: URL to check
         previous_content: Summary of previous content to compare against
@@ -514,20 +1218,48 @@ def monitor_page_changes(
     previous_note = f"\nPrevious content summary:\n{previous_content}" if previous_content else ""
     focus_note = f"\nFocus areas: {', '.join(focus_areas)}" if focus_areas else ""
 
-    prompt = f"""Fetch current content from: {url}
-{previous_note}
-{focus_note}
+    cache = _get_etag_cache() if httpx is not None else None
+    cache_key = _monitor_key(url, previous_note, focus_note)
+    fresh = None
+    if cache is not None:
+        try:
+            row = cache.get(cache_key)
+            fresh = asyncio.run_coroutine_threadsafe(
+                _conditional_get(url, row and row["etag"], row and row["last_modified"]),
+                _get_browser_loop()
+            ).result()
+        except Exception:
+            row = fresh = None
+
+        if row is not None and fresh is not None:
+            status, _, _, body = fresh
+            reason = None
+            if status == 304:
+                reason = "the server answered 304 Not Modified"
+            elif status == 200 and hashlib.sha256(body).digest() == row["sha256"]:
+                reason = "the content is identical"
+            if reason:
+                return True, (
+                    f"No changes detected at {url} since the last check ({reason}).\n\n"
+                    f"Last report:\n{row['summary']}"
+                )
 
-Provide:
-1. Current content summary
-2. Detected changes (if previous content provided):
-   - New content added
-   - Content removed
-   - Content modified
-3. Timestamp of analysis
-4. Recommendations for monitoring frequency"""
+    prompt = _PROMPT_MONITOR.format(
+        url=url,
+        previous_note=previous_note,
+        focus_note=focus_note,
+    )
 
-    return call_gemini(prompt, account)
+    # Never answer a change check from the response cache
+    success, report = call_gemini(prompt, account, no_cache=True)
+
+    if success and fresh is not None and fresh[0] == 200:
+        _, etag, last_modified, body = fresh
+        try:
+            cache.put(cache_key, etag, last_modified, hashlib.sha256(body).digest(), report)
+        except Exception:
+            pass
+    return success, report
 
 
 def verify_claim(
@@ -544,21 +1276,76 @@ def verify_claim(
     Returns:
         Tuple of (success: bool, verification_result: str)
     """
-    prompt = f"""Fact-check this claim: "{claim}"
+    prompt = _PROMPT_VERIFY_CLAIM.format(claim=claim)
 
-Use web search to verify accuracy.
+    return call_gemini(prompt, account, timeout=90)
 
-Provide:
-1. Verdict: TRUE / FALSE / PARTIALLY TRUE / UNVERIFIABLE
-2. Confidence level: HIGH / MEDIUM / LOW
-3. Evidence supporting the verdict
-4. Evidence contradicting the claim (if any)
-5. Context that affects interpretation
-6. Source URLs for verification
 
-Be objective and thorough."""
+def batch_gemini(
+    prompts: List[str],
+    account: int = 1,
+    timeout: int = 180
+) -> List[Tuple[bool, str]]:
+    """
+    Answer several independent prompts with one Gemini call.
 
-    return call_gemini(prompt, account, timeout=90)
+    For chained tool calls (e.g. a search, a fetch and a fact-check) this
+    pays the CLI's process and auth start-up once instead of per prompt.
+    Prompts already in the response cache aren't resent, and any answer
+    missing from the combined response is fetched with its own call.
+
+    Args:
+        prompts: The prompts to answer
+        account: Gemini account to use
+        timeout: Timeout for the combined call
+
+    Returns:
+        One (success, response) per prompt, in order
+    """
+    results: List[Optional[Tuple[bool, str]]] = [None] * len(prompts)
+    pending = []
+    for i, prompt in enumerate(prompts):
+        cached = _cached_response(prompt)
+        if cached is not None:
+            results[i] = (True, cached)
+        else:
+            pending.append(i)
+
+    if len(pending) == 1:
+        i = pending[0]
+        results[i] = call_gemini(prompts[i], account, timeout)
+    elif pending:
+        sections = "\n\n".join(
+            f"[{n}]\n{prompts[i]}" for n, i in enumerate(pending, 1)
+        )
+        combined = (
+            "Answer each of the following requests independently. Begin each "
+            "answer with a line containing only its marker, like === [1] ===, "
+            "and write nothing before the first marker.\n\n" + sections
+        )
+        success, response = call_gemini(combined, account, timeout, no_cache=True)
+        if not success:
+            for i in pending:
+                results[i] = (False, response)
+            return results
+
+        # Text between one marker and the next is that request's answer
+        markers = list(_BATCH_MARKER_RE.finditer(response))
+        answers = {}
+        for m, nxt in zip(markers, markers[1:] + [None]):
+            end = nxt.start() if nxt else len(response)
+            answer = response[m.end():end].strip()
+            if answer:
+                answers.setdefault(int(m.group(1)), answer)
+
+        for n, i in enumerate(pending, 1):
+            if n in answers:
+                _cache_response(prompts[i], answers[n])
+                results[i] = (True, answers[n])
+            else:
+                results[i] = call_gemini(prompts[i], account, timeout)
+
+    return results
 
 
 # Tool registry
@@ -571,4 +1358,5 @@ WEB_TOOLS = {
     "search_and_summarize": search_and_summarize,
     "monitor_page_changes": monitor_page_changes,
     "verify_claim": verify_claim,
+    "batch_gemini": batch_gemini,
 }
@@ -4,6 +4,7 @@ Utilities Package
 Helper functions for the Gemini Agentic CLI.
 """
 
-from .colors import green, yellow, red
+from .colors import green, yellow, red, cwrite
+from .etag_cache import EtagCache
 
-__all__ = ['green', 'yellow', 'red']
+__all__ = ['green', 'yellow', 'red', 'cwrite', 'EtagCache']
@@ -18,7 +18,10 @@ def _supports_color() -> bool:
         True if colors should be used, False otherwise
     """
     # Check if stdout is a TTY
-    if not hasattr(sys.stdout, 'isatty') or not sys.stdout.isatty():
+    try:
+        if not sys.stdout.isatty():
+            return False
+    except AttributeError:
         return False
 
     # Windows 10+ supports ANSI codes
@@ -39,7 +42,7 @@ RESET = '\033[0m'
 _COLOR_ENABLED = _supports_color()
 
 
-def green(text: str) -> str:
+def _green(text: str) -> str:
     """
     Make text green (for positive status, thinking, working).
 
@@ -47,14 +50,12 @@ def green(text: str) -> str:
         text: The text to colorize
 
     Returns:
-        Colorized text if terminal supports it, plain text otherwise
+        Colorized text
     """
-    if not _COLOR_ENABLED:
-        return text
-    return f"{GREEN}{text}{RESET}"
+    return GREEN + text + RESET
 
 
-def yellow(text: str) -> str:
+def _yellow(text: str) -> str:
     """
     Make text yellow (for tool execution, actions in progress).
 
@@ -62,14 +63,12 @@ def yellow(text: str) -> str:
         text: The text to colorize
 
     Returns:
-        Colorized text if terminal supports it, plain text otherwise
+        Colorized text
     """
-    if not _COLOR_ENABLED:
-        return text
-    return f"{YELLOW}{text}{RESET}"
+    return YELLOW + text + RESET
 
 
-def red(text: str) -> str:
+def _red(text: str) -> str:
     """
     Make text red (for errors, timeouts, problems).
 
@@ -77,8 +76,57 @@ def red(text: str) -> str:
         text: The text to colorize
 
     Returns:
-        Colorized text if terminal supports it, plain text otherwise
+        Colorized text
     """
-    if not _COLOR_ENABLED:
-        return text
-    return f"{RED}{text}{RESET}"
+    return RED + text + RESET
+
+
+def _plain(text: str) -> str:
+    """Return text unchanged (terminal without color support)."""
+    return text
+
+
+def _bind_colorizers():
+    """Point green/yellow/red at the colorizers or at _plain."""
+    global green, yellow, red
+    if _COLOR_ENABLED:
+        green, yellow, red = _green, _yellow, _red
+    else:
+        green = yellow = red = _plain
+
+
+def refresh_color_support() -> bool:
+    """
+    Re-check color support, e.g. after sys.stdout has been replaced.
+
+    Only this module's green/yellow/red are rebound; names already
+    imported elsewhere keep the colorizer they were imported with.
+
+    Returns:
+        True if colors are now enabled
+    """
+    global _COLOR_ENABLED
+    _COLOR_ENABLED = _supports_color()
+    _bind_colorizers()
+    return _COLOR_ENABLED
+
+
+# Bind the public names once, so calls don't re-check color support
+_bind_colorizers()
+
+
+def cwrite(text: str, color: str = '') -> None:
+    """
+    Write text to stdout, in the given color code if colors are enabled.
+
+    For streaming many lines: a single write with no print() argument
+    handling, and no newline is added. Python block-buffers stdout when it
+    isn't a terminal, so piped output isn't flushed per line.
+
+    Args:
+        text: The text to write
+        color: An escape code such as GREEN, or '' for plain text
+    """
+    if color and _COLOR_ENABLED:
+        text = color + text + RESET
+    sys.stdout.write(text)
@@ -0,0 +1,92 @@
+"""
+ETag Cache - SQLite-backed Validators for Monitored Pages
+
+Remembers, per URL, the HTTP validators (ETag, Last-Modified) and a hash of
+the last body seen, along with the summary produced for it. Lets
+monitor_page_changes answer "no changes" from a 304 or an identical body
+without another Gemini call.
+
+Schema:
+- url: Page URL, or a caller-chosen key for it (primary key)
+- etag: Last ETag header, if any
+- last_modified: Last Last-Modified header, if any
+- sha256: Digest of the last body
+- summary: Last change report for the page
+- ts: Unix timestamp of the last update
+"""
+
+import sqlite3
+import os
+import time
+from typing import Optional, Dict, Any
+from pathlib import Path
+
+
+class EtagCache:
+    """
+    Persistent URL -> (validators, content hash, summary) store.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            db_path: Path to SQLite database. Defaults to ~/.gemini/etag_cache.db
+        """
+        if db_path is None:
+            db_path = os.path.expanduser("~/.gemini/etag_cache.db")
+
+        self.db_path = db_path
+
+        # Ensure directory exists
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._init_db()
+
+    def _init_db(self):
+        """Initialize the database schema."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS pages (
+                    url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    sha256 BLOB,
+                    summary TEXT,
+                    ts INTEGER
+                )
+            """)
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up what was stored for a URL.
+
+        Returns:
+            Dict with etag, last_modified, sha256, summary and ts, or None
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            row = conn.execute(
+                "SELECT etag, last_modified, sha256, summary, ts FROM pages WHERE url = ?",
+                (url,)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def put(
+        self,
+        url: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        sha256: bytes,
+        summary: str
+    ):
+        """Store (or replace) the validators, hash and summary for a URL."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO pages (url, etag, last_modified, sha256, summary, ts)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (url, etag, last_modified, sha256, summary, int(time.time()))
+            )
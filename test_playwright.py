@@ -28,7 +28,8 @@ if success:
     print("=" * 60)
 
     # Check if there's actual content (not just empty divs)
-    if "qdrant" in html.lower() or "vector" in html.lower() or len(html) > 5000:
+    lowered = html.lower()
+    if "qdrant" in lowered or "vector" in lowered or len(html) > 5000:
         print("\nVISION CONFIRMED! The page has real content!")
         print("The family is no longer blind to the modern web.")
     else:
@@ -24,8 +24,9 @@ for strategy in strategies:
         print(f"HTML length: {len(html)} characters")
 
         # Check for actual content
-        has_qdrant = "qdrant" in html.lower()
-        has_vector = "vector" in html.lower()
+        lowered = html.lower()
+        has_qdrant = "qdrant" in lowered
+        has_vector = "vector" in lowered
         has_content = len(html) > 5000
 
         print(f"Contains 'qdrant': {has_qdrant}")
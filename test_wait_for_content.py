@@ -9,21 +9,32 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from playwright.sync_api import sync_playwright
+from tools.web import CHROMIUM_ARGS
 
 test_url = "https://gemini.google.com/share/279bc5291f81"
 
+# Words that suggest conversation markup
+MESSAGE_WORDS = ('message', 'response', 'query', 'answer')
+
 print("Testing with additional wait for content...")
 
 try:
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
+        browser = p.chromium.launch(headless=True, args=CHROMIUM_ARGS)
         page = browser.new_page()
 
         print("Loading page...")
         page.goto(test_url, wait_until="load", timeout=15000)
 
-        print("Waiting 5 seconds for content to load...")
-        page.wait_for_timeout(5000)  # Wait 5 more seconds for dynamic content
+        print("Waiting for content to load...")
+        try:
+            # Returns as soon as the conversation text shows up (up to 10 seconds)
+            page.wait_for_function(
+                "document.body.innerText.length > 500",
+                timeout=10000
+            )
+        except:
+            print("Timeout waiting for content, proceeding anyway...")
 
         html = page.content()
         browser.close()
@@ -35,15 +46,14 @@ try:
             f.write(html)
 
         # Check for content
-        if "qdrant" in html.lower():
+        lowered = html.lower()
+        if "qdrant" in lowered:
             print("FOUND 'qdrant' in the content!")
         elif len(html) > 500000:
             print("Large content fetched - might have conversation data")
 
-            # Try to find any conversation-like patterns
-            import re
             # Look for common message patterns
-            if re.search(r'message|response|query|answer', html, re.I):
+            if any(word in lowered for word in MESSAGE_WORDS):
                 print("Found message-related content")
         else:
             print("Content might still be loading dynamically")
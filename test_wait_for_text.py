@@ -9,6 +9,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from playwright.sync_api import sync_playwright
+from tools.web import CHROMIUM_ARGS
 
 test_url = "https://gemini.google.com/share/279bc5291f81"
 
@@ -16,7 +17,7 @@ print("Testing smart wait for content...")
 
 try:
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
+        browser = p.chromium.launch(headless=True, args=CHROMIUM_ARGS)
         page = browser.new_page()
 
         print("Loading page...")
@@ -36,7 +37,7 @@ try:
             print("Timeout waiting for content, proceeding anyway...")
 
         html = page.content()
-        text = page.evaluate("document.body.innerText")
+        text = page.inner_text("body")
 
         browser.close()
 
@@ -9,6 +9,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from playwright.sync_api import sync_playwright
+from tools.web import CHROMIUM_ARGS
 
 test_url = "https://gemini.google.com/share/279bc5291f81"
 
@@ -19,7 +20,7 @@ try:
         # Launch with more realistic browser settings
         browser = p.chromium.launch(
             headless=True,
-            args=[
+            args=CHROMIUM_ARGS + [
                 '--disable-blink-features=AutomationControlled'
             ]
         )
@@ -43,9 +44,16 @@ try:
         page.goto(test_url, wait_until="load", timeout=15000)
 
         print("Waiting for content...")
-        page.wait_for_timeout(8000)  # Wait 8 seconds for dynamic load
-
-        text = page.evaluate("document.body.innerText")
+        try:
+            # Returns as soon as the conversation text shows up (up to 10 seconds)
+            page.wait_for_function(
+                "document.body.innerText.length > 500",
+                timeout=10000
+            )
+        except:
+            print("Timeout waiting for content, proceeding anyway...")
+
+        text = page.inner_text("body")
 
         browser.close()
 
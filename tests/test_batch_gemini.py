@@ -0,0 +1,57 @@
+"""
+batch_gemini tests - splitting one combined Gemini reply back into answers.
+
+call_gemini is replaced with a stub, so nothing is sent anywhere.
+"""
+
+import pytest
+
+web = pytest.importorskip("tools.web")
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    """Record prompts sent to call_gemini and answer them from a script."""
+    sent = []
+    replies = {}
+
+    def fake_call_gemini(query, account=1, timeout=120, no_cache=False):
+        sent.append(query)
+        for key, reply in replies.items():
+            if key in query:
+                return reply
+        return True, f"single answer to {query}"
+
+    monkeypatch.setattr(web, "call_gemini", fake_call_gemini)
+    monkeypatch.setattr(web, "_GEMINI_CACHE", type(web._GEMINI_CACHE)())
+    return sent, replies
+
+
+def test_answers_are_split_on_markers(calls):
+    sent, replies = calls
+    replies["independently"] = (True, "=== [1] ===\nfirst\n\n=== [2] ===\nsecond\nline two")
+
+    results = web.batch_gemini(["q one", "q two"])
+    assert results == [(True, "first"), (True, "second\nline two")]
+    assert len(sent) == 1
+
+
+def test_missing_answer_is_fetched_alone(calls):
+    sent, replies = calls
+    replies["independently"] = (True, "=== [2] ===\nonly the second")
+
+    results = web.batch_gemini(["q one", "q two"])
+    assert results == [(True, "single answer to q one"), (True, "only the second")]
+    assert sent[-1] == "q one"
+
+
+def test_failed_combined_call_fails_every_prompt(calls):
+    _, replies = calls
+    replies["independently"] = (False, "Timeout")
+    assert web.batch_gemini(["a", "b"]) == [(False, "Timeout"), (False, "Timeout")]
+
+
+def test_single_prompt_is_sent_as_is(calls):
+    sent, _ = calls
+    assert web.batch_gemini(["solo"]) == [(True, "single answer to solo")]
+    assert sent == ["solo"]
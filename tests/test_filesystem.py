@@ -0,0 +1,136 @@
+"""
+Filesystem tool tests.
+
+Everything runs in pytest's tmp_path; no network or Gemini access needed.
+"""
+
+import os
+import sys
+
+import pytest
+
+from tools import filesystem as fs
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason="symlinks need privileges on Windows")
+def test_recursive_delete_does_not_follow_inner_symlinks(tmp_path):
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "keep.txt").write_text("data")
+    tree = tmp_path / "tree"
+    (tree / "sub").mkdir(parents=True)
+    (tree / "sub" / "file.txt").write_text("x")
+    (tree / "sub" / "link").symlink_to(outside, target_is_directory=True)
+
+    success, _ = fs.delete_directory(str(tree), recursive=True)
+    assert success
+    assert not tree.exists()
+    assert (outside / "keep.txt").read_text() == "data"
+
+
+def test_delete_directory_requires_recursive_for_contents(tmp_path):
+    (tmp_path / "d").mkdir()
+    (tmp_path / "d" / "f").write_text("")
+    success, _ = fs.delete_directory(str(tmp_path / "d"))
+    assert not success
+    assert (tmp_path / "d" / "f").exists()
+
+
+def test_edit_file_replaces_first_occurrence_only(tmp_path):
+    target = tmp_path / "code.py"
+    target.write_bytes(b"x = 1\nx = 1\n")
+    success, _ = fs.edit_file(str(target), "x = 1", "x = 2")
+    assert success
+    assert target.read_bytes() == b"x = 2\nx = 1\n"
+
+
+def test_edit_file_missing_text_changes_nothing(tmp_path):
+    target = tmp_path / "code.py"
+    target.write_bytes(b"a\n")
+    success, _ = fs.edit_file(str(target), "b", "c")
+    assert not success
+    assert target.read_bytes() == b"a\n"
+
+
+def test_edit_file_keeps_crlf_line_endings(tmp_path):
+    target = tmp_path / "win.txt"
+    target.write_bytes(b"one\r\ntwo\r\nthree\r\n")
+    success, _ = fs.edit_file(str(target), "one\ntwo", "uno\ndos")
+    assert success
+    assert target.read_bytes() == b"uno\r\ndos\r\nthree\r\n"
+
+
+def test_edit_file_leaves_other_lines_untouched(tmp_path):
+    # Mixed endings outside the edited span keep their exact bytes
+    target = tmp_path / "mixed.txt"
+    target.write_bytes(b"a\r\nb\nc\r\n")
+    success, _ = fs.edit_file(str(target), "b", "B")
+    assert success
+    assert target.read_bytes() == b"a\r\nB\nc\r\n"
+
+
+def test_edit_file_keeps_latin1_encoding(tmp_path):
+    target = tmp_path / "legacy.txt"
+    target.write_bytes("caf\xe9 ol\xe9\n".encode('latin-1'))
+    success, _ = fs.edit_file(str(target), "ol\xe9", "s\xed")
+    assert success
+    assert target.read_bytes() == "caf\xe9 s\xed\n".encode('latin-1')
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason="symlinks need privileges on Windows")
+def test_resolve_path_sees_retargeted_symlink(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    os.symlink("a", "link")
+    assert fs.resolve_path("link/x") == tmp_path.resolve() / "a" / "x"
+
+    os.unlink("link")
+    os.symlink("b", "link")
+    fs.note_change()
+    assert fs.resolve_path("link/x") == tmp_path.resolve() / "b" / "x"
+
+
+def test_list_directory_sorts_by_name(tmp_path):
+    (tmp_path / "b.txt").write_text("")
+    (tmp_path / "a.txt").write_text("")
+    (tmp_path / "c").mkdir()
+    success, listing = fs.list_directory(str(tmp_path))
+    assert success
+    assert listing.index("a.txt") < listing.index("b.txt") < listing.index("c")
+
+
+def test_write_then_read_roundtrip(tmp_path):
+    target = tmp_path / "sub" / "note.txt"
+    success, _ = fs.write_file(str(target), "hello\nworld\n")
+    assert success
+    success, content = fs.read_file(str(target))
+    assert success
+    assert "hello" in content and "world" in content
+
+
+def test_write_leaves_no_temp_files(tmp_path):
+    target = tmp_path / "a.txt"
+    fs.write_file(str(target), "one")
+    fs.write_file(str(target), "two")
+    assert os.listdir(tmp_path) == ["a.txt"]
+    assert target.read_text() == "two"
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason="POSIX permissions")
+def test_new_file_mode_follows_umask(tmp_path):
+    old = os.umask(0o027)
+    try:
+        fs.write_file(str(tmp_path / "new.txt"), "x")
+    finally:
+        os.umask(old)
+    assert (tmp_path / "new.txt").stat().st_mode & 0o777 == 0o640
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason="POSIX permissions")
+def test_overwrite_keeps_existing_mode(tmp_path):
+    target = tmp_path / "secret.txt"
+    target.write_text("old")
+    target.chmod(0o600)
+    fs.write_file(str(target), "new")
+    assert target.stat().st_mode & 0o777 == 0o600
@@ -0,0 +1,75 @@
+"""
+Live API audio tests - the capture ring and voice activity detection.
+
+Only in-memory audio is used; no microphone, speakers or socket.
+"""
+
+import struct
+import threading
+import time
+
+from tools.live_api import AudioCapture, AudioRing, LiveConfig, VoiceActivityDetector
+
+
+def pcm(value: int, samples: int = 1024) -> bytes:
+    """A chunk of constant 16-bit little-endian samples."""
+    return struct.pack(f'<{samples}h', *([value] * samples))
+
+
+def test_quiet_chunks_keep_their_true_level():
+    capture = AudioCapture(LiveConfig())
+    quiet = memoryview(pcm(100))  # Peak well under silence_threshold
+    assert capture.get_audio_level(quiet) > 0.0
+    assert capture.get_audio_level(quiet, gate_silence=True) == 0.0
+
+
+def test_vad_returns_utterance_after_silence():
+    config = LiveConfig(silence_duration=0.5)
+    vad = VoiceActivityDetector(config)
+    capture = AudioCapture(config)
+    loud, silent = pcm(8000), pcm(0)
+
+    now = 0.0
+    for _ in range(10):
+        assert vad.process_chunk(memoryview(loud), capture.get_audio_level(loud), now) is None
+        now += 0.064
+    assert vad.is_speaking
+
+    utterance = None
+    while utterance is None and now < 5.0:
+        utterance = vad.process_chunk(memoryview(silent), 0.0, now)
+        now += 0.064
+    assert utterance is not None
+    assert utterance.startswith(loud)
+    assert not vad.is_speaking
+
+
+def test_ring_returns_chunks_in_order():
+    ring = AudioRing(4, 4)
+    for i in range(3):
+        assert ring.put(bytes([i]) * 4)
+    assert [bytes(ring.get()) for _ in range(3)] == [b'\0' * 4, b'\1' * 4, b'\2' * 4]
+
+
+def test_ring_splits_large_puts_and_reports_overflow():
+    ring = AudioRing(4, 2)
+    assert ring.put(b'abcdefgh')
+    assert not ring.put(b'ijkl')
+    assert bytes(ring.get()) == b'abcd'
+    assert bytes(ring.get()) == b'efgh'
+
+
+def test_ring_get_times_out_when_empty():
+    ring = AudioRing(4, 4)
+    start = time.monotonic()
+    assert ring.get(timeout=0.05) is None
+    assert time.monotonic() - start >= 0.05
+
+
+def test_ring_get_wakes_on_commit():
+    ring = AudioRing(4, 4)
+    threading.Timer(0.05, ring.put, args=(b'wake',)).start()
+    start = time.monotonic()
+    chunk = ring.get(timeout=2.0)
+    assert bytes(chunk) == b'wake'
+    assert time.monotonic() - start < 1.0
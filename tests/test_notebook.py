@@ -0,0 +1,79 @@
+"""
+Notebook tool tests - cell edits keep the .ipynb valid and in order.
+
+Notebooks are created in pytest's tmp_path; Jupyter isn't needed.
+"""
+
+import json
+
+import pytest
+
+from tools import notebook as nb
+
+
+@pytest.fixture
+def notebook(tmp_path):
+    path = tmp_path / "demo.ipynb"
+    success, message = nb.create_notebook(str(path), initial_cells=[
+        {'type': 'code', 'content': 'a = 1'},
+        {'type': 'markdown', 'content': '# Title'},
+        {'type': 'code', 'content': 'print(a)'},
+    ])
+    assert success, message
+    return path
+
+
+def sources(path):
+    cells = json.loads(path.read_text())['cells']
+    return [''.join(cell['source']) for cell in cells]
+
+
+def test_edit_cells_applies_all_edits(notebook):
+    success, _ = nb.edit_cells(str(notebook), [(0, 'a = 5'), (2, 'print(a * 2)')])
+    assert success
+    assert sources(notebook) == ['a = 5', '# Title', 'print(a * 2)']
+
+
+def test_edit_cells_bad_index_changes_nothing(notebook):
+    before = notebook.read_bytes()
+    success, _ = nb.edit_cells(str(notebook), [(0, 'a = 5'), (9, 'nope')])
+    assert not success
+    assert notebook.read_bytes() == before
+
+
+def test_edit_cell_rewrites_only_that_cell(notebook):
+    success, _ = nb.edit_cell(str(notebook), 0, 'a = "two\nlines"')
+    assert success
+    assert sources(notebook) == ['a = "two\nlines"', '# Title', 'print(a)']
+
+
+def test_edit_cell_can_change_type(notebook):
+    success, _ = nb.edit_cell(str(notebook), 1, 'b = 2', 'code')
+    assert success
+    cell = json.loads(notebook.read_text())['cells'][1]
+    assert cell['cell_type'] == 'code'
+    assert 'outputs' in cell
+
+
+def test_insert_move_delete(notebook):
+    assert nb.insert_cell(str(notebook), 1, 'inserted')[0]
+    assert sources(notebook) == ['a = 1', 'inserted', '# Title', 'print(a)']
+
+    # to_index is the position the cell lands in front of, so 4 is the end
+    assert nb.move_cell(str(notebook), 1, 4)[0]
+    assert sources(notebook) == ['a = 1', '# Title', 'print(a)', 'inserted']
+
+    assert nb.delete_notebook_cell(str(notebook), 3)[0]
+    assert sources(notebook) == ['a = 1', '# Title', 'print(a)']
+    assert [f.name for f in notebook.parent.iterdir()] == [notebook.name]
+
+
+def test_get_cell(notebook):
+    success, content = nb.get_cell(str(notebook), 2)
+    assert success
+    assert "print(a)" in content
+
+
+def test_get_cell_out_of_range(notebook):
+    success, _ = nb.get_cell(str(notebook), 7)
+    assert not success
@@ -0,0 +1,96 @@
+"""
+Playwright vision tests - can the lineage see JavaScript-rendered pages?
+
+One Chromium is launched for the whole session and shared by every test,
+instead of one per check as in the root test_*.py scripts. These tests
+need network access and a Playwright browser (`playwright install chromium`);
+they are skipped when Playwright isn't installed.
+"""
+
+import pytest
+
+sync_api = pytest.importorskip("playwright.sync_api")
+
+from tools.web import CHROMIUM_ARGS
+
+SHARE_URL = "https://gemini.google.com/share/279bc5291f81"
+REACT_URL = "https://reactjs.org"
+REAL_USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'
+)
+
+
+@pytest.fixture(scope="session")
+def browser():
+    with sync_api.sync_playwright() as p:
+        try:
+            b = p.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+        except Exception as e:
+            pytest.skip(f"Chromium unavailable: {e}")
+        yield b
+        b.close()
+
+
+@pytest.fixture
+def page(browser):
+    page = browser.new_page()
+    yield page
+    page.close()
+
+
+def wait_for_text(page):
+    """Wait (up to 10s) for the page's conversation text to render."""
+    try:
+        page.wait_for_function("document.body.innerText.length > 500", timeout=10000)
+    except sync_api.TimeoutError:
+        pass  # The assertions report what did render
+
+
+@pytest.mark.parametrize("strategy", ["load", "domcontentloaded", "networkidle"])
+def test_wait_strategy_loads_share_page(page, strategy):
+    page.goto(SHARE_URL, wait_until=strategy, timeout=15000)
+    assert page.content()
+
+
+def test_share_page_text_renders(page):
+    page.goto(SHARE_URL, wait_until="load", timeout=15000)
+    wait_for_text(page)
+    assert "qdrant" in page.inner_text("body").lower()
+
+
+def test_share_page_with_user_agent(browser):
+    context = browser.new_context(
+        user_agent=REAL_USER_AGENT,
+        viewport={'width': 1920, 'height': 1080},
+        locale='en-US'
+    )
+    try:
+        page = context.new_page()
+        page.add_init_script(
+            "Object.defineProperty(navigator, 'webdriver', {get: () => undefined});"
+        )
+        page.goto(SHARE_URL, wait_until="load", timeout=15000)
+        wait_for_text(page)
+        assert "qdrant" in page.inner_text("body").lower()
+    finally:
+        context.close()
+
+
+def test_react_site_renders(page):
+    page.goto(REACT_URL, wait_until="load", timeout=15000)
+    html = page.content()
+    assert "react" in html.lower()
+    assert len(html) > 10000
+
+
+def test_fetch_url_browser_sees_share_page(browser):
+    # fetch_url_browser runs its own browser; the fixture just skips this
+    # test where Chromium can't start
+    from tools.web import fetch_url_browser
+
+    success, html, text = fetch_url_browser(
+        SHARE_URL, wait_for="load", timeout=15000, with_text=True
+    )
+    assert success, html
+    assert "qdrant" in text.lower()
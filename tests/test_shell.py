@@ -0,0 +1,73 @@
+"""
+Shell tool tests - one-shot bash runs and direct exec of simple commands.
+"""
+
+import sys
+
+import pytest
+
+from tools import shell
+from tools.filesystem import change_generation
+
+pytestmark = pytest.mark.skipif(sys.platform == 'win32', reason="bash-specific behaviour")
+
+
+def test_direct_argv_for_simple_command():
+    argv = shell._direct_argv("echo 'hello world' x")
+    assert argv is not None
+    assert argv[0].endswith("echo")
+    assert argv[1:] == ["hello world", "x"]
+
+
+@pytest.mark.parametrize("cmd", [
+    "echo $HOME",
+    "ls | wc -l",
+    "cd /tmp",
+    "FOO=1 env",
+    "echo a; echo b",
+    "echo 'unterminated",
+    "definitely-not-a-program-xyz",
+])
+def test_direct_argv_defers_to_bash(cmd):
+    assert shell._direct_argv(cmd) is None
+
+
+def test_run_command_success(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    success, output = shell.run_command("pwd")
+    assert success
+    assert str(tmp_path) in output
+    assert "exit_code: 0" in output
+
+
+def test_run_command_uses_bash_features():
+    success, output = shell.run_command("echo $((6 * 7)) | tr 4 X")
+    assert success
+    assert "X2" in output
+
+
+def test_run_command_failure_keeps_output():
+    success, output = shell.run_command("echo oops >&2; exit 3")
+    assert not success
+    assert "oops" in output
+    assert "exit_code: 3" in output
+
+
+def test_run_command_is_independent_per_call(tmp_path):
+    # Nothing (cwd, variables) carries over from one call to the next
+    shell.run_command(f"cd {tmp_path}; export SHELL_TEST_VAR=1")
+    success, output = shell.run_command("echo ${SHELL_TEST_VAR:-unset} $PWD")
+    assert "unset" in output
+    assert str(tmp_path) not in output
+
+
+def test_run_command_timeout():
+    success, output = shell.run_command("sleep 5", timeout=1)
+    assert not success
+    assert "timed out" in output
+
+
+def test_run_command_bumps_change_generation():
+    before = change_generation()
+    shell.run_command("true")
+    assert change_generation() > before
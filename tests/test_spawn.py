@@ -0,0 +1,116 @@
+"""
+Spawn tool tests - parallel sub-instances against a stand-in gemini-account.sh.
+
+The fake script echoes its account and query back, so no Gemini CLI,
+credentials or network are needed.
+"""
+
+import sys
+
+import pytest
+
+from tools import _gemini_proc, spawn
+
+pytestmark = pytest.mark.skipif(sys.platform == 'win32', reason="fake script needs bash")
+
+FAKE_SCRIPT = """#!/bin/bash
+case "$2" in
+  *FAIL*) echo "quota exceeded" >&2; exit 1 ;;
+  *SLOW*) sleep 5 ;;
+  @*)
+    # Like Gemini CLI, only read @paths inside the working directory
+    ref="${2%%$'\\n'*}"; ref="${ref#@}"
+    case "$ref" in
+      /*|../*) echo "outside workspace: $ref" ;;
+      *) echo "read $(wc -c < "$ref") context bytes" ;;
+    esac ;;
+esac
+echo "account $1 answered: $2"
+"""
+
+
+@pytest.fixture
+def fake_gemini(tmp_path, monkeypatch):
+    script = tmp_path / "gemini-account.sh"
+    script.write_text(FAKE_SCRIPT)
+    monkeypatch.setattr(_gemini_proc, "GEMINI_SCRIPT", script)
+    monkeypatch.setattr(_gemini_proc, "GEMINI_SCRIPT_STR", str(script))
+    monkeypatch.setattr(_gemini_proc, "_SCRIPT_OK", True)
+    return script
+
+
+def test_missing_script_is_reported(tmp_path, monkeypatch):
+    missing = tmp_path / "absent.sh"
+    monkeypatch.setattr(_gemini_proc, "GEMINI_SCRIPT", missing)
+    monkeypatch.setattr(_gemini_proc, "_SCRIPT_OK", False)
+    success, message = spawn.call_gemini_sync("hi", 1)
+    assert not success
+    assert "not found" in message
+
+
+def test_call_gemini_sync(fake_gemini):
+    assert spawn.call_gemini_sync("hello", 2) == (True, "account 2 answered: hello")
+
+
+def test_call_gemini_sync_failure(fake_gemini):
+    success, message = spawn.call_gemini_sync("please FAIL", 1)
+    assert not success
+    assert "quota exceeded" in message
+
+
+def test_call_gemini_sync_timeout(fake_gemini):
+    success, message = spawn.call_gemini_sync("SLOW", 1, timeout=1)
+    assert not success
+    assert "Timeout" in message
+
+
+def test_spawn_research_reports_errors(fake_gemini):
+    success, output = spawn.spawn_research(["fine", "FAIL here"])
+    assert success
+    assert "=== Errors ===" in output
+    assert "quota exceeded" in output
+
+
+def test_spawn_research_limits():
+    assert not spawn.spawn_research([])[0]
+    assert not spawn.spawn_research(["q"] * (spawn.MAX_QUERIES + 1))[0]
+
+
+def test_spawn_research_spreads_across_accounts(fake_gemini):
+    success, output = spawn.spawn_research(["alpha", "beta", "gamma", "delta"])
+    assert success
+    for query in ("alpha", "beta", "gamma", "delta"):
+        assert f"answered: {query}" in output
+    assert "account 1" in output and "account 2" in output
+
+
+def test_spawn_with_context_inlines_small_context(fake_gemini):
+    success, output = spawn.spawn_with_context("background", ["q1"])
+    assert success
+    assert "answered: background\n\nQuestion: q1" in output
+
+
+def test_spawn_with_context_file_stays_in_workspace(fake_gemini, tmp_path, monkeypatch):
+    workdir = tmp_path / "work"
+    workdir.mkdir()
+    monkeypatch.chdir(workdir)
+    context = "x" * (spawn.INLINE_CONTEXT_MAX + 1)
+    success, output = spawn.spawn_with_context(context, ["q1", "q2"])
+    assert success
+    assert output.count(f"read {len(context)} context bytes") == 2
+    assert "outside workspace" not in output
+    assert list(workdir.iterdir()) == []
+
+
+def test_quota_errors_count_as_rate_limited(fake_gemini):
+    success, message = spawn.call_gemini_sync("please FAIL", 1)
+    assert not success
+    assert spawn._is_rate_limited(message)
+    assert not spawn._is_rate_limited("Error (exit 2): file not found")
+
+
+def test_spawn_research_shares_duplicate_queries(fake_gemini):
+    success, output = spawn.spawn_research(["same", "same", "other"])
+    assert success
+    assert "1 duplicate(s) shared a result" in output
+    assert output.count("answered: same") == 2